@@ -0,0 +1,34 @@
+""" Measure validating a large list of bounded floats, element by element
+and with the array properties.
+
+Run with `python -m benchmarks.bench_array_property`.
+"""
+import random
+
+from custom_conf.properties.array_property import BACKENDS, FloatArrayProperty
+from custom_conf.properties.bounded_property import FloatBoundedProperty
+
+from benchmarks.utils import best_of, report
+
+
+SIZE = 1_000_000
+
+
+def main() -> None:
+    values = [random.random() for _ in range(SIZE)]
+    element = FloatBoundedProperty("weights", 0., 1.)
+
+    def parse_elements() -> None:
+        [element.parse(value) for value in values]
+
+    print(f"best time to validate {SIZE:,} floats")
+    report("FloatBoundedProperty.parse per element",
+           best_of(parse_elements, 1, 3))
+    for backend in BACKENDS:
+        prop = FloatArrayProperty("weights", 0., 1., backend)
+        report(f"FloatArrayProperty.parse ({backend})",
+               best_of(lambda: prop.parse(values), 1))
+
+
+if __name__ == "__main__":
+    main()
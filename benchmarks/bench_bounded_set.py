@@ -0,0 +1,49 @@
+""" Measure setting bounded properties, which have to be coerced,
+type-checked and range-checked.
+
+Run with `python -m benchmarks.bench_bounded_set`.
+"""
+from custom_conf.properties.bounded_property import (
+    FloatBoundedProperty, IntBoundedProperty,
+    )
+
+from benchmarks.utils import BenchConfig, best_of, report
+
+
+NUMBER = 1_000_000
+
+
+class BoundedConfig(BenchConfig):
+    def _initialize_config_properties(self) -> None:
+        self.int_prop = IntBoundedProperty("int_prop", 0, 100)
+        self.float_prop = FloatBoundedProperty("float_prop", 0., 1.)
+
+
+def main() -> None:
+    config = BoundedConfig()
+    int_prop = config.properties["int_prop"]
+    float_prop = config.properties["float_prop"]
+
+    def set_int() -> None:
+        config.int_prop = 50
+
+    def set_float() -> None:
+        config.float_prop = .5
+
+    def set_coerced() -> None:
+        config.float_prop = 1
+
+    print(f"best time per operation ({NUMBER:,} operations per run)")
+    report("config.int_prop = 50", best_of(set_int, NUMBER))
+    report("config.float_prop = .5", best_of(set_float, NUMBER))
+    report("config.float_prop = 1 (coerced)", best_of(set_coerced, NUMBER))
+    report("IntBoundedProperty.parse(50)",
+           best_of(lambda: int_prop.parse(50), NUMBER))
+    report("FloatBoundedProperty.parse(.5)",
+           best_of(lambda: float_prop.parse(.5), NUMBER))
+    report("IntBoundedProperty.check(500)",
+           best_of(lambda: int_prop.check(500), NUMBER))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+""" Compare validating invalid values with check() and with parse(), which
+raises an error for every invalid value.
+
+Run with `python -m benchmarks.bench_check`.
+"""
+import custom_conf.errors as err
+from custom_conf.properties.bounded_property import IntBoundedProperty
+from custom_conf.properties.coercible_property import IntProperty
+from custom_conf.properties.property import Property
+
+from benchmarks.utils import best_of, report
+
+
+NUMBER = 100_000
+
+CASES = [
+    (Property("str_prop", str), 1),
+    (IntProperty("int_prop"), 1.5),
+    (IntBoundedProperty("bounded_prop", 0, 10), 11),
+    ]
+
+
+def parse_and_catch(prop: Property, value) -> None:
+    try:
+        prop.parse(value)
+    except err.PropertyError:
+        pass
+
+
+def main() -> None:
+    for prop, value in CASES:
+        print(f"{prop.__class__.__name__} = {value!r}")
+        raising = best_of(lambda: parse_and_catch(prop, value), NUMBER)
+        checking = best_of(lambda: prop.check(value), NUMBER)
+        formatting = best_of(lambda: str(prop.check(value)), NUMBER)
+        report("  parse + except", raising)
+        report("  check", checking)
+        report("  check + message", formatting)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+""" Measure checking values of a choices property with many choices.
+
+Run with `python -m benchmarks.bench_choices`.
+"""
+from custom_conf.properties.choices_property import ChoicesProperty
+
+from benchmarks.utils import best_of, report
+
+
+NUMBER = 100_000
+CHOICES = [f"region-{i}" for i in range(5_000)]
+
+
+def main() -> None:
+    prop = ChoicesProperty("region", str, CHOICES)
+    last = CHOICES[-1]
+
+    print(f"best time per operation ({len(CHOICES):,} choices)")
+    report("ChoicesProperty(...)",
+           best_of(lambda: ChoicesProperty("region", str, CHOICES), 100))
+    report("check(first choice)",
+           best_of(lambda: prop.check(CHOICES[0]), NUMBER))
+    report("check(last choice)", best_of(lambda: prop.check(last), NUMBER))
+    report("str(check(invalid choice))",
+           best_of(lambda: str(prop.check("regoin-4999")), 1_000))
+
+
+if __name__ == "__main__":
+    main()
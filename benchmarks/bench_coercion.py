@@ -0,0 +1,50 @@
+""" Measure coercing large batches of strings, like the values of
+environment variables or command line arguments.
+
+Run with `python -m benchmarks.bench_coercion`.
+"""
+import random
+
+from custom_conf.properties.bounded_property import IntBoundedProperty
+from custom_conf.properties.coercible_property import (
+    ByteSizeProperty, DecimalProperty, FloatProperty, IntProperty,
+    TimedeltaProperty,
+    )
+
+from benchmarks.utils import best_of, report
+
+
+SIZE = 100_000
+
+
+def main() -> None:
+    numbers = [random.randrange(1_000_000) for _ in range(SIZE)]
+    batches = [
+        ("IntProperty", IntProperty("p"), [str(n) for n in numbers]),
+        ("IntProperty (float notation)", IntProperty("p"),
+         [f"{n}.0" for n in numbers]),
+        ("IntBoundedProperty", IntBoundedProperty("p", 0, 1_000_000),
+         [str(n) for n in numbers]),
+        ("FloatProperty", FloatProperty("p"),
+         [f"{n / 1000}" for n in numbers]),
+        ("DecimalProperty", DecimalProperty("p"),
+         [f"{n / 1000}" for n in numbers]),
+        ("TimedeltaProperty", TimedeltaProperty("p"),
+         [f"{n % 24}h {n % 60}m" for n in numbers]),
+        ("ByteSizeProperty", ByteSizeProperty("p"),
+         [f"{n % 1024}MiB" for n in numbers]),
+        ]
+
+    print(f"best time per value ({SIZE:,} strings per batch)")
+    for label, prop, values in batches:
+        parse = prop.parse
+
+        def coerce_batch() -> None:
+            for value in values:
+                parse(value)
+
+        report(label, best_of(coerce_batch, 1) / SIZE)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+""" Measure the read throughput of multiple threads, while another thread
+keeps reloading the config file, for the different config modes.
+
+Run with `python -m benchmarks.bench_concurrent_reads`.
+"""
+import os
+from threading import Event, Thread
+from time import perf_counter, sleep
+
+from custom_conf.properties.coercible_property import IntProperty
+
+from benchmarks.utils import BENCH_DIR, BenchConfig
+
+
+READERS = 4
+SECONDS = 1.
+
+
+class ReadConfig(BenchConfig):
+    def _initialize_config_properties(self) -> None:
+        self.a = IntProperty("a")
+        self.b = IntProperty("b")
+
+
+def _write(i: int) -> None:
+    path = BENCH_DIR / "default.yaml"
+    path.write_text(f"a: {i}\nb: {i}\n")
+    ns = (i + 1) * 1_000_000
+    os.utime(path, ns=(ns, ns))
+
+
+def _stress(config: ReadConfig, reload: bool) -> tuple[float, int, int]:
+    """ Return the reads per second, reloads and torn reads. """
+    done = Event()
+    reads = [0] * READERS
+    torn = [0] * READERS
+    reloads = 0
+
+    def read(index: int) -> None:
+        count = inconsistent = 0
+        while not done.is_set():
+            for _ in range(1_000):
+                state = config.state if config.thread_safe else None
+                if state is not None:
+                    inconsistent += state["a"] != state["b"]
+                else:
+                    inconsistent += config.a != config.b
+            count += 1_000
+        reads[index] = count
+        torn[index] = inconsistent
+
+    threads = [Thread(target=read, args=(i,)) for i in range(READERS)]
+    start = perf_counter()
+    for thread in threads:
+        thread.start()
+    while perf_counter() - start < SECONDS:
+        if reload:
+            reloads += 1
+            _write(reloads)
+            config.reload()
+        else:
+            sleep(0.01)
+    done.set()
+    for thread in threads:
+        thread.join()
+    seconds = perf_counter() - start
+    return sum(reads) / seconds, reloads, sum(torn)
+
+
+def main() -> None:
+    modes = {"default": {}, "thread_safe": {"thread_safe": True},
+             "frozen": {"frozen": True},
+             "thread_safe + frozen": {"thread_safe": True, "frozen": True}}
+    print(f"{READERS} reader threads, {SECONDS:.0f}s per run")
+    print(f"{'mode':<22} {'reloads':>8} {'reads/s':>12} {'torn':>6}")
+    for mode, kwargs in modes.items():
+        for reload in (False, True):
+            _write(0)
+            config = ReadConfig(load_default=True, **kwargs)
+            per_second, reloads, torn = _stress(config, reload)
+            print(f"{mode:<22} {reloads:>8} {per_second:>12,.0f} {torn:>6}")
+
+
+if __name__ == "__main__":
+    main()
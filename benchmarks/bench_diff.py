@@ -0,0 +1,39 @@
+""" Measure finding the changes of a config with many (large) values,
+compared to comparing the string representations of the config.
+
+Run with `python -m benchmarks.bench_diff`.
+"""
+from custom_conf.properties.property import Property
+
+from benchmarks.utils import BenchConfig, best_of, report
+
+
+PROPERTIES = 5_000
+LIST_SIZE = 1_000
+
+
+class LargeConfig(BenchConfig):
+    def _initialize_config_properties(self) -> None:
+        for i in range(PROPERTIES):
+            setattr(self, f"prop_{i}", Property(f"prop_{i}", list))
+
+
+def main() -> None:
+    config = LargeConfig()
+    config.update({f"prop_{i}": list(range(LIST_SIZE))
+                   for i in range(PROPERTIES)})
+    state = config.capture_state()
+    before = str(config)
+    config.prop_0 = [0]
+
+    print(f"best time per operation ({PROPERTIES:,} properties, "
+          f"lists of {LIST_SIZE:,} ints)")
+    report("str(config) != before", best_of(lambda: str(config) != before, 5))
+    report("capture_state()", best_of(config.capture_state, 20))
+    report("changes_since(state)",
+           best_of(lambda: config.changes_since(state), 20))
+    assert config.changes_since(state).names() == ["prop_0"]
+
+
+if __name__ == "__main__":
+    main()
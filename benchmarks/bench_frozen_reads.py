@@ -0,0 +1,38 @@
+""" Compare property reads through the instance descriptors with reads of
+a frozen config.
+
+Run with `python -m benchmarks.bench_frozen_reads`.
+"""
+from custom_conf.properties.property import Property
+
+from benchmarks.utils import BenchConfig, best_of, report
+
+
+NUMBER = 1_000_000
+
+
+class ReadConfig(BenchConfig):
+    def _initialize_config_properties(self) -> None:
+        self.value = Property("value", int)
+
+
+def main() -> None:
+    config = ReadConfig()
+    config.value = 1
+    descriptor = best_of(lambda: config.value, NUMBER)
+    config.freeze()
+    frozen = best_of(lambda: config.value, NUMBER)
+
+    class Plain:
+        value = 1
+    plain_obj = Plain()
+    plain = best_of(lambda: plain_obj.value, NUMBER)
+
+    report("descriptor read", descriptor)
+    report("frozen read", frozen)
+    report("plain attribute read", plain)
+    print(f"speedup: {descriptor / frozen:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
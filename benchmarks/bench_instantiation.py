@@ -0,0 +1,44 @@
+""" Measure creating many configs of the same class, with and without a
+compiled schema.
+
+Run with `python -m benchmarks.bench_instantiation`.
+"""
+from timeit import repeat
+
+from custom_conf.properties.bounded_property import IntBoundedProperty
+from custom_conf.properties.choices_property import ChoicesProperty
+from custom_conf.properties.coercible_property import FloatProperty
+from custom_conf.properties.property import Property
+
+from benchmarks.utils import BenchConfig, report
+
+
+CONFIGS = 10_000
+PROPERTIES = 20
+
+
+class ServiceConfig(BenchConfig):
+    def _initialize_config_properties(self) -> None:
+        for i in range(PROPERTIES // 4):
+            setattr(self, f"name_{i}", Property(f"name_{i}", str))
+            setattr(self, f"port_{i}",
+                    IntBoundedProperty(f"port_{i}", 1, 65535))
+            setattr(self, f"ratio_{i}", FloatProperty(f"ratio_{i}"))
+            setattr(self, f"level_{i}", ChoicesProperty(
+                f"level_{i}", str, ["debug", "info", "warning", "error"]))
+
+
+class CompiledServiceConfig(ServiceConfig):
+    compile_schema = True
+
+
+def main() -> None:
+    print(f"best time to create {CONFIGS:,} configs "
+          f"({PROPERTIES} properties each)")
+    for cls in (ServiceConfig, CompiledServiceConfig):
+        seconds = min(repeat(cls, number=CONFIGS, repeat=5))
+        report(f"{cls.__name__}()", seconds)
+
+
+if __name__ == "__main__":
+    main()
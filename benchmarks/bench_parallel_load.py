@@ -0,0 +1,54 @@
+""" Compare sequential and parallel loading of config directories.
+
+Run with `python -m benchmarks.bench_parallel_load`.
+"""
+from pathlib import Path
+from tempfile import mkdtemp
+
+from custom_conf import reader
+from custom_conf.properties.property import Property
+
+from benchmarks.utils import BENCH_DIR, BenchConfig, best_of, report
+
+
+PROPERTIES = 20
+FRAGMENTS = [10, 100, 1000]
+MODES = [(1, False), (4, False), (8, False), (4, True), (8, True)]
+
+
+class FragmentConfig(BenchConfig):
+    def _initialize_config_properties(self) -> None:
+        for i in range(PROPERTIES):
+            name = f"prop_{i}"
+            setattr(self, name, Property(name, list[int]))
+
+
+def write_fragments(count: int) -> Path:
+    directory = Path(mkdtemp(dir=BENCH_DIR))
+    for i in range(count):
+        lines = [f"prop_{j}: [{', '.join(map(str, range(i, i + 20)))}]"
+                 for j in range(PROPERTIES)]
+        directory.joinpath(f"fragment_{i:04}.yaml").write_text(
+            "\n".join(lines), encoding="utf-8")
+    return directory
+
+
+def main() -> None:
+    reader.set_cache_size(0)
+    config = FragmentConfig()
+    for count in FRAGMENTS:
+        directory = write_fragments(count)
+        print(f"{count} fragments")
+        sequential = None
+        for workers, processes in MODES:
+            seconds = best_of(
+                lambda: config.load_configs(directory, workers, processes),
+                number=1, repeat=3)
+            sequential = sequential or seconds
+            kind = "processes" if processes else "threads"
+            report(f"  {workers} {kind} ({sequential / seconds:.1f}x)",
+                   seconds)
+
+
+if __name__ == "__main__":
+    main()
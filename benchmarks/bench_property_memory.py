@@ -0,0 +1,47 @@
+""" Measure the memory footprint of a property, using tracemalloc.
+
+Run with `python -m benchmarks.bench_property_memory`.
+"""
+import tracemalloc
+from typing import Callable
+
+from custom_conf.properties.bounded_property import (
+    FloatBoundedProperty, IntBoundedProperty,
+    )
+from custom_conf.properties.choices_property import ChoicesProperty
+from custom_conf.properties.coercible_property import IntProperty
+from custom_conf.properties.property import Property
+
+
+COUNT = 10_000
+
+FACTORIES: dict[str, Callable[[str], Property]] = {
+    "Property(str)": lambda name: Property(name, str),
+    "IntProperty": IntProperty,
+    "ChoicesProperty": lambda name: ChoicesProperty(name, str, ["a", "b"]),
+    "IntBoundedProperty": lambda name: IntBoundedProperty(name, 0, 100),
+    "FloatBoundedProperty": lambda name: FloatBoundedProperty(name, 0., 1.),
+}
+
+
+def footprint(factory: Callable[[str], Property]) -> float:
+    """ Return the bytes allocated per property. """
+    names = [f"prop_{i}" for i in range(COUNT)]
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    properties = [factory(name) for name in names]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # The list itself is not part of the footprint.
+    list_size = properties.__sizeof__()
+    return (after - before - list_size) / COUNT
+
+
+def main() -> None:
+    print(f"{'property':<40} {'bytes':>10}")
+    for label, factory in FACTORIES.items():
+        print(f"{label:<40} {footprint(factory):>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
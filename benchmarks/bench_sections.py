@@ -0,0 +1,53 @@
+""" Measure loading a config with many sections, of which one is used.
+
+Run with `python -m benchmarks.bench_sections`.
+"""
+from custom_conf.properties.coercible_property import IntProperty
+from custom_conf.properties.property import Property
+from custom_conf.properties.section_property import Section, SectionProperty
+
+from benchmarks.utils import best_of, report
+
+
+SERVICES = 200
+VALUES = {"host": "localhost", "port": "8080", "retries": 3,
+          "timeout": "2.5", "user": "admin"}
+
+
+class ServiceSection(Section):
+    def _initialize_config_properties(self) -> None:
+        self.host = Property("host", str)
+        self.port = IntProperty("port")
+        self.retries = IntProperty("retries")
+        self.timeout = Property("timeout", str)
+        self.user = Property("user", str)
+
+
+def services() -> dict[str, Section]:
+    prop = SectionProperty("service", ServiceSection)
+    return {f"service-{i}": prop.parse(dict(VALUES))
+            for i in range(SERVICES)}
+
+
+def lazy() -> int:
+    return services()["service-0"].port
+
+
+def eager() -> int:
+    sections = services()
+    for section in sections.values():
+        _ = section.port
+    return sections["service-0"].port
+
+
+def main() -> None:
+    print(f"best time per operation ({SERVICES} sections)")
+    report("use one section (lazy)", best_of(lazy, 100))
+    report("use all sections (eager)", best_of(eager, 100))
+    report("missing_properties() of all sections",
+           best_of(lambda: [section.missing_properties()
+                            for section in services().values()], 100))
+
+
+if __name__ == "__main__":
+    main()
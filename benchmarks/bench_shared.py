@@ -0,0 +1,95 @@
+""" Compare loading a config in a worker process from yaml files with
+attaching to the values published by the parent via shared memory.
+
+Measures the time to load the config and the memory each worker uses for
+it. Attaching is faster, but each worker still unpickles its own copy of
+the values, so the memory per worker stays about the same.
+
+Run with `python -m benchmarks.bench_shared`.
+"""
+import multiprocessing
+import tracemalloc
+from pathlib import Path
+
+from custom_conf import reader
+from custom_conf.properties.bounded_property import IntBoundedProperty
+from custom_conf.properties.property import Property
+
+from benchmarks import utils
+from benchmarks.utils import BENCH_DIR, BenchConfig, best_of, report
+
+
+PROPERTIES = 1_000
+WORKERS = 4
+
+
+class WorkerConfig(BenchConfig):
+    def _initialize_config_properties(self) -> None:
+        for i in range(PROPERTIES):
+            name = f"prop_{i}"
+            prop = (IntBoundedProperty(name, 0, PROPERTIES) if i % 2
+                    else Property(name, list[str]))
+            setattr(self, name, prop)
+
+
+def worker_memory(args: tuple[str, str, str]) -> tuple[int, int]:
+    """ Load the config in this worker and return the memory it retains
+    and the peak memory while loading it, in bytes. """
+    mode, name, directory = args
+    # The (spawned) worker has its own temporary directory otherwise.
+    utils.BENCH_DIR = Path(directory)
+    reader.set_cache_size(0)
+    tracemalloc.start()
+    config = WorkerConfig(load_default=mode == "parse")
+    if mode == "attach":
+        config.attach_shared(name)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    config.close_shared()
+    return retained, peak
+
+
+def report_memory(label: str, name: str, mode: str) -> None:
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(WORKERS) as pool:
+        results = pool.map(worker_memory,
+                           [(mode, name, str(BENCH_DIR))] * WORKERS)
+    retained = sum(result[0] for result in results)
+    peak = max(result[1] for result in results)
+    print(f"{label:<40} {retained / WORKERS / 1024:>10.0f} KiB "
+          f"(peak {peak / 1024:.0f} KiB, {WORKERS} workers: "
+          f"{retained / 1024:.0f} KiB)")
+
+
+def main() -> None:
+    reader.set_cache_size(0)
+    lines = [f"prop_{i}: {i}" if i % 2 else f"prop_{i}: [a, b, c]"
+             for i in range(PROPERTIES)]
+    BENCH_DIR.joinpath("default.yaml").write_text("\n".join(lines))
+
+    parent = WorkerConfig(load_default=True)
+    name = parent.publish_shared()
+
+    def attach() -> None:
+        config = WorkerConfig()
+        config.attach_shared(name)
+        config.close_shared()
+
+    try:
+        loading = best_of(lambda: WorkerConfig(load_default=True), number=5)
+        attaching = best_of(attach, number=5)
+        report(f"parse + validate ({PROPERTIES} properties)", loading)
+        report(f"attach shared ({PROPERTIES} properties)", attaching)
+        print(f"speedup: {loading / attaching:.1f}x")
+
+        print(f"\nmemory per worker ({PROPERTIES} properties)")
+        report_memory("parse + validate", name, "parse")
+        report_memory("attach shared", name, "attach")
+        print(f"{'shared block (once)':<40} "
+              f"{parent._shared.capacity / 1024:>10.0f} KiB")
+    finally:
+        parent.close_shared()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+""" Compare creating a config from yaml files with loading its snapshot.
+
+Run with `python -m benchmarks.bench_snapshot`.
+"""
+from custom_conf import reader
+from custom_conf.properties.bounded_property import IntBoundedProperty
+from custom_conf.properties.property import Property
+
+from benchmarks.utils import BENCH_DIR, BenchConfig, best_of, report
+
+
+PROPERTIES = 1_000
+
+
+class StartupConfig(BenchConfig):
+    def _initialize_config_properties(self) -> None:
+        for i in range(PROPERTIES):
+            name = f"prop_{i}"
+            prop = (IntBoundedProperty(name, 0, PROPERTIES) if i % 2
+                    else Property(name, list[str]))
+            setattr(self, name, prop)
+
+
+def main() -> None:
+    reader.set_cache_size(0)
+    lines = [f"prop_{i}: {i}" if i % 2 else f"prop_{i}: [a, b, c]"
+             for i in range(PROPERTIES)]
+    BENCH_DIR.joinpath("default.yaml").write_text("\n".join(lines))
+
+    def create(snapshot: bool) -> StartupConfig:
+        return StartupConfig(load_default=True, load_all=True,
+                             snapshot=snapshot)
+
+    create(True)
+    parsing = best_of(lambda: create(False), number=5)
+    loading = best_of(lambda: create(True), number=5)
+    report(f"parse + validate ({PROPERTIES} properties)", parsing)
+    report(f"snapshot ({PROPERTIES} properties)", loading)
+    print(f"speedup: {parsing / loading:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
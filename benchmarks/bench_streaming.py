@@ -0,0 +1,69 @@
+""" Compare loading a large config file at once with streaming it: total
+time, peak memory and the time until the first invalid value is found.
+
+Run with `python -m benchmarks.bench_streaming`.
+"""
+import logging
+import tracemalloc
+from time import perf_counter
+
+from custom_conf import reader
+from custom_conf.properties.property import Property
+
+from benchmarks.utils import BENCH_DIR, BenchConfig, report
+
+
+PROPERTIES = 200
+TABLE_SIZE = 1_000
+
+
+class TableConfig(BenchConfig):
+    exit_on_error = False
+
+    def _initialize_config_properties(self) -> None:
+        for i in range(PROPERTIES):
+            setattr(self, f"table_{i}", Property(f"table_{i}", list[int]))
+
+
+def _measure(func) -> tuple[float, int]:
+    """ Return the time and the peak memory (traced in a second run). """
+    start = perf_counter()
+    func()
+    seconds = perf_counter() - start
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def main() -> None:
+    logging.disable(logging.ERROR)
+    reader.set_cache_size(0)
+    table = "[" + ", ".join(map(str, range(TABLE_SIZE))) + "]"
+    lines = [f"table_{i}: {table}" for i in range(PROPERTIES)]
+    path = BENCH_DIR / "tables.yaml"
+    path.write_text("\n".join(lines))
+    size = path.stat().st_size / 1e6
+    print(f"{PROPERTIES} properties with {TABLE_SIZE} items ({size:.1f} MB)")
+
+    for label, load in [
+            ("load_config", lambda: TableConfig().load_config(path)),
+            ("stream_config", lambda: TableConfig().stream_config(path))]:
+        seconds, peak = _measure(load)
+        report(label, seconds)
+        print(f"{'  peak memory':<40} {peak / 1e6:>10.1f} MB")
+
+    # The first value is invalid.
+    path.write_text("\n".join(["table_0: invalid"] + lines[1:]))
+    config = TableConfig()
+    start = perf_counter()
+    config.load_config(path)
+    report("first error: load_config", perf_counter() - start)
+    start = perf_counter()
+    config.stream_config(path, fail_fast=True)
+    report("first error: stream_config(fail_fast)", perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
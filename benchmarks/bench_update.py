@@ -0,0 +1,38 @@
+""" Compare setting properties one by one with BaseConfig.update.
+
+Run with `python -m benchmarks.bench_update`.
+"""
+from custom_conf.properties.coercible_property import IntProperty
+from custom_conf.properties.property import Property
+
+from benchmarks.utils import BenchConfig, best_of, report
+
+
+PROPERTIES = 1_000
+
+
+class ManyPropertiesConfig(BenchConfig):
+    def _initialize_config_properties(self) -> None:
+        for i in range(PROPERTIES):
+            name = f"prop_{i}"
+            prop = Property(name, str) if i % 2 else IntProperty(name)
+            setattr(self, name, prop)
+
+
+def main() -> None:
+    config = ManyPropertiesConfig()
+    data = {f"prop_{i}": str(i) for i in range(PROPERTIES)}
+
+    def set_each() -> None:
+        for name, value in data.items():
+            setattr(config, name, value)
+
+    each = best_of(set_each, number=10)
+    update = best_of(lambda: config.update(data), number=10)
+    report(f"setattr ({PROPERTIES} keys)", each)
+    report(f"update ({PROPERTIES} keys)", update)
+    print(f"speedup: {each / update:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+""" Compare the compiled type validators with typeguard.check_type.
+
+Run with `python -m benchmarks.bench_validators`.
+"""
+from typing import Any, Optional
+
+from typeguard import check_type, TypeCheckError
+
+from custom_conf.properties.validators import compile_type_validator
+
+from benchmarks.utils import best_of, report
+
+
+NUMBER = 100_000
+
+CASES = [
+    (int, 1),
+    (str, "value"),
+    (float, 1),
+    (list[int], list(range(100))),
+    (dict[str, int], {str(i): i for i in range(100)}),
+    (Optional[int], None),
+    (dict[str, list[Optional[float]]], {"a": [1.0, None]}),
+    (tuple[int, ...], (1, 2, 3)),
+    ]
+
+
+def typeguard_validator(annotation: Any):
+    def validator(value: Any) -> bool:
+        try:
+            check_type(value, annotation)
+        except TypeCheckError:
+            return False
+        return True
+    return validator
+
+
+def main() -> None:
+    for annotation, value in CASES:
+        compiled = compile_type_validator(annotation)
+        fallback = typeguard_validator(annotation)
+        assert compiled(value) == fallback(value)
+        typeguard_time = best_of(lambda: fallback(value), NUMBER)
+        compiled_time = best_of(lambda: compiled(value), NUMBER)
+        print(annotation)
+        report("  typeguard", typeguard_time)
+        report("  compiled", compiled_time)
+        print(f"  speedup: {typeguard_time / compiled_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
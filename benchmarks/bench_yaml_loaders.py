@@ -0,0 +1,45 @@
+""" Compare the available yaml loader backends of read_yaml.
+
+Run with `python -m benchmarks.bench_yaml_loaders`.
+"""
+from pathlib import Path
+
+from custom_conf import reader
+
+from benchmarks.utils import BENCH_DIR, best_of, report
+
+
+SIZES = {"small": 10, "medium": 1_000, "large": 20_000}
+
+
+def write_config(name: str, keys: int) -> Path:
+    lines = []
+    for i in range(keys):
+        lines.append(f"key_{i}:")
+        lines.append(f"  name: 'value {i}'")
+        lines.append(f"  values: [{i}, {i + 0.5}, true, null]")
+    path = BENCH_DIR / f"{name}.yaml"
+    path.write_text("\n".join(lines), encoding="utf-8")
+    return path
+
+
+def main() -> None:
+    reader.set_cache_size(0)
+    loaders = reader.available_loaders()
+    if "c" not in loaders:
+        print("PyYAML was built without libyaml; only 'python' is available.")
+    for name, keys in SIZES.items():
+        path = write_config(name, keys)
+        number = max(1, 1_000 // keys)
+        times = {loader: best_of(lambda: reader.read_yaml(path, loader),
+                                 number, repeat=3)
+                 for loader in loaders}
+        print(f"{name} ({keys} keys, {path.stat().st_size} bytes)")
+        for loader, seconds in times.items():
+            report(f"  {loader}", seconds)
+        if "c" in times:
+            print(f"  speedup: {times['python'] / times['c']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+from pathlib import Path
+from tempfile import mkdtemp
+from typing import Any, Callable
+
+from custom_conf.config import BaseConfig
+
+
+BENCH_DIR = Path(mkdtemp(prefix="custom_conf_bench_"))
+
+
+class BenchConfig(BaseConfig):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(program_name="custom_conf_bench", **kwargs)
+
+    @property
+    def config_dir(self) -> Path:
+        return BENCH_DIR
+
+    @property
+    def default_config_path(self) -> Path:
+        return self.config_dir / "default.yaml"
+
+    @property
+    def source_dir(self) -> Path:
+        return Path(__file__).parents[1] / "src/custom_conf"
+
+    def _initialize_config_properties(self) -> None:
+        pass
+
+
+def best_of(func: Callable[[], Any], number: int, repeat: int = 5) -> float:
+    """ Return the best time per call in seconds. """
+    from timeit import repeat as timeit_repeat
+    return min(timeit_repeat(func, number=number, repeat=repeat)) / number
+
+
+def report(label: str, seconds: float) -> None:
+    for unit, factor in [("ns", 1e9), ("us", 1e6), ("ms", 1e3)]:
+        if seconds * factor < 10_000:
+            break
+    else:
+        unit, factor = "s", 1
+    print(f"{label:<40} {seconds * factor:>10.1f} {unit}")
@@ -1,14 +1,34 @@
+import asyncio
 import logging
 import os
 import platform
 from abc import abstractmethod, ABC
 from argparse import Namespace
+from contextlib import AbstractContextManager, nullcontext
+from functools import wraps
 from pathlib import Path
-from typing import Any
+from threading import RLock
+from time import perf_counter
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, NamedTuple, TYPE_CHECKING
 
 import custom_conf.errors as err
+from custom_conf import diff as diffs
+from custom_conf.instrumentation import Instrumentation
 from custom_conf.properties.property import Property
-from custom_conf.reader import read_yaml
+from custom_conf.reader import (
+    key_lines, read_yaml, read_yamls, stream_yaml,
+    )
+from custom_conf.registry import PropertyRegistry
+from custom_conf.report import LoadReport
+from custom_conf import schema as schemas
+from custom_conf import snapshot as snapshots
+import custom_conf.sources as src
+from custom_conf.sources import Source
+
+if TYPE_CHECKING:
+    from custom_conf.shared import SharedConfigBlock
+    from custom_conf.watcher import ConfigWatcher
 
 logger = logging.getLogger(__name__)
 
@@ -44,21 +64,236 @@ def list_configs(directory: Path) -> list[Path]:
     return list(directory.glob("*.yaml")) + list(directory.glob("*.yml"))
 
 
+ReloadListener = Callable[["BaseConfig", list[str]], None]
+
+_MISSING = object()
+# Number of values stream_config validates, before applying them at once.
+STREAM_COMMIT_SIZE = 1_000
+_FROZEN_CLASSES: dict[type, type] = {}
+_THREAD_SAFE_CLASSES: dict[type, type] = {}
+
+
+class _LoadedFile(NamedTuple):
+    """ A config file as it was last applied to the config. """
+    state: tuple[int, int]
+    data: dict[str, Any]
+
+
+class _ReadFile(NamedTuple):
+    """ A config file as it was read from disk. """
+    state: tuple[int, int]
+    # The parsed data or the error, if the file could not be parsed.
+    data: dict[str, Any] | err.ConfigReaderError | None
+    seconds: float
+
+
+def _file_state(path: Path) -> tuple[int, int]:
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _read_file(path: Path, catch: bool = False) -> _ReadFile | None:
+    """ Read and parse the config file. Return None, if it is no file.
+
+    :param catch: Whether to return a ConfigReaderError as the data,
+        instead of raising it.
+    """
+    if not path.is_file():
+        return None
+    state = _file_state(path)
+    start = perf_counter()
+    try:
+        data = read_yaml(path)[0]
+    except err.ConfigReaderError as error:
+        if not catch:
+            raise
+        data = error
+    return _ReadFile(state, data, perf_counter() - start)
+
+
+def _frozen_setattr(self, name: str, value: Any) -> None:
+    if name in self.properties or isinstance(value, Property):
+        raise err.FrozenConfigError(name=name)
+    object.__setattr__(self, name, value)
+
+
+def _frozen_getattr(self, name: str) -> Any:
+    # Only called for attributes, that are not set, e.g. unset properties.
+    prop = object.__getattribute__(self, "properties").get(name)
+    if prop is None:
+        raise AttributeError(f"'{type(self).__name__}' object has no "
+                             f"attribute '{name}'")
+    return prop.__get__(self, type(self))
+
+
+def _thread_safe_getattribute(self, name: str) -> Any:
+    # Property values are read from the current state, without a lock.
+    value = object.__getattribute__(self, "_state").get(name, _MISSING)
+    if value is _MISSING:
+        return InstanceDescriptorMixin.__getattribute__(self, name)
+    return value
+
+
+def _thread_safe_setattr(self, name: str, value: Any) -> None:
+    prop = self.properties.get(name) if self.initialized else None
+    if prop is None or isinstance(value, Property):
+        return BaseConfig.__setattr__(self, name, value)
+    self._commit({name: prop.parse(value)})
+
+
+def _get_variant_class(cls: type, cache: dict[type, type],
+                       **attributes: Any) -> type:
+    """ Return the (cached) subclass of cls with the given attributes. """
+    try:
+        return cache[cls]
+    except KeyError:
+        pass
+    namespace = {"__module__": cls.__module__,
+                 "__qualname__": cls.__qualname__,
+                 # The class the variant was created for, e.g. for pickling.
+                 "_variant_base": cls,
+                 **attributes}
+    variant = type(cls)(cls.__name__, (cls,), namespace)
+    cache[cls] = variant
+    return variant
+
+
+def _get_frozen_class(cls: type) -> type:
+    """ Return the (cached) frozen variant of the given config class.
+
+    The frozen variant uses the default attribute lookup, i.e. it does not
+    check every attribute for the descriptor protocol. """
+    return _get_variant_class(cls, _FROZEN_CLASSES,
+                              __getattribute__=object.__getattribute__,
+                              __setattr__=_frozen_setattr,
+                              __getattr__=_frozen_getattr,
+                              _frozen_base=cls)
+
+
+def _get_thread_safe_class(cls: type) -> type:
+    """ Return the (cached) thread-safe variant of the given config class.
+
+    The thread-safe variant stores the property values in an immutable
+    state, which is replaced as a whole by every write. """
+    return _get_variant_class(cls, _THREAD_SAFE_CLASSES,
+                              __getattribute__=_thread_safe_getattribute,
+                              __setattr__=_thread_safe_setattr,
+                              thread_safe=True)
+
+
+def _base_class(cls: type) -> type:
+    """ Return the config class, the (possibly nested) variant class was
+    created for, or the class itself, if it is no variant. """
+    while (base := cls.__dict__.get("_variant_base")) is not None:
+        cls = base
+    return cls
+
+
+def _restore_config(cls: type, thread_safe: bool, frozen: bool
+                    ) -> "BaseConfig":
+    """ Create an empty config of the class (or its variant), whose state
+    is restored by __setstate__ afterwards. Used to unpickle configs. """
+    if thread_safe:
+        cls = _get_thread_safe_class(cls)
+    if frozen:
+        cls = _get_frozen_class(cls)
+    config = object.__new__(cls)
+    # Like in __init__, as the attribute lookup of the variants needs them.
+    object.__setattr__(config, "_write_lock", RLock())
+    object.__setattr__(config, "_state", MappingProxyType({}))
+    return config
+
+
+def _serialized(method: Callable) -> Callable:
+    """ Run the method while holding the write lock of the config. """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._write_lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
 class BaseConfig(InstanceDescriptorMixin, ABC):
-    """ Basic config without any properties. """
-    def __init__(self, program_name: str, load_default=False, load_all=False) -> None:
-        self.program_name = program_name
-        self._initialized = False
-        self._config_dir = None
-        self._create_config_dir()
-        self.properties = []
+    """ Basic config without any properties.
+
+    Writes to a config (e.g. loading files, reloading or update) are
+    serialized by a lock. Reads never take a lock. If the config is
+    thread_safe, all values are stored in an immutable state, which each
+    write replaces at once. A reader thus either sees all or none of the
+    values of a write. Use the state property, to read multiple values
+    consistently.
+    """
+    _frozen_base: type | None = None
+    # Whether the values are stored in an immutable state. Set using the
+    # thread_safe parameter of __init__.
+    thread_safe: bool = False
+    # Number of files read in parallel by load_configs, by default.
+    load_workers: int = 1
+    # Whether invalid config files exit the program. If False, the loaders
+    # log the issues and return them as a LoadReport instead.
+    exit_on_error: bool = True
+    # The prefix of the environment variables (PREFIX__NAME), which override
+    # the properties. Defaults to the program name in upper case.
+    env_prefix: str | None = None
+    # Whether the properties are created once per class and shared by its
+    # instances (see custom_conf.schema), instead of once per instance.
+    compile_schema: bool = False
+
+    _loaded_files: dict[Path, _LoadedFile]
+    _reload_listeners: list[ReloadListener]
+    _shared: "SharedConfigBlock | None"
+    # The source of each property and the value it set the property to.
+    _sources: dict[str, tuple[Source, Any]]
+    # The override layer (see src.OVERRIDE_LAYERS) of each property, which
+    # was set by one.
+    _overrides: dict[str, str]
+    _env_index: Mapping[str, str] | None
+    # The issues found while loading the configs in __init__.
+    load_report: LoadReport
+
+    def __init__(self, program_name: str, load_default=False, load_all=False,
+                 frozen=False,
+                 instrumentation: Instrumentation | None = None,
+                 snapshot=False, thread_safe=False, load_env=False) -> None:
+        object.__setattr__(self, "_write_lock", RLock())
+        object.__setattr__(self, "_state", MappingProxyType({}))
+        if thread_safe:
+            object.__setattr__(self, "__class__",
+                               _get_thread_safe_class(type(self)))
+        # None of these is a property, so skip the attribute hooks.
+        self.__dict__.update(
+            _instrumentation=instrumentation,
+            program_name=program_name,
+            _initialized=False,
+            _config_dir=None,
+            _loaded_files={},
+            _reload_listeners=[],
+            _shared=None,
+            _shared_generation=0,
+            _sources={},
+            _overrides={},
+            _env_index=None,
+            load_report=LoadReport())
+        with self._span("create_config_dir"):
+            self._create_config_dir()
         self.initialize_config_properties()
-        # Always load default config first, before loading any custom config
-        # or program parameters.
-        if load_default:
-            self.load_default_config()
-        if load_all:
-            self.load_configs(self.config_dir)
+        sources = (self._snapshot_sources(load_default, load_all)
+                   if snapshot else [])
+        if not (snapshot and self.load_snapshot(sources)):
+            # Always load default config first, before loading any custom
+            # config or program parameters.
+            if load_default:
+                self.load_default_config(self.load_report)
+            if load_all:
+                self.load_configs(self.config_dir, report=self.load_report)
+            # Invalid or incomplete configs are loaded again (and their
+            # issues reported) on every start, until they are fixed.
+            if snapshot and sources and self.load_report.ok:
+                self.save_snapshot(sources)
+        if load_env:
+            self.load_env(report=self.load_report)
+        if frozen:
+            self.freeze()
 
     @property
     def initialized(self) -> bool:
@@ -67,15 +302,96 @@ class BaseConfig(InstanceDescriptorMixin, ABC):
         except AttributeError:
             return False
 
+    @property
+    def instrumentation(self) -> Instrumentation | None:
+        """ The instrumentation passed to the config, if any. """
+        return self._instrumentation
+
+    def stats(self) -> dict[str, Any]:
+        """ Return the timings recorded by the instrumentation.
+
+        Returns an empty dict, if the config is not instrumented.
+        """
+        if self._instrumentation is None:
+            return {}
+        return self._instrumentation.stats()
+
+    def _span(self, name: str) -> AbstractContextManager:
+        if self._instrumentation is None:
+            return nullcontext()
+        return self._instrumentation.span(name)
+
+    @property
+    def frozen(self) -> bool:
+        return self._frozen_base is not None
+
+    def freeze(self) -> None:
+        """ Replace the property descriptors with their current values.
+
+        Afterwards, reading a property is a plain attribute lookup. Writing
+        to a property raises an error, until the config is unfrozen again.
+        Reloading the config files still updates the values.
+        """
+        if self.frozen:
+            return
+        with self._write_lock:
+            values = self._values()
+            # Unset properties are looked up by _frozen_getattr instead.
+            for name in self.properties:
+                if name not in values:
+                    self.__dict__.pop(name, None)
+            self.__dict__.update(values)
+            object.__setattr__(self, "__class__",
+                               _get_frozen_class(type(self)))
+
+    def unfreeze(self) -> None:
+        """ Restore the property descriptors of a frozen config. """
+        if not self.frozen:
+            return
+        with self._write_lock:
+            object.__setattr__(self, "__class__", self._frozen_base)
+            self.__dict__.update(self.properties.items())
+
+    @property
+    def state(self) -> Mapping[str, Any]:
+        """ A read-only mapping of the names of the set properties to their
+        values. It does not change, when the config is changed later on. """
+        if self.thread_safe:
+            return self._state
+        with self._write_lock:
+            return MappingProxyType(self._values())
+
     def __setattr__(self, name: str, value: Any) -> None:
         # Disallow adding new (unknown) properties after initialization.
-        if self.initialized and isinstance(value, Property):
+        if isinstance(value, Property) and self.initialized:
             try:
                 object.__getattribute__(self, name)
             except AttributeError:
                 raise err.AddAfterInitError(name=name)
         super().__setattr__(name, value)
 
+    def __reduce__(self) -> tuple:
+        # Variant classes are created at runtime and can not be pickled by
+        # reference, so the base class and the variant flags are pickled.
+        return (_restore_config,
+                (_base_class(type(self)), self.thread_safe, self.frozen),
+                self.__getstate__())
+
+    def __getstate__(self) -> dict[str, Any]:
+        with self._write_lock:
+            state = dict(self.__dict__)
+        # Locks, views and shared memory blocks can not be pickled.
+        del state["_write_lock"]
+        state["_state"] = dict(state["_state"])
+        state["_env_index"] = None
+        state["_shared"] = None
+        state["_shared_generation"] = 0
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        state["_state"] = MappingProxyType(state["_state"])
+        self.__dict__.update(state)
+
     def _register_properties(self) -> None:
         for var in vars(self):
             prop = object.__getattribute__(self, var)
@@ -90,40 +406,103 @@ class BaseConfig(InstanceDescriptorMixin, ABC):
         pass
 
     def initialize_config_properties(self) -> None:
-        self._initialize_config_properties()
-        self._register_properties()
+        schema = (schemas.get_schema(type(self)) if self.compile_schema
+                  else None)
+        if schema is not None:
+            schema.apply(self)
+            self._initialized = True
+            return
+        self.properties = PropertyRegistry()
+        attributes = set(vars(self))
+        with self._span("initialize_config_properties"):
+            self._initialize_config_properties()
+        with self._span("register_properties"):
+            self._register_properties()
+        if self.compile_schema:
+            schemas.compile_schema(self, {
+                name: value for name, value in vars(self).items()
+                if name not in attributes})
         self._initialized = True
 
-    def load_default_config(self) -> None:
+    def load_default_config(self, report: LoadReport | None = None
+                            ) -> LoadReport:
         """ Loads the default configuration.
 
-        Should be called before loading any other configuration. """
-        if not self.load_config(self.default_config_path):
+        Should be called before loading any other configuration.
+
+        :param report: The report to add the issues to. A new one, if None.
+        :return: The report.
+        """
+        report = LoadReport() if report is None else report
+        issues = len(report)
+        with self._span("load_default_config"):
+            self._load_file(self.default_config_path, report)
+        if len(report) > issues:
+            self._handle_invalid(report)
+        return report
+
+    def load_configs(self, path: Path, workers: int | None = None,
+                     processes: bool = False,
+                     report: LoadReport | None = None) -> LoadReport:
+        """ Tries to load the config file, if path is a file. If path is a
+        directory, try to load all config files contained.
+
+        If any file is invalid, the program exits, unless exit_on_error is
+        False. In that case, the issues are logged and returned instead.
+
+        :param path: Path to a config file or a directory of config files.
+        :param workers: Number of files that are read and parsed in
+            parallel. Defaults to load_workers. The parsed files are always
+            applied in order, so later files overwrite earlier ones.
+        :param processes: Whether to use processes instead of threads.
+        :param report: The report to add the issues to. A new one, if None.
+        :return: The report.
+        """
+        report = LoadReport() if report is None else report
+        issues = len(report)
+        with self._span("load_configs"):
+            self._load_configs(path, workers, processes, report)
+        if len(report) > issues:
+            self._handle_invalid(report)
+        return report
+
+    def _handle_invalid(self, report: LoadReport) -> None:
+        if self.exit_on_error:
             logger.error("Errors occurred when reading the given configs. "
                          "Exiting...")
             quit(err.INVALID_CONFIG_EXIT_CODE)
+        logger.error(f"Errors occurred when reading the given configs. "
+                     f"Keeping the previous values of the invalid files. "
+                     f"{report!r}")
 
-    def load_configs(self, path: Path) -> None:
-        """ Tries to load the config file, if path is a file. If path is a
-        directory, try to load all config files contained. """
-
+    def _config_files(self, path: Path) -> list[Path]:
+        """ Return the config files at path, except the default config. """
         configs = [path] if path.is_file() else list_configs(path)
+        return [config for config in configs
+                if config != self.default_config_path]
+
+    @_serialized
+    def _load_configs(self, path: Path, workers: int | None,
+                      processes: bool, report: LoadReport) -> None:
+        configs = self._config_files(path)
         if not configs:
             return
 
-        valid = True
+        # E.g. directories named 'sub.yaml' or broken links are only reported.
+        files = []
         for path in configs:
-            # Do not load the default config again.
-            if path == self.default_config_path:
-                continue
-            valid &= self.load_config(path)
-        valid &= self._validate_no_missing_properties()
-        if valid:
-            return
+            if path.is_file():
+                files.append(path)
+            else:
+                self._apply_file(path, None, report)
 
-        logger.error("Errors occurred when reading the given configs. "
-                     "Exiting...")
-        quit(err.INVALID_CONFIG_EXIT_CODE)
+        states = [_file_state(path) for path in files]
+        workers = self.load_workers if workers is None else workers
+        results = read_yamls(files, workers, processes, timed=True,
+                             catch=not self.exit_on_error)
+        for path, state, (data, _, seconds) in zip(files, states, results):
+            self._apply_file(path, _ReadFile(state, data, seconds), report)
+        self._validate_no_missing_properties(report)
 
     def load_config(self, path: Path) -> bool:
         """ Load the given config.
@@ -131,20 +510,535 @@ class BaseConfig(InstanceDescriptorMixin, ABC):
         :param path: Path to config file.
         :return: True, if loading was a success, False if any errors occurred.
         """
-        if path.exists() and path.is_file():
-            data, valid = read_yaml(path)
-            valid &= self._validate_no_invalid_properties(data)
-            return valid
+        return self._load_file(path, LoadReport())
+
+    def _load_file(self, path: Path, report: LoadReport) -> bool:
+        issues = len(report)
+        self._apply_file(path, _read_file(path, not self.exit_on_error),
+                         report)
+        return len(report) == issues
+
+    @_serialized
+    def _apply_file(self, path: Path, result: _ReadFile | None,
+                    report: LoadReport, locate: bool = True) -> None:
+        if result is None:
+            logger.error(f"The given configuration file either does not "
+                         f"exist or is not a proper file: '{path}'.")
+            report.add(err.ConfigReaderError(path=path), path)
+            return
+        if self._instrumentation is not None:
+            self._instrumentation.record_file(path, result.state[1],
+                                              result.seconds)
+        if isinstance(result.data, err.ConfigReaderError):
+            logger.error(str(result.data))
+            report.add(result.data, path, line=result.data.line)
+            # Track the file anyway, so it is applied once it is fixed.
+            self._track_file(path, result.state, {})
+            return
+        data = self._not_overridden(result.data or {})
+        if self._validate_no_invalid_properties(data, path, report, locate):
+            self._track_file(path, result.state, result.data)
+            source = self._file_source(path)
+            self._record_sources({name: source for name in data})
+        else:
+            # None of the values was applied, so reapply all of them, once
+            # the file is fixed.
+            self._track_file(path, result.state, {})
+
+    def _file_source(self, path: Path) -> Source:
+        kind = (src.DEFAULT if path == self.default_config_path
+                else src.FILE)
+        return Source(kind, str(path))
+
+    def _not_overridden(self, data: dict[str, Any]) -> dict[str, Any]:
+        """ Return the values of data, which are not overridden by e.g. an
+        environment variable. """
+        if not self._overrides:
+            return data
+        return {key: value for key, value in data.items()
+                if key not in self._overrides}
+
+    @_serialized
+    def stream_config(self, path: Path, fail_fast: bool = False,
+                      report: LoadReport | None = None) -> bool:
+        """ Load the given config, validating and applying its top-level
+        keys while the file is parsed (see reader.stream_yaml).
+
+        Meant for very large or multi-document files. In contrast to
+        load_config, the valid values of a file are applied, even if other
+        values of it are invalid. The documents are applied in order.
+
+        :param path: Path to config file.
+        :param fail_fast: Whether to stop at the first invalid value.
+        :param report: The report to add the issues to.
+        :return: True, if loading was a success, False if any errors occurred.
+        """
+        report = LoadReport() if report is None else report
+        issues = len(report)
+        if not path.is_file():
+            self._apply_file(path, None, report)
+            return False
+        state = _file_state(path)
+        source = self._file_source(path)
+        data = {}
+        staged = {}
+        start = perf_counter()
+        try:
+            for item in stream_yaml(path):
+                data[item.key] = item.value
+                if item.key in self._overrides:
+                    continue
+                try:
+                    staged.update(self._stage({item.key: item.value}))
+                except err.InvalidPropertiesError as error:
+                    [property_error] = error.errors.values()
+                    logger.error(f"Invalid value for '{item.key}': "
+                                 f"{property_error}")
+                    report.add(property_error, path, item.key, item.line)
+                    if fail_fast:
+                        break
+                if len(staged) >= STREAM_COMMIT_SIZE:
+                    self._commit(staged)
+                    self._record_sources({name: source for name in staged})
+                    staged = {}
+        except err.ConfigReaderError as error:
+            if self.exit_on_error:
+                raise
+            logger.error(str(error))
+            report.add(error, path, line=error.line)
+        finally:
+            self._commit(staged)
+            self._record_sources({name: source for name in staged})
+        if self._instrumentation is not None:
+            self._instrumentation.record_file(path, state[1],
+                                              perf_counter() - start)
+        self._track_file(path, state, data)
+        return len(report) == issues
+
+    async def load_default_config_async(self, report: LoadReport | None = None
+                                        ) -> LoadReport:
+        """ Like load_default_config, but reads the file in a thread.
+
+        :param report: The report to add the issues to. A new one, if None.
+        :return: The report.
+        :raises InvalidConfigError: Instead of exiting, if the default
+            configuration is invalid and exit_on_error is True.
+        """
+        report = LoadReport() if report is None else report
+        issues = len(report)
+        with self._span("load_default_config"):
+            await self._load_file_async(self.default_config_path, report)
+        if len(report) > issues:
+            self._handle_invalid_async(self.default_config_path, report)
+        return report
+
+    async def load_configs_async(self, path: Path,
+                                 report: LoadReport | None = None
+                                 ) -> LoadReport:
+        """ Like load_configs, but lists, reads and parses the files
+        concurrently in threads. The values are applied in the calling
+        thread, in the same order as by load_configs.
+
+        :param path: Path to a config file or a directory of config files.
+        :param report: The report to add the issues to. A new one, if None.
+        :return: The report.
+        :raises InvalidConfigError: Instead of exiting, if any of the
+            configuration files is invalid and exit_on_error is True.
+        """
+        report = LoadReport() if report is None else report
+        issues = len(report)
+        catch = not self.exit_on_error
+        with self._span("load_configs"):
+            configs = await asyncio.to_thread(self._config_files, path)
+            results = await asyncio.gather(
+                *(asyncio.to_thread(_read_file, config, catch)
+                  for config in configs))
+            for config, result in zip(configs, results):
+                await self._apply_file_async(config, result, report)
+            if configs:
+                self._validate_no_missing_properties(report)
+        if len(report) > issues:
+            self._handle_invalid_async(path, report)
+        return report
+
+    def _handle_invalid_async(self, path: Path, report: LoadReport) -> None:
+        if self.exit_on_error:
+            raise err.InvalidConfigError(path=path, report=report)
+        self._handle_invalid(report)
 
-        logger.error(f"The given configuration file either does not "
-                     f"exist or is not a proper file: '{path}'.")
-        return False
+    async def load_config_async(self, path: Path) -> bool:
+        """ Like load_config, but reads and parses the file in a thread.
 
+        :param path: Path to config file.
+        :return: True, if loading was a success, False if any errors occurred.
+        """
+        return await self._load_file_async(path, LoadReport())
+
+    async def _load_file_async(self, path: Path, report: LoadReport) -> bool:
+        issues = len(report)
+        result = await asyncio.to_thread(_read_file, path,
+                                         not self.exit_on_error)
+        await self._apply_file_async(path, result, report)
+        return len(report) == issues
+
+    async def _apply_file_async(self, path: Path, result: _ReadFile | None,
+                                report: LoadReport) -> None:
+        """ Like _apply_file, but locates the keys of the invalid values in
+        a thread, as this reads the file again. """
+        issues = len(report)
+        self._apply_file(path, result, report, locate=False)
+        if any(issue.key is not None for issue in report.issues[issues:]):
+            lines = await asyncio.to_thread(key_lines, path)
+            report.locate(path, lines, issues)
+
+    @property
+    def snapshot_path(self) -> Path:
+        """ The path of the snapshot of this config (see save_snapshot). """
+        return self.config_dir / f".{self.program_name}.snapshot"
+
+    def _snapshot_sources(self, load_default: bool,
+                          load_all: bool) -> list[Path]:
+        """ Return the files loaded when initializing the config. """
+        sources = [self.default_config_path] if load_default else []
+        if load_all:
+            path = self.config_dir
+            configs = [path] if path.is_file() else list_configs(path)
+            sources += [config for config in configs
+                        if config != self.default_config_path]
+        return sources
+
+    def save_snapshot(self, sources: list[Path]) -> bool:
+        """ Save the current values and the loaded files to the snapshot.
+
+        :param sources: The files the values were loaded from. The snapshot
+            is only valid as long as none of them changes.
+        :return: True, if the snapshot was written.
+        """
+        with self._span("save_snapshot"):
+            try:
+                digest = snapshots.source_digest(self, sources)
+            except OSError:
+                return False
+            values = self._values()
+            files = [(str(path), loaded.data)
+                     for path, loaded in self._loaded_files.items()]
+            # Plain tuples, as only builtin types can be loaded again.
+            value_sources = {name: tuple(source) for name, source
+                             in self.value_sources().items()}
+            return snapshots.write_snapshot(
+                self.snapshot_path, digest,
+                {"values": values, "files": files, "sources": value_sources})
+
+    @_serialized
+    def load_snapshot(self, sources: list[Path]) -> bool:
+        """ Load the values from the snapshot, without parsing or
+        validating the given files, if none of them changed.
+
+        :param sources: The files the values would be loaded from.
+        :return: True, if the snapshot was loaded.
+        """
+        with self._span("load_snapshot"):
+            try:
+                digest = snapshots.source_digest(self, sources)
+                payload = snapshots.read_snapshot(self.snapshot_path, digest)
+                if payload is None:
+                    return False
+                files = {Path(path): _LoadedFile(_file_state(Path(path)), data)
+                         for path, data in payload["files"]}
+            except (OSError, KeyError, TypeError, ValueError):
+                return False
+            self._commit(payload["values"])
+            self._loaded_files.update(files)
+            default = Source(src.SNAPSHOT, str(self.snapshot_path))
+            value_sources = payload.get("sources", {})
+            self._record_sources({
+                name: Source(*value_sources.get(name, default))
+                for name in payload["values"]})
+            return True
+
+    @_serialized
+    def publish_shared(self, name: str | None = None,
+                       size: int | None = None) -> str:
+        """ Publish the current values to a shared memory block, which
+        other processes can attach to using attach_shared. Attaching is
+        faster than loading the config files, but each process still holds
+        its own copy of the values.
+
+        The first call creates the block, later calls republish the values
+        to the same block and increase its generation.
+
+        :param name: The name of the block. Random, if not given.
+        :param size: The capacity of the block in bytes. Defaults to the
+            size of the current values with some room to grow.
+        :return: The name of the block.
+        :raises SharedConfigError: If the values do not fit the block.
+        :raises InvalidSnapshotError: If any value can not be shared.
+        """
+        from custom_conf.shared import SharedConfigBlock
+
+        values = self._values()
+        if self._shared is None:
+            if size is None:
+                size = 2 * len(snapshots.dumps(values))
+            self._shared = SharedConfigBlock.create(size, name)
+        elif not self._shared.owner:
+            raise err.SharedConfigError(
+                name=self._shared.name,
+                reason="only the publishing process can republish it")
+        self._shared_generation = self._shared.write(values)
+        return self._shared.name
+
+    def attach_shared(self, name: str) -> None:
+        """ Load the values published by another process and freeze the
+        config. Neither files nor values are parsed or validated again.
+
+        :param name: The name of the block returned by publish_shared.
+        :raises SharedConfigError: If the block does not exist or nothing
+            was published yet.
+        """
+        from custom_conf.shared import SharedConfigBlock
+
+        self.close_shared()
+        self._shared = SharedConfigBlock.attach(name)
+        self._shared_generation = 0
+        self.refresh_shared()
+        self.freeze()
+
+    def refresh_shared(self) -> bool:
+        """ Load the values from the attached block, if they were
+        republished since they were last loaded.
+
+        :return: True, if the values were loaded.
+        :raises SharedConfigError: If the values can not be read, e.g.
+            because the publisher died while writing them.
+        """
+        shared = self._shared
+        if shared is None or shared.owner:
+            return False
+        if shared.generation == self._shared_generation:
+            return False
+        # Read without the lock, so writers never wait for the publisher.
+        generation, values = shared.read()
+        with self._write_lock:
+            if (self._shared is not shared
+                    or generation <= self._shared_generation):
+                return False
+            self._shared_generation = generation
+            self._commit(values)
+            source = Source(src.SHARED, shared.name)
+            self._record_sources({name: source for name in values})
+        return True
+
+    def close_shared(self) -> None:
+        """ Close the shared memory block. If this config published it,
+        the block is destroyed as well. """
+        if self._shared is not None:
+            self._shared.close()
+            self._shared = None
+
+    def _track_file(self, path: Path, state: tuple[int, int],
+                    data: dict[str, Any] | None) -> None:
+        # Files are reloaded in the order they were (last) loaded.
+        self._loaded_files.pop(path, None)
+        self._loaded_files[path] = _LoadedFile(state, data or {})
+
+    def add_reload_listener(self, listener: ReloadListener) -> None:
+        """ Call listener(config, changed_names), whenever a reload changes
+        the value of at least one property. """
+        self._reload_listeners.append(listener)
+
+    def remove_reload_listener(self, listener: ReloadListener) -> None:
+        self._reload_listeners.remove(listener)
+
+    def reload(self, report: LoadReport | None = None) -> list[str]:
+        """ Reload the loaded config files, that changed since loading them.
+
+        A file is considered changed, if its modification time or size
+        changed. Only the values of keys that changed are validated again.
+        All changed values are applied at once. If any of them is invalid,
+        none of them is applied and an InvalidPropertiesError is raised.
+
+        Files that can not be parsed, e.g. due to a syntax error, are
+        skipped and keep their previous values, until they change again.
+        The other changed files are still applied.
+
+        :param report: The report to add the syntax errors to.
+        :return: The names of the properties, whose value changed.
+        """
+        with self._span("reload"):
+            return self._apply_changed_files(
+                self._read_changed_files(report))
+
+    async def reload_async(self, report: LoadReport | None = None
+                           ) -> list[str]:
+        """ Like reload, but checks and reads the files in a thread. The
+        changes are applied in the calling thread. """
+        with self._span("reload"):
+            changed_files = await asyncio.to_thread(self._read_changed_files,
+                                                    report)
+            return self._apply_changed_files(changed_files)
+
+    def _read_changed_files(self, report: LoadReport | None = None
+                            ) -> dict[Path, _LoadedFile]:
+        """ Read the loaded files, that changed since they were loaded. """
+        with self._write_lock:
+            loaded_files = list(self._loaded_files.items())
+        changed_files = {}
+        for path, loaded in loaded_files:
+            try:
+                state = _file_state(path)
+                if state == loaded.state:
+                    continue
+                # The file may be removed (or become unreadable) after stat.
+                data = read_yaml(path)[0] or {}
+            except OSError as error:
+                logger.warning(f"The configuration file '{path}' could not "
+                               f"be reloaded, because it no longer exists "
+                               f"or can not be read: {error}")
+                continue
+            except err.ConfigReaderError as error:
+                logger.error(str(error))
+                if report is not None:
+                    report.add(error, path, line=error.line)
+                # Keep the previous values of the file, but only read it
+                # again, once it changes again.
+                data = loaded.data
+            changed_files[path] = _LoadedFile(state, data)
+        return changed_files
+
+    @_serialized
+    def _apply_changed_files(self, changed_files: dict[Path, _LoadedFile]
+                             ) -> list[str]:
+        changed_keys: set[str] = set()
+        for path, changed_file in changed_files.items():
+            old, new = self._loaded_files[path].data, changed_file.data
+            changed_keys.update(
+                key for key in old.keys() | new.keys()
+                if old.get(key, _MISSING) != new.get(key, _MISSING))
+        if not changed_files:
+            return []
+
+        files = list({**self._loaded_files, **changed_files}.items())
+        values = {}
+        paths = {}
+        for key in changed_keys - self._overrides.keys():
+            # The last file containing the key determines its value. Keys
+            # that were removed from every file keep their current value.
+            for path, loaded in reversed(files):
+                if key in loaded.data:
+                    values[key] = loaded.data[key]
+                    paths[key] = path
+                    break
+
+        # If this fails, the tracked files are not updated, so the next
+        # reload tries to apply the same changes again.
+        staged = self._stage(values)
+        # E.g. numpy arrays are compared element-wise, not using !=.
+        changed = [name for name, value in staged.items()
+                   if not diffs.values_equal(self._get_value(name), value)]
+        self._commit({name: staged[name] for name in changed})
+        self._record_sources({name: self._file_source(paths[name])
+                              for name in changed})
+        self._loaded_files.update(changed_files)
+        if changed:
+            for listener in list(self._reload_listeners):
+                listener(self, changed)
+        return changed
+
+    def watch(self, interval: float = 1.0) -> "ConfigWatcher":
+        """ Start a thread, which reloads changed config files.
+
+        :param interval: Seconds between two checks for changes.
+        :return: The started watcher. Use its stop method to stop it.
+        """
+        from custom_conf.watcher import ConfigWatcher
+
+        watcher = ConfigWatcher(self, interval)
+        watcher.start()
+        return watcher
+
+    def update(self, values: dict[str, Any]) -> None:
+        """ Set multiple properties at once.
+
+        All values are validated first. Only if every value is valid, they
+        are applied, using a single write. Otherwise, no value is applied.
+        This also works for frozen configs.
+
+        :param values: The new values, by property name.
+        :raises InvalidPropertiesError: If any value is invalid. Its errors
+            attribute contains the error of each invalid value.
+        """
+        self._commit(self._stage(values))
+
+    def _stage(self, values: dict[str, Any]) -> dict[str, Any]:
+        """ Validate the given values without applying them.
+
+        :return: The values, as they would be stored (e.g. after coercion).
+        :raises InvalidPropertiesError: If any value is invalid.
+        """
+        staged = {}
+        errors = {}
+        get_property = self.properties.get
+        instrumentation = self._instrumentation
+        for name, value in values.items():
+            if (prop := get_property(name)) is None:
+                errors[name] = err.UnknownPropertyError(name=name, value=value)
+                continue
+            if instrumentation is None:
+                staged[name], error = prop.try_parse(value)
+            else:
+                start = perf_counter()
+                staged[name], error = prop.try_parse(value)
+                instrumentation.record_property(name, perf_counter() - start)
+            if error is not None:
+                errors[name] = error
+        if errors:
+            raise err.InvalidPropertiesError(errors=errors)
+        return staged
+
+    @_serialized
+    def _commit(self, values: dict[str, Any]) -> None:
+        """ Store the given, already validated, values at once. """
+        if self.thread_safe:
+            state = MappingProxyType({**self._state, **values})
+            object.__setattr__(self, "_state", state)
+            if self.frozen:
+                self.__dict__.update(values)
+            return
+        instance_vars = {self.properties[name].attr: value
+                         for name, value in values.items()}
+        if self.frozen:
+            instance_vars.update(values)
+        self.__dict__.update(instance_vars)
+
+    def _values(self) -> dict[str, Any]:
+        """ Return the stored values of all properties, that are set. """
+        if self.thread_safe:
+            return dict(self._state)
+        stored = self.__dict__
+        return {name: value for name, prop in self.properties.items()
+                if (value := stored.get(prop.attr, _MISSING)) is not _MISSING}
+
+    def _get_value(self, name: str) -> Any:
+        """ Return the stored value of the property or _MISSING. """
+        if self.thread_safe:
+            return self._state.get(name, _MISSING)
+        return self.__dict__.get(self.properties[name].attr, _MISSING)
+
+    @_serialized
     def load_args(self, args_ns: Namespace):
-        """ Reads the program arguments in args. """
-        args = {arg: getattr(args_ns, arg)
-                for arg in dir(args_ns) if not arg.startswith("_")}
-        for config_path in args.pop("config", []):
+        """ Reads the program arguments in args.
+
+        The arguments override the values of the config files and the
+        environment variables.
+
+        :raises InvalidPropertiesError: If any argument is invalid. In that
+            case, none of them is applied.
+        """
+        # Private attributes are set by e.g. subparsers or custom actions.
+        args = {name: value for name, value in vars(args_ns).items()
+                if not name.startswith("_")}
+        for config_path in args.pop("config", None) or []:
             path = Path(config_path).resolve()
             if path.is_dir():
                 logger.info(
@@ -154,6 +1048,7 @@ class BaseConfig(InstanceDescriptorMixin, ABC):
             else:
                 self.load_config(path)
 
+        values = {}
         for name, value in args.items():
             if value is None:
                 # Nothing to log, cause this just means argument is unset.
@@ -161,27 +1056,165 @@ class BaseConfig(InstanceDescriptorMixin, ABC):
             if name not in self.properties:
                 logger.error(f"Tried to set unknown property '{name}'.")
                 continue
-            setattr(self, name, value)
+            values[name] = value
+        self._apply_override_layer(src.CLI, values,
+                                   {name: name for name in values})
 
-    def _validate_no_invalid_properties(self, data: dict[str, Any]) -> bool:
-        valid = True
-        for name, value in data.items():
-            # Even if an item is invalid, continue reading to find all errors.
-            try:
-                if name not in self.properties:
-                    raise err.UnknownPropertyError(name=name, value=value)
-                setattr(self, name, value)
-            except err.PropertyError:
-                valid = False
-        return valid
-
-    def _validate_no_missing_properties(self) -> bool:
+    @property
+    def env_index(self) -> Mapping[str, str]:
+        """ The names of the properties by the environment variable, which
+        overrides them (e.g. MY_PROGRAM__LOG_LEVEL for log_level). """
+        if self._env_index is None:
+            prefix = self.env_prefix or src.env_prefix(self.program_name)
+            self._env_index = MappingProxyType(
+                src.build_env_index(prefix, self.properties))
+        return self._env_index
+
+    def load_env(self, environ: Mapping[str, str] | None = None,
+                 report: LoadReport | None = None) -> LoadReport:
+        """ Override the values of the config files with the environment
+        variables of the properties (see env_index).
+
+        The values are strings, which are coerced by the properties. If any
+        of them is invalid, none of them is applied, and the program exits,
+        unless exit_on_error is False.
+
+        :param environ: The environment variables. Defaults to os.environ.
+        :param report: The report to add the issues to. A new one, if None.
+        :return: The report.
+        """
+        report = LoadReport() if report is None else report
+        environ = os.environ if environ is None else environ
+        values = {}
+        variables = {}
+        for variable, name in self.env_index.items():
+            if (value := environ.get(variable)) is not None:
+                values[name] = value
+                variables[name] = variable
+        try:
+            self._apply_override_layer(src.ENV, values, variables)
+        except err.InvalidPropertiesError as error:
+            for name, property_error in error.errors.items():
+                logger.error(f"Invalid value for '{variables[name]}': "
+                             f"{property_error}")
+                report.add(property_error, key=variables[name])
+            self._handle_invalid(report)
+        return report
+
+    @_serialized
+    def _apply_override_layer(self, kind: str, values: dict[str, Any],
+                              locations: dict[str, str]) -> None:
+        """ Apply the values of a layer, which overrides the config files.
+        Values overridden by a higher layer (see src.OVERRIDE_LAYERS) are
+        skipped.
+
+        :raises InvalidPropertiesError: If any value is invalid.
+        """
+        rank = src.OVERRIDE_LAYERS.index(kind)
+        values = {name: value for name, value in values.items()
+                  if src.OVERRIDE_LAYERS.index(
+                      self._overrides.get(name, kind)) <= rank}
+        self.update(values)
+        self._overrides.update(dict.fromkeys(values, kind))
+        self._record_sources({name: Source(kind, locations[name])
+                              for name in values})
+
+    def _record_sources(self, value_sources: dict[str, Source]) -> None:
+        """ Remember the source of the current values of the properties. """
+        for name, source in value_sources.items():
+            self._sources[name] = (source, self._get_value(name))
+
+    def source_of(self, name: str) -> Source | None:
+        """ Return where the current value of the property came from, e.g.
+        Source('env', 'MY_PROGRAM__LOG_LEVEL'), or None if it is not set.
+
+        Values set by the program (e.g. config.name = value or update)
+        have the source kind 'set'.
+        """
+        value = self._get_value(name)
+        if value is _MISSING:
+            return None
+        source, recorded = self._sources.get(name, (None, _MISSING))
+        # The value was replaced since its source was recorded.
+        if recorded is not value:
+            return Source(src.SET)
+        return source
+
+    def value_sources(self) -> dict[str, Source]:
+        """ Return the source of each property, that is set (see source_of).
+        """
+        return self._sources_of(self._values())
+
+    def _sources_of(self, values: dict[str, Any]) -> dict[str, Source]:
+        """ Return the sources of the given (current) values. """
+        sources = self._sources
+        result = {}
+        for name, value in values.items():
+            source, recorded = sources.get(name, (None, _MISSING))
+            result[name] = source if recorded is value else Source(src.SET)
+        return result
+
+    @_serialized
+    def capture_state(self) -> diffs.ConfigState:
+        """ Return the values of the properties, that are set, and their
+        sources, e.g. to compare them to a later state using diff. """
+        values = self._values()
+        return diffs.ConfigState(MappingProxyType(values),
+                                 MappingProxyType(self._sources_of(values)))
+
+    def diff(self, other: "BaseConfig | diffs.ConfigState | Mapping[str, Any]"
+             ) -> diffs.ConfigDiff:
+        """ Return the changes from this config to the other config or state,
+        i.e. the properties, which were added, changed or removed, with
+        their old and new values and sources.
+
+        Unchanged values are compared by identity, so comparing a config to
+        an earlier state of itself does not compare the (possibly large)
+        values, that did not change.
+        """
+        if isinstance(other, BaseConfig):
+            other = other.capture_state()
+        return diffs.diff_states(self.capture_state(), other)
+
+    def changes_since(self, state: "diffs.ConfigState | Mapping[str, Any]"
+                      ) -> diffs.ConfigDiff:
+        """ Return the changes from the earlier state (see capture_state) to
+        the current values, e.g. to audit a reload. """
+        return diffs.diff_states(state, self.capture_state())
+
+    def _validate_no_invalid_properties(self, data: dict[str, Any] | None,
+                                        path: Path | None = None,
+                                        report: LoadReport | None = None,
+                                        locate: bool = True) -> bool:
+        try:
+            self.update(data or {})
+        except err.InvalidPropertiesError as error:
+            for name, property_error in error.errors.items():
+                logger.error(f"Invalid value for '{name}': {property_error}")
+            if report is not None:
+                # Only locate the keys, if there actually are errors.
+                lines = (key_lines(path) if locate and path is not None
+                         else {})
+                report.add_errors(error.errors, path, lines)
+            return False
+        return True
+
+    def _validate_no_missing_properties(self, report: LoadReport | None = None
+                                        ) -> bool:
         missing_keys = []
-        for key in self.properties:
+        for key, prop in self.properties.items():
             try:
-                getattr(self, key)
-            except err.MissingRequiredPropertyError:
+                value = getattr(self, key)
+            except err.MissingRequiredPropertyError as error:
                 missing_keys.append(key)
+                if report is not None:
+                    report.add(error, key=key)
+                continue
+            # E.g. the missing properties of sections, by their dotted path.
+            for name, error in prop.missing_errors(value).items():
+                missing_keys.append(name)
+                if report is not None:
+                    report.add(error, key=name)
 
         if missing_keys:
             logger.warning(
@@ -0,0 +1,181 @@
+""" Differences between two states of configs, e.g. before and after a
+reload, or of two configs of the same program.
+
+Values are compared by identity first. Loading, reloading and update only
+replace the values of the properties they change, so the values of all
+other properties are still the same objects and are never deep-compared.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any, Iterable, Iterator, Mapping, NamedTuple, overload
+
+from custom_conf.sources import Source
+
+# The kinds of changes.
+ADDED = "added"
+CHANGED = "changed"
+REMOVED = "removed"
+
+_MISSING = object()
+
+
+class ConfigState(NamedTuple):
+    """ The values of the properties of a config, that are set, and their
+    sources at one point in time. """
+    values: Mapping[str, Any]
+    sources: Mapping[str, Source]
+
+
+class Change(NamedTuple):
+    """ The change of a single property. """
+    name: str
+    kind: str
+    # The old and new value, None if the property was added or removed.
+    old: Any = None
+    new: Any = None
+    old_source: Source | None = None
+    new_source: Source | None = None
+
+    def __str__(self) -> str:
+        if self.kind == ADDED:
+            return f"+ {self.name}: {self.new!r} ({self.new_source})"
+        if self.kind == REMOVED:
+            return f"- {self.name}: {self.old!r} ({self.old_source})"
+        return (f"~ {self.name}: {self.old!r} ({self.old_source}) -> "
+                f"{self.new!r} ({self.new_source})")
+
+
+class ConfigDiff(Sequence):
+    """ Ordered collection of the changes between two config states.
+
+    Behaves like a list of changes, which can also be accessed by the name
+    of their property, e.g. using diff["name"] or diff.get("name").
+    """
+
+    def __init__(self, changes: Iterable[Change] = ()) -> None:
+        self._changes: dict[str, Change] = {change.name: change
+                                            for change in changes}
+        self._list: list[Change] | None = None
+
+    def _of_kind(self, kind: str) -> list[Change]:
+        return [change for change in self if change.kind == kind]
+
+    @property
+    def added(self) -> list[Change]:
+        """ The properties, which are only set in the new state. """
+        return self._of_kind(ADDED)
+
+    @property
+    def changed(self) -> list[Change]:
+        """ The properties, whose value differs. """
+        return self._of_kind(CHANGED)
+
+    @property
+    def removed(self) -> list[Change]:
+        """ The properties, which are only set in the old state. """
+        return self._of_kind(REMOVED)
+
+    def names(self) -> list[str]:
+        """ Return the names of all changed properties. """
+        return list(self._changes)
+
+    def get(self, name: str, default: Any = None) -> Change | Any:
+        """ Return the change of the property with the given name or
+        default, if the property did not change. """
+        return self._changes.get(name, default)
+
+    @overload
+    def __getitem__(self, key: int) -> Change: ...
+
+    @overload
+    def __getitem__(self, key: slice) -> list[Change]: ...
+
+    @overload
+    def __getitem__(self, key: str) -> Change: ...
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self._changes[key]
+        if self._list is None:
+            self._list = list(self._changes.values())
+        return self._list[key]
+
+    def __contains__(self, item: Any) -> bool:
+        if isinstance(item, Change):
+            return self._changes.get(item.name) == item
+        try:
+            return item in self._changes
+        except TypeError:
+            return False
+
+    def __iter__(self) -> Iterator[Change]:
+        return iter(self._changes.values())
+
+    def __len__(self) -> int:
+        return len(self._changes)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, ConfigDiff):
+            return NotImplemented
+        return list(self) == list(other)
+
+    def __str__(self) -> str:
+        return "\n".join(map(str, self))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self)!r})"
+
+
+def values_equal(old: Any, new: Any) -> bool:
+    """ Whether the two values are equal, without comparing identical
+    values. """
+    if old is new:
+        return True
+    if type(old) is not type(new):
+        # E.g. 1 and True or 1.0, which are stored as different values.
+        return False
+    try:
+        equal = old == new
+    except ValueError:
+        # E.g. numpy arrays with different shapes.
+        return False
+    if isinstance(equal, bool):
+        return equal
+    # E.g. numpy arrays, which are compared element-wise.
+    return bool(equal.all()) if hasattr(equal, "all") else bool(equal)
+
+
+def diff_states(old: ConfigState | Mapping[str, Any],
+                new: ConfigState | Mapping[str, Any]) -> ConfigDiff:
+    """ Return the changes from the old to the new state. Plain mappings of
+    property names to values have no sources. """
+    old_values, old_sources = _split(old)
+    new_values, new_sources = _split(new)
+    changes = []
+    removed = 0
+    for name, old_value in old_values.items():
+        new_value = new_values.get(name, _MISSING)
+        if new_value is _MISSING:
+            removed += 1
+            changes.append(Change(name, REMOVED, old=old_value,
+                                  old_source=old_sources.get(name)))
+        elif not values_equal(old_value, new_value):
+            changes.append(Change(name, CHANGED, old_value, new_value,
+                                  old_sources.get(name),
+                                  new_sources.get(name)))
+    # Only look for added properties, if the new state has any.
+    if len(new_values) > len(old_values) - removed:
+        changes += [Change(name, ADDED, new=new_value,
+                           new_source=new_sources.get(name))
+                    for name, new_value in new_values.items()
+                    if name not in old_values]
+    return ConfigDiff(changes)
+
+
+def _split(state: ConfigState | Mapping[str, Any]
+           ) -> tuple[Mapping[str, Any], Mapping[str, Source]]:
+    if isinstance(state, ConfigState):
+        return state
+    return state, {}
@@ -1,22 +1,110 @@
-""" Exceptions raised by properties. """
-from typing import Any
+""" Exceptions raised by properties.
 
-from custom_conf.properties.choices_property import ChoicesProperty
+The messages of the exceptions are only formatted, when they are needed
+(i.e. when the exception is converted to a string). This keeps creating
+(and raising) them cheap, e.g. when validating many invalid values.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from custom_conf.properties.choices_property import ChoicesProperty
 
 INVALID_CONFIG_EXIT_CODE = 1
 
 
 class CustomConfError(Exception):
-    """ Base class for any custom exceptions raised by custom_conf. """
-    pass
+    """ Base class for any custom exceptions raised by custom_conf.
+
+    Subclasses store the details in __init__ and build the message in
+    _format, which is called at most once, when the message is required.
+    """
+    _message: str | None = None
+
+    def _format(self) -> str:
+        return super().__str__()
+
+    def __str__(self) -> str:
+        if self._message is None:
+            self._message = self._format()
+        return self._message
+
+    # The details are passed as keyword arguments and stored as attributes,
+    # so the message is used as the arguments. Pickling uses the (empty)
+    # arguments given to __init__ and restores the attributes.
+    @property
+    def args(self) -> tuple:
+        return BaseException.args.__get__(self) or (str(self),)
+
+    @args.setter
+    def args(self, args: tuple) -> None:
+        BaseException.args.__set__(self, args)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({str(self)!r})"
 
 
 class ConfigReaderError(CustomConfError):
     """ Base class for exceptions that occur when reading a configuration. """
     def __init__(self, **kwargs) -> None:
-        self.path = kwargs.pop("path")
-        msg = f"Could not read the configuration at '{self.path}'."
-        super().__init__(msg)
+        self.path = kwargs.get("path")
+        self.line = kwargs.get("line")
+        super().__init__()
+
+    def _format(self) -> str:
+        infix = f" (line {self.line})" if self.line is not None else ""
+        return f"Could not read the configuration at '{self.path}'{infix}."
+
+
+class UnknownLoaderError(CustomConfError):
+    def __init__(self, **kwargs) -> None:
+        """ Raised, when a yaml loader is requested that does not exist.
+
+        :keyword name: The name of the requested loader.
+        :type name: str
+        :keyword loaders: The names of the available loaders.
+        :type loaders: list[str]
+        """
+        self.name = kwargs.get("name")
+        self.loaders = kwargs.get("loaders")
+        super().__init__()
+
+    def _format(self) -> str:
+        return (f"There is no yaml loader with the name '{self.name}'. "
+                f"Available loaders: {self.loaders}.")
+
+
+class InvalidSnapshotError(CustomConfError):
+    def __init__(self, **kwargs) -> None:
+        """ Raised, when a snapshot can not be written or loaded.
+
+        :keyword reason: Why the snapshot is invalid.
+        :type reason: str
+        """
+        self.reason = kwargs.get("reason")
+        super().__init__()
+
+    def _format(self) -> str:
+        return f"Invalid config snapshot: {self.reason}."
+
+
+class SharedConfigError(CustomConfError):
+    def __init__(self, **kwargs) -> None:
+        """ Raised, when a config can not be published to or attached from
+        shared memory.
+
+        :keyword name: The name of the shared memory block.
+        :type name: str
+        :keyword reason: Why the operation failed.
+        :type reason: str
+        """
+        self.name = kwargs.get("name")
+        self.reason = kwargs.get("reason")
+        super().__init__()
+
+    def _format(self) -> str:
+        return f"Shared config '{self.name}' is unusable: {self.reason}."
 
 
 class ConfigError(CustomConfError):
@@ -24,6 +112,30 @@ class ConfigError(CustomConfError):
     pass
 
 
+class InvalidConfigError(ConfigError):
+    exit_code: int = INVALID_CONFIG_EXIT_CODE
+
+    def __init__(self, **kwargs) -> None:
+        """ Raised by the async loaders, instead of exiting the program, when
+        a configuration is invalid. The details of each error are logged.
+
+        :keyword path: The path of the configuration file or directory.
+        :type path: Path
+        :keyword report: The report of all issues.
+        :type report: LoadReport
+        """
+        self.path = kwargs.get("path")
+        self.report = kwargs.get("report")
+        super().__init__()
+
+    def _format(self) -> str:
+        message = (f"Errors occurred when reading the configuration at "
+                   f"'{self.path}'.")
+        if self.report is None:
+            return message
+        return f"{message}\n{self.report}"
+
+
 class AddAfterInitError(ConfigError):
     def __init__(self, **kwargs) -> None:
         """ Raised, when a new property is added to the configuration, after
@@ -33,10 +145,28 @@ class AddAfterInitError(ConfigError):
         :type name: str
         """
         self.name = kwargs.get("name")
+        super().__init__()
+
+    def _format(self) -> str:
         infix = f", with name '{self.name}'," if self.name is not None else ""
-        super().__init__(
-            f"Tried adding a new property{infix} after the configuration "
-            f"was initialized.")
+        return (f"Tried adding a new property{infix} after the configuration "
+                f"was initialized.")
+
+
+class FrozenConfigError(ConfigError):
+    def __init__(self, **kwargs) -> None:
+        """ Raised, when a property of a frozen configuration is modified.
+
+        :keyword name: The name of the property.
+        :type name: str
+        """
+        self.name = kwargs.get("name")
+        super().__init__()
+
+    def _format(self) -> str:
+        infix = f" '{self.name}'" if self.name is not None else ""
+        return (f"Tried modifying the property{infix} of a frozen "
+                f"configuration.")
 
 
 class PropertyError(CustomConfError):
@@ -56,13 +186,14 @@ class MismatchedPropertyNameError(PropertyError):
         """
         self.prop = kwargs.get("prop")
         self.name = kwargs.get("name")
-        if "prop" not in kwargs or "name" not in kwargs:
-            super().__init__()
-            return
-        msg = (f"The property with the name '{self.prop.name}' is used "
-               f"for the configuration key '{self.name}'. Property name and "
-               f"config instance variable names have to be the equal.")
-        super().__init__(msg)
+        super().__init__()
+
+    def _format(self) -> str:
+        if self.prop is None or self.name is None:
+            return ""
+        return (f"The property with the name '{self.prop.name}' is used "
+                f"for the configuration key '{self.name}'. Property name and "
+                f"config instance variable names have to be the equal.")
 
 
 class InvalidPropertyTypeError(PropertyError):
@@ -76,31 +207,36 @@ class InvalidPropertyTypeError(PropertyError):
         """
         self.prop = kwargs.get("prop")
         self.type = kwargs.get("type")
-        if "prop" not in kwargs or "type" not in kwargs:
-            super().__init__()
-            return
-        msg = (f"Invalid config type for property '{self.prop.name}'. "
-               f"Expected '{self.prop.type}', got '{self.type}' instead.")
-        super().__init__(msg)
+        super().__init__()
+
+    def _format(self) -> str:
+        if self.prop is None or self.type is None:
+            return ""
+        return (f"Invalid config type for property '{self.prop.name}'. "
+                f"Expected '{self.prop.type}', got '{self.type}' instead.")
 
 
 class InvalidCoercionError(PropertyError):
     def __init__(self, **kwargs) -> None:
-        self.prop = kwargs.pop("prop")
-        self.value = kwargs.pop("value")
-        msg = (f"Could not cleanly coerce the value '{self.value}' "
-               f"of type '{type(self.value)}' to type '{self.prop.type}' "
-               f"for property '{self.prop.name}'.")
-        super().__init__(msg)
+        self.prop = kwargs.get("prop")
+        self.value = kwargs.get("value")
+        super().__init__()
+
+    def _format(self) -> str:
+        return (f"Could not cleanly coerce the value '{self.value}' "
+                f"of type '{type(self.value)}' to type '{self.prop.type}' "
+                f"for property '{self.prop.name}'.")
 
 
 class LossOfPrecisionError(PropertyError):
     def __init__(self, **kwargs) -> None:
-        self.type = kwargs.pop("type")
-        self.value = kwargs.pop("value")
-        msg = (f"Coercion of '{self.value}' to type "
-               f"'{self.type}' would reduce precision.")
-        super().__init__(msg)
+        self.type = kwargs.get("type")
+        self.value = kwargs.get("value")
+        super().__init__()
+
+    def _format(self) -> str:
+        return (f"Coercion of '{self.value}' to type "
+                f"'{self.type}' would reduce precision.")
 
 
 class NotATypeError(PropertyError):
@@ -111,10 +247,12 @@ class NotATypeError(PropertyError):
         :keyword type: The object that was provided as a type for the property.
         """
         self.type = kwargs.get("type")
-        if "type" not in kwargs:
-            super().__init__()
-            return
-        super().__init__(f"The provided type '{self.type}' is not a type.")
+        super().__init__()
+
+    def _format(self) -> str:
+        if self.type is None:
+            return ""
+        return f"The provided type '{self.type}' is not a type."
 
 
 class MissingRequiredPropertyError(PropertyError):
@@ -126,21 +264,24 @@ class MissingRequiredPropertyError(PropertyError):
         :type prop: A Property object
         """
         self.prop = kwargs.get("prop")
-        if "prop" not in kwargs:
-            super().__init__()
-            return
-        msg = (f"The property '{self.prop.name}' was not set during the "
-               f"initialization, even though it is a required property.")
-        super().__init__(msg)
+        super().__init__()
+
+    def _format(self) -> str:
+        if self.prop is None:
+            return ""
+        return (f"The property '{self.prop.name}' was not set during the "
+                f"initialization, even though it is a required property.")
 
 
 class QueriedBeforeSetError(PropertyError):
     def __init__(self, **kwargs) -> None:
         """"""
         self.prop = kwargs.get("prop")
-        msg = (f"The property '{self.prop.name}' was queried "
-               f"before it was assigned a value.")
-        super().__init__(msg)
+        super().__init__()
+
+    def _format(self) -> str:
+        return (f"The property '{self.prop.name}' was queried "
+                f"before it was assigned a value.")
 
 
 class UnknownPropertyError(PropertyError):
@@ -155,12 +296,31 @@ class UnknownPropertyError(PropertyError):
         """
         self.name = kwargs.get("name")
         self.value = kwargs.get("value")
-        if "name" not in kwargs or "value" not in kwargs:
-            super().__init__()
-            return
-        msg = (f"An unknown property with the name '{self.name}' and "
-               f"value '{self.value}' was requested.")
-        super().__init__(msg)
+        super().__init__()
+
+    def _format(self) -> str:
+        if self.name is None:
+            return ""
+        return (f"An unknown property with the name '{self.name}' and "
+                f"value '{self.value}' was requested.")
+
+
+class InvalidPropertiesError(PropertyError):
+    def __init__(self, **kwargs) -> None:
+        """ Raised, when multiple values are validated at once and at least
+        one of them is invalid.
+
+        :keyword errors: The error of each invalid value, by property name.
+        :type errors: dict[str, PropertyError]
+        """
+        self.errors = kwargs.get("errors", {})
+        super().__init__()
+
+    def _format(self) -> str:
+        details = "\n".join(f"\t{name}: {error}"
+                            for name, error in self.errors.items())
+        return (f"{len(self.errors)} invalid configuration "
+                f"value(s):\n{details}")
 
 
 ###########################
@@ -179,14 +339,90 @@ class OutOfBoundsPropertyError(PropertyError):
         """
         self.prop = kwargs.get("prop")
         self.value = kwargs.get("value")
-        if "prop" not in kwargs or "value" not in kwargs:
-            super().__init__()
-            return
+        super().__init__()
+
+    def _format(self) -> str:
+        if self.prop is None:
+            return ""
+        prop_type_name = self.prop.__class__.__name__
+        return (f"The given value '{self.value}' for the {prop_type_name} "
+                f"'{self.prop.name}' is out of bounds "
+                f"[{self.prop.lower}, {self.prop.upper}].")
+
+
+class OutOfBoundsElementsError(OutOfBoundsPropertyError):
+    # Only this many of the offending elements are part of the message.
+    shown: int = 10
+
+    def __init__(self, **kwargs) -> None:
+        """ Raised, if elements of a bounded array property are out of bounds.
+
+        :keyword prop: The property that is being modified.
+        :type prop: BoundedArrayProperty
+        :keyword value: The (converted) array the property is being set to.
+        :type value: Sequence
+        :keyword indices: The indices of the elements that are out of bounds.
+        :type indices: list[int]
+        """
+        self.indices = kwargs.get("indices", [])
+        super().__init__(**kwargs)
+
+    def _format(self) -> str:
+        if self.prop is None:
+            return ""
         prop_type_name = self.prop.__class__.__name__
-        msg = (f"The given value '{self.value}' for the {prop_type_name} "
-               f"'{self.prop.name}' is out of bounds "
-               f"[{self.prop.lower}, {self.prop.upper}].")
-        super().__init__(msg)
+        elements = ", ".join(f"{self.value[index]} (index {index})"
+                             for index in self.indices[:self.shown])
+        if len(self.indices) > self.shown:
+            elements += ", ..."
+        return (f"{len(self.indices)} value(s) for the {prop_type_name} "
+                f"'{self.prop.name}' are out of bounds "
+                f"[{self.prop.lower}, {self.prop.upper}]: {elements}.")
+
+
+class InvalidElementsError(PropertyError):
+    shown: int = 10
+
+    def __init__(self, **kwargs) -> None:
+        """ Raised, if elements of an array property have an invalid type.
+
+        :keyword prop: The property that is being modified.
+        :type prop: BoundedArrayProperty
+        :keyword errors: The error of each invalid element by its index.
+        :type errors: dict[int, PropertyError]
+        """
+        self.prop = kwargs.get("prop")
+        self.errors = kwargs.get("errors", {})
+        super().__init__()
+
+    def _format(self) -> str:
+        if self.prop is None:
+            return ""
+        details = "\n".join(
+            f"\t{index}: {error}"
+            for index, error in list(self.errors.items())[:self.shown])
+        if len(self.errors) > self.shown:
+            details += "\n\t..."
+        return (f"{len(self.errors)} invalid element(s) for the property "
+                f"'{self.prop.name}':\n{details}")
+
+
+class UnknownArrayBackendError(PropertyError):
+    def __init__(self, **kwargs) -> None:
+        """ Raised, when an array backend is requested that is not available.
+
+        :keyword name: The name of the requested backend.
+        :type name: str
+        :keyword backends: The names of the available backends.
+        :type backends: list[str]
+        """
+        self.name = kwargs.get("name")
+        self.backends = kwargs.get("backends")
+        super().__init__()
+
+    def _format(self) -> str:
+        return (f"There is no array backend with the name '{self.name}'. "
+                f"Available backends: {self.backends}.")
 
 
 class IncomparableBoundsTypeError(PropertyError):
@@ -197,59 +433,59 @@ class IncomparableBoundsTypeError(PropertyError):
         :type type: type
         """
         self.type = kwargs.get("type")
-        if "type" not in kwargs:
-            super().__init__()
-            return
-        msg = (f"The given type '{self.type}' is not comparable and can "
-               f"thus not be used as bounds.")
-        super().__init__(msg)
+        super().__init__()
+
+    def _format(self) -> str:
+        if self.type is None:
+            return ""
+        return (f"The given type '{self.type}' is not comparable and can "
+                f"thus not be used as bounds.")
 
 
 class MissingBoundsError(PropertyError):
     def __init__(self) -> None:
         """ Raised when neither the lower nor upper bound were provided. """
-        super().__init__("Either the lower or the upper bound is required!")
+        super().__init__()
 
+    def _format(self) -> str:
+        return "Either the lower or the upper bound is required!"
 
-class _InvalidBoundsError(PropertyError):
-    def __init__(self, which: str, expected_type: type, value: Any) -> None:
-        msg = (f"The {which} bound with value '{value}' is not of the "
-               f"expected type '{expected_type}'.")
-        super().__init__(msg)
 
+class _InvalidBoundsError(PropertyError):
+    which: str = ""
 
-class InvalidLowerBoundsError(_InvalidBoundsError):
     def __init__(self, **kwargs) -> None:
-        """ Raised, when the lower bound is of the wrong type.
-
-        :keyword type: The type that is expected.
-        :type type: type
-        :keyword value: The value that was provided as lower bound.
-        :type value: Any
-        """
         self.type = kwargs.get("type")
         self.value = kwargs.get("value")
-        if "type" not in kwargs or "value" not in kwargs:
-            super(Exception, self).__init__()
-            return
-        super().__init__("lower", self.type, self.value)
+        super().__init__()
+
+    def _format(self) -> str:
+        if self.type is None:
+            return ""
+        return (f"The {self.which} bound with value '{self.value}' is not of "
+                f"the expected type '{self.type}'.")
+
+
+class InvalidLowerBoundsError(_InvalidBoundsError):
+    """ Raised, when the lower bound is of the wrong type.
+
+    :keyword type: The type that is expected.
+    :type type: type
+    :keyword value: The value that was provided as lower bound.
+    :type value: Any
+    """
+    which = "lower"
 
 
 class InvalidUpperBoundsError(_InvalidBoundsError):
-    def __init__(self, **kwargs) -> None:
-        """ Raised, when the upper bound is of the wrong type.
+    """ Raised, when the upper bound is of the wrong type.
 
-        :keyword type: The type that is expected.
-        :type type: type
-        :keyword value: The value that was provided as upper bound.
-        :type value: Any
-        """
-        self.type = kwargs.get("type")
-        self.value = kwargs.get("value")
-        if "type" not in kwargs or "value" not in kwargs:
-            super(Exception, self).__init__()
-            return
-        super().__init__("upper", self.type, self.value)
+    :keyword type: The type that is expected.
+    :type type: type
+    :keyword value: The value that was provided as upper bound.
+    :type value: Any
+    """
+    which = "upper"
 
 
 class InvalidBoundOrderError(PropertyError):
@@ -260,32 +496,70 @@ class InvalidBoundOrderError(PropertyError):
         :type name: str
         """
         self.name = kwargs.get("name")
-        if "name" not in kwargs:
-            super().__init__()
-            return
-        super().__init__(f"The lower bound of the '{self.name}' "
-                         f"property is greater or equal to the upper bound.")
+        super().__init__()
+
+    def _format(self) -> str:
+        if self.name is None:
+            return ""
+        return (f"The lower bound of the '{self.name}' "
+                f"property is greater than the upper bound.")
 
 
 class InvalidChoiceError(PropertyError):
+    # The choices are only part of the message, if there are at most this many.
+    shown: int = 10
+
     def __init__(self, **kwargs) -> None:
-        """ Raised, when a value is set that is not a valid choice. """
+        """ Raised, when a value is set that is not a valid choice.
+
+        :keyword name: The name of the property.
+        :type name: str
+        :keyword value: The value the property is being set to.
+        :type value: Any
+        :keyword choices: The valid choices.
+        :type choices: list
+        :keyword prop: The property, which suggests similar choices.
+        :type prop: ChoicesProperty
+        """
         self.name = kwargs.get("name")
         self.value = kwargs.get("value")
         self.choices = kwargs.get("choices")
-        if any(map(lambda x: x not in kwargs, ["name", "value", "choices"])):
-            super().__init__()
-            return
-        super().__init__(f"The value {self.value} is not a valid choice. ({self.choices})")
+        self.prop = kwargs.get("prop")
+        self._suggestions: list | None = None
+        super().__init__()
+
+    @property
+    def suggestions(self) -> list:
+        """ The choices that are similar to the value, if any. """
+        if self._suggestions is None:
+            self._suggestions = (self.prop.suggest(self.value)
+                                 if self.prop is not None else [])
+        return self._suggestions
+
+    def _format(self) -> str:
+        if self.name is None or self.choices is None:
+            return ""
+        message = (f"The value {self.value!r} is not a valid choice for the "
+                   f"property '{self.name}'.")
+        if self.suggestions:
+            suggestions = ", ".join(map(repr, self.suggestions))
+            message += f" Did you mean {suggestions}?"
+        if len(self.choices) <= self.shown:
+            message += f" ({self.choices})"
+        return message
 
 
 class InvalidChoicesTypeError(PropertyError):
     # TODO: Check if using a prop here instead of kwargs like with the others raises some issues.
     def __init__(self, prop: ChoicesProperty | None = None) -> None:
         """ Raised, when the given choices are not of the correct type. """
-        if not prop:
-            super().__init__()
-            return
-        types = [f"{a}: {type(a)}" for a in prop.choices]
-        super().__init__(f"At least one of the given choices ({types}) of the property "
-                         f"'{prop.name}' is not of the correct type '{prop.type}'.")
+        self.prop = prop
+        super().__init__()
+
+    def _format(self) -> str:
+        if not self.prop:
+            return ""
+        types = [f"{a}: {type(a)}" for a in self.prop.choices]
+        return (f"At least one of the given choices ({types}) of the "
+                f"property '{self.prop.name}' is not of the correct type "
+                f"'{self.prop.type}'.")
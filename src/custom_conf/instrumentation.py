@@ -0,0 +1,75 @@
+""" Optional instrumentation of loading a config.
+
+Pass an Instrumentation object to a config to record how long each phase
+of its construction and loading took, how long reading each file took and
+how much time was spent on validating (and coercing) each property.
+"""
+
+from __future__ import annotations
+
+import json
+from contextlib import contextmanager
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, Iterator
+
+# Called with the kind of the record ('span', 'file' or 'property') and
+# the record itself.
+InstrumentationCallback = Callable[[str, dict[str, Any]], None]
+
+
+class Instrumentation:
+    """ Collects timings of a config. """
+
+    def __init__(self, callback: InstrumentationCallback | None = None
+                 ) -> None:
+        self.callback = callback
+        self.spans: list[dict[str, Any]] = []
+        self.files: list[dict[str, Any]] = []
+        self.properties: dict[str, dict[str, Any]] = {}
+
+    def _emit(self, kind: str, record: dict[str, Any]) -> None:
+        if self.callback is not None:
+            self.callback(kind, record)
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """ Measure the time spent in the with-block as the given phase. """
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            record = {"name": name, "seconds": perf_counter() - start}
+            self.spans.append(record)
+            self._emit("span", record)
+
+    def record_file(self, path: Path, size: int, seconds: float) -> None:
+        """ Record that reading and parsing a file took the given time. """
+        record = {"path": str(path), "bytes": size, "seconds": seconds}
+        self.files.append(record)
+        self._emit("file", record)
+
+    def record_property(self, name: str, seconds: float) -> None:
+        """ Record that validating a value of a property took the given time.
+        """
+        record = self.properties.setdefault(
+            name, {"name": name, "count": 0, "seconds": 0.})
+        record["count"] += 1
+        record["seconds"] += seconds
+        self._emit("property", record)
+
+    def reset(self) -> None:
+        self.spans.clear()
+        self.files.clear()
+        self.properties.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """ Return all records, e.g. to compare them between deployments. """
+        return {"spans": [dict(span) for span in self.spans],
+                "files": [dict(file) for file in self.files],
+                "properties": {name: dict(record)
+                               for name, record in self.properties.items()}}
+
+    def to_json(self, **kwargs) -> str:
+        """ Return the stats as JSON. Any kwargs are passed to json.dumps. """
+        return json.dumps(self.stats(), **kwargs)
@@ -0,0 +1,172 @@
+""" Properties for large lists of bounded numbers, e.g. weights or tables.
+
+The values are stored as array.array, or as numpy array, if numpy is
+installed (pip install custom_conf[numpy]). The whole list is converted in
+one pass and the bounds are checked with a single comparison over all
+elements. Only if that fails, the elements are checked one by one, to
+report the indices of the invalid elements.
+"""
+
+from __future__ import annotations
+
+from array import array
+from itertools import chain
+from typing import Any, Sequence
+
+import custom_conf.errors as err
+from custom_conf.properties.bounded_property import (
+    BoundedProperty, FloatBoundedProperty, IntBoundedProperty,
+    )
+from custom_conf.properties.property import Property
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+BACKENDS: tuple[str, ...] = ("array", "numpy") if np is not None else (
+    "array",)
+
+
+def _resolve_backend(name: str) -> str:
+    if name == "auto":
+        return "numpy" if np is not None else "array"
+    if name not in BACKENDS:
+        raise err.UnknownArrayBackendError(name=name, backends=list(BACKENDS))
+    return name
+
+
+class BoundedArrayProperty(Property):
+    """ Property, whose value is a list of numbers within the bounds of the
+    element property.
+
+    Elements, which the array type accepts, are converted by it (e.g. ints
+    to floats). Other elements are coerced like the values of the element
+    property, e.g. strings to numbers.
+    """
+    __slots__ = ("element", "typecode", "backend")
+
+    def __init__(self, name: str, element: BoundedProperty, typecode: str,
+                 backend: str = "auto") -> None:
+        """
+        :param element: The property each element is validated with.
+        :param typecode: The array.array typecode used to store the elements.
+        :param backend: Either 'array', 'numpy' or 'auto', which uses numpy,
+            if it is installed.
+        """
+        super().__init__(name, list)
+        self.element = element
+        self.typecode = typecode
+        self.backend = _resolve_backend(backend)
+
+    @property
+    def lower(self) -> Any:
+        return self.element.lower
+
+    @lower.setter
+    def lower(self, value: Any) -> None:
+        self.element.lower = value
+
+    @property
+    def upper(self) -> Any:
+        return self.element.upper
+
+    @upper.setter
+    def upper(self, value: Any) -> None:
+        self.element.upper = value
+
+    def schema_key(self) -> tuple:
+        return (super().schema_key() + self.element.schema_key()
+                + (self.typecode, self.backend))
+
+    def _convert(self, value: Any) -> tuple[Any, err.PropertyError | None]:
+        if np is not None and isinstance(value, np.ndarray):
+            try:
+                if value.ndim == 1:
+                    return self._to_backend(value.astype(
+                        self.typecode, casting="safe")), None
+            except TypeError:
+                pass
+            value = value.tolist()
+        if not isinstance(value, (list, tuple, array)):
+            return value, err.InvalidPropertyTypeError(prop=self,
+                                                       type=type(value))
+        try:
+            values = array(self.typecode, value)
+        except (TypeError, ValueError, OverflowError):
+            values, errors = self._convert_elements(value)
+            if errors:
+                return value, err.InvalidElementsError(prop=self,
+                                                       errors=errors)
+        return self._to_backend(values), None
+
+    def _convert_elements(self, value: Sequence
+                          ) -> tuple[array, dict[int, err.PropertyError]]:
+        """ Convert the elements one by one and collect their errors. """
+        values = array(self.typecode)
+        errors = {}
+        for index, item in enumerate(value):
+            item, error = self.element._convert(item)
+            if error is None:
+                try:
+                    values.append(item)
+                except (TypeError, ValueError, OverflowError):
+                    error = err.InvalidCoercionError(prop=self.element,
+                                                     value=item)
+            if error is not None:
+                errors[index] = error
+        return values, errors
+
+    def _to_backend(self, values: Any) -> Any:
+        if self.backend == "array":
+            if isinstance(values, array):
+                return values
+            return array(self.typecode, values.tobytes())
+        if isinstance(values, array):
+            return np.frombuffer(values, self.typecode)
+        return values
+
+    def _validation_error(self, value: Any) -> err.PropertyError | None:
+        lower, upper = self.lower, self.upper
+        if np is not None and isinstance(value, np.ndarray):
+            mask = np.zeros(len(value), bool)
+            if lower is not None:
+                mask |= value < lower
+            if upper is not None:
+                mask |= value > upper
+            if not mask.any():
+                return None
+            indices = np.flatnonzero(mask).tolist()
+        else:
+            # The bound is the first value, so that a leading nan can not
+            # hide smaller (greater) values from min (max).
+            if not ((lower is not None and min(chain((lower,), value)) < lower)
+                    or (upper is not None
+                        and max(chain((upper,), value)) > upper)):
+                return None
+            indices = [index for index, item in enumerate(value)
+                       if (lower is not None and item < lower)
+                       or (upper is not None and item > upper)]
+        return err.OutOfBoundsElementsError(prop=self, value=value,
+                                            indices=indices)
+
+
+class IntArrayProperty(BoundedArrayProperty):
+    """ Bounded array property of (64 bit) ints. """
+    __slots__ = ()
+
+    def __init__(self, name: str, lower: int = None, upper: int = None,
+                 backend: str = "auto") -> None:
+        super().__init__(name, IntBoundedProperty(name, lower, upper), "q",
+                         backend)
+
+
+class FloatArrayProperty(BoundedArrayProperty):
+    """ Bounded array property of (64 bit) floats. """
+    __slots__ = ()
+
+    def __init__(self, name: str, lower: float = None, upper: float = None,
+                 backend: str = "auto") -> None:
+        super().__init__(name, FloatBoundedProperty(name, lower, upper), "d",
+                         backend)
@@ -1,92 +1,137 @@
 from __future__ import annotations
 
 import abc
-from typing import Any, Optional, Type
+from typing import Any, Mapping
 
 import custom_conf.errors as err
 from custom_conf.properties.coercible_property import (
-    FloatProperty, IntProperty,
+    CoercableProperty, Coercer, Converter,
     )
-from custom_conf.properties.property import Property
 
 
-class BoundedProperty(Property, abc.ABC):
-    """ Used for properties with bounded values (closed interval). """
-
-    def __init__(
-            self, name: str, attr_type: type, lower=None, upper=None) -> None:
-        # Subclasses must call self._initialize_bounds.
-        super().__init__(name, attr_type)
+class BoundedProperty(CoercableProperty, abc.ABC):
+    """ Used for properties with bounded values (closed interval).
+
+    The bounds are coerced and validated once, when they are set, and are
+    stored as plain values.
+    """
+    __slots__ = ("_lower", "_upper")
+    # Whether try_parse can use the fused path. Subclasses, which override
+    # _convert, _validation_error or _bounds_error (or any of the public
+    # hooks, see Property._hooked), use the generic path instead.
+    _fused: bool = True
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._fused = not cls._hooked and all(
+            getattr(cls, name) is getattr(BoundedProperty, name)
+            for name in ("_convert", "_validation_error", "_bounds_error"))
+
+    def __init__(self, name: str, attr_type: type, lower=None, upper=None,
+                 converter: Mapping[type, Converter] | Coercer | None = None
+                 ) -> None:
+        super().__init__(name, attr_type, converter)
+        self._lower = None
+        self._upper = None
         self.lower = lower
         self.upper = upper
 
     @property
     def lower(self) -> Any:
-        if not self._lower:
-            return None
-        # noinspection PyTypeChecker
-        return self._lower.__get__(self)
+        return self._lower
 
     @lower.setter
     def lower(self, value: Any):
-        if value is None:
-            self._lower = None
-            return
-        self._lower.__set__(self, value)
+        lower = self._parse_bound(value, err.InvalidLowerBoundsError)
+        self._validate_bound_order(lower, self._upper)
+        self._lower = lower
 
     @property
     def upper(self) -> Any:
-        if not self._upper:
-            return None
-        # noinspection PyTypeChecker
-        return self._upper.__get__(self)
+        return self._upper
 
     @upper.setter
     def upper(self, value: Any):
-        if value is None:
-            self._upper = None
-            return
-        self._upper.__set__(self, value)
+        upper = self._parse_bound(value, err.InvalidUpperBoundsError)
+        self._validate_bound_order(self._lower, upper)
+        self._upper = upper
 
-    def _initialize_bounds(
-            self, prop: Optional[Type[Property]], *args) -> None:
-        self._lower = prop("_lower", *args) if prop else prop
-        self._upper = prop("_upper", *args) if prop else prop
-        self._value = prop("_value", *args) if prop else prop
+    def _parse_bound(self, value: Any, error_cls: type) -> Any:
+        if value is None:
+            return None
+        bound, error = self._convert(value)
+        if error is None:
+            error = super()._validation_error(bound)
+        if error is not None:
+            raise error_cls(type=self.type, value=value) from error
+        return bound
+
+    def _validate_bound_order(self, lower: Any, upper: Any) -> None:
+        if lower is not None and upper is not None and lower > upper:
+            raise err.InvalidBoundOrderError(name=self.name)
+
+    def schema_key(self) -> tuple:
+        return super().schema_key() + (repr(self.lower), repr(self.upper))
+
+    def _bounds_error(self, value: Any) -> err.PropertyError | None:
+        upper_oob = self._upper is not None and value > self._upper
+        lower_oob = self._lower is not None and value < self._lower
+        if upper_oob or lower_oob:
+            return err.OutOfBoundsPropertyError(prop=self, value=value)
+        return None
 
     def _validate_within_bounds(self, value: Any):
         """ Check if the given value is between the bounds. """
-        upper_oob = self.upper is not None and value > self.upper
-        lower_oob = self.lower is not None and value < self.lower
-        if upper_oob or lower_oob:
-            raise err.OutOfBoundsPropertyError(prop=self, value=value)
+        if (error := self._bounds_error(value)) is not None:
+            raise error
 
-    def validate(self, value: Any) -> None:
+    def _validation_error(self, value: Any) -> err.PropertyError | None:
         """ Checks if the value is within bounds. """
-        super().validate(value)
-        self._validate_within_bounds(value)
-
-    def __set__(self, obj, value: Any):
-        try:
-            self._value.__set__(self, value)
-            # noinspection PyTypeChecker
-            value = self._value.__get__(self)
-        except err.PropertyError:
-            raise err.InvalidPropertyTypeError(prop=self, type=type(value))
-        super().__set__(obj, value)
+        error = super()._validation_error(value)
+        return error if error is not None else self._bounds_error(value)
+
+    def try_parse(self, value: Any) -> tuple[Any, err.PropertyError | None]:
+        # Fused coerce, type check and range check. Coercion results of the
+        # properties type, and values of exactly that type, are valid types.
+        # Anything else takes the generic path, which also builds the errors.
+        if not self._fused:
+            return super().try_parse(value)
+        if type(value) is not self.type:
+            converter = self.coercer.lookup(type(value))
+            if converter is None or isinstance(value, self.type):
+                return super().try_parse(value)
+            try:
+                converted = converter(value)
+            except (err.PropertyError, TypeError, ValueError,
+                    ArithmeticError):
+                return super().try_parse(value)
+            if type(converted) is not self.type:
+                return super().try_parse(value)
+            value = converted
+        if ((self._upper is not None and value > self._upper)
+                or (self._lower is not None and value < self._lower)):
+            return value, err.OutOfBoundsPropertyError(prop=self, value=value)
+        return value, None
+
+    def _convert(self, value: Any) -> tuple[Any, err.PropertyError | None]:
+        converted, error = super()._convert(value)
+        if error is not None:
+            return value, err.InvalidPropertyTypeError(prop=self,
+                                                       type=type(value))
+        return converted, None
 
 
 class FloatBoundedProperty(BoundedProperty):
     """ Bounded property of type float. """
+    __slots__ = ()
 
     def __init__(self, name, lower: float = None, upper: float = None) -> None:
-        self._initialize_bounds(FloatProperty)
         super().__init__(name, float, lower, upper)
 
 
 class IntBoundedProperty(BoundedProperty):
     """ Bounded property of type int. """
+    __slots__ = ()
 
     def __init__(self, name, lower: int = None, upper: int = None) -> None:
-        self._initialize_bounds(IntProperty)
         super().__init__(name, int, lower, upper)
@@ -1,24 +1,143 @@
-from typing import Any
+from __future__ import annotations
+
+from collections import Counter
+from difflib import get_close_matches
+from typing import Any, Callable, Hashable
 
 import custom_conf.errors as err
 from custom_conf.properties.property import Property
 
 
+# How many of the choices, which share the most trigrams with an invalid
+# value, are compared with it to find the suggestions.
+SUGGESTION_CANDIDATES = 10
+
+_MISSING = object()
+
+
+def _trigrams(key: str) -> set[str]:
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
 class ChoicesProperty(Property):
-    def __init__(self, name: str, attr_type: type, choice: list) -> None:
+    """ Property, whose value has to be one of the given choices.
+
+    The choices are indexed once by their (normalized) value, so checking a
+    value takes constant time, regardless of the number of choices.
+    Unhashable choices are compared one by one instead.
+    """
+    __slots__ = ("_choices", "normalize", "_index", "_unhashable",
+                 "_trigram_index")
+
+    def __init__(self, name: str, attr_type: type, choice: list,
+                 normalize: Callable[[Any], Any] | None = None) -> None:
+        """
+        :param normalize: If given, values match the choice with the same
+            normalized value (e.g. str.casefold to ignore the case), and
+            the property is set to that choice.
+        """
         super().__init__(name, attr_type)
         self._choices = choice
+        self.normalize = normalize
+        self._index: dict[Hashable, Any] = {}
+        self._unhashable: list[tuple[Any, Any]] = []
+        # Built on the first invalid value, see suggest.
+        self._trigram_index: dict[str, list[str]] | None = None
         self.validate_choices_type()
 
     @property
     def choices(self) -> list:
         return self._choices
 
+    def schema_key(self) -> tuple:
+        normalize = getattr(self.normalize, "__qualname__",
+                            repr(self.normalize))
+        return super().schema_key() + (repr(self.choices), normalize)
+
     def validate_choices_type(self) -> None:
-        if any(map(lambda c: not isinstance(c, self.type), self.choices)):
+        """ Check the type of the choices and build their index. """
+        if not all(map(self._type_validator, self.choices)):
             raise err.InvalidChoicesTypeError(self)
+        keys = (self.choices if self.normalize is None
+                else list(map(self.normalize, self.choices)))
+        unhashable: list[tuple[Any, Any]] = []
+        try:
+            # Reversed, so the first of the choices with equal keys is used.
+            index = dict(zip(reversed(keys), reversed(self.choices)))
+        except TypeError:
+            index = {}
+            for key, choice in zip(keys, self.choices):
+                try:
+                    index.setdefault(key, choice)
+                except TypeError:
+                    unhashable.append((key, choice))
+        self._index, self._unhashable = index, unhashable
+        self._trigram_index = None
+
+    def _key(self, value: Any) -> Any:
+        return value if self.normalize is None else self.normalize(value)
+
+    def _lookup(self, value: Any) -> tuple[bool, Any]:
+        """ Return whether the value is a valid choice and the choice. """
+        try:
+            key = self._key(value)
+        except (TypeError, ValueError, AttributeError):
+            return False, value
+        try:
+            choice = self._index.get(key, _MISSING)
+        except TypeError:
+            choice = _MISSING
+        if choice is _MISSING:
+            for other_key, other_choice in self._unhashable:
+                if key == other_key:
+                    return True, other_choice
+            return False, value
+        return True, choice
+
+    def _convert(self, value: Any) -> tuple[Any, err.PropertyError | None]:
+        value, error = super()._convert(value)
+        if error is None and self.normalize is not None:
+            # Store the choice, instead of the value matching it.
+            value = self._lookup(value)[1]
+        return value, error
+
+    def _validation_error(self, value: Any) -> err.PropertyError | None:
+        error = super()._validation_error(value)
+        if error is None and not self._lookup(value)[0]:
+            error = err.InvalidChoiceError(name=self.name, value=value,
+                                           choices=self.choices, prop=self)
+        return error
+
+    def suggest(self, value: Any, count: int = 3) -> list:
+        """ Return up to count choices, which are similar to the value.
 
-    def validate(self, value: Any) -> None:
-        super().validate(value)
-        if value not in self.choices:
-            raise err.InvalidChoiceError
+        Only the choices sharing the most (uncommon) trigrams with the
+        value are compared with it, so not every choice is scanned.
+        """
+        try:
+            key = self._key(value)
+        except (TypeError, ValueError, AttributeError):
+            return []
+        if not isinstance(key, str):
+            return []
+        if self._trigram_index is None:
+            trigram_index: dict[str, list[str]] = {}
+            for choice_key in self._index:
+                if isinstance(choice_key, str):
+                    for trigram in _trigrams(choice_key):
+                        trigram_index.setdefault(trigram, []).append(
+                            choice_key)
+            self._trigram_index = trigram_index
+        # Trigrams shared by many choices (e.g. a common prefix) are skipped,
+        # unless the value has no others.
+        postings = [self._trigram_index.get(trigram, ())
+                    for trigram in _trigrams(key)]
+        limit = max(SUGGESTION_CANDIDATES, len(self._index) // 10)
+        hits: Counter[str] = Counter()
+        for posting in [p for p in postings if len(p) <= limit] or postings:
+            hits.update(posting)
+        candidates = [candidate for candidate, _
+                      in hits.most_common(SUGGESTION_CANDIDATES)]
+        return [self._index[match]
+                for match in get_close_matches(key, candidates, count)]
@@ -1,61 +1,113 @@
-from typing import Any, Callable, TypeVar
+from datetime import timedelta
+from decimal import Decimal
+from typing import Any, Mapping, TypeVar
 
 import custom_conf.errors as err
+from custom_conf.properties.coercion import (  # noqa: F401
+    BYTE_SIZE_COERCER, Coercer, Converter, float_to_int, get_coercer,
+    str_to_float, str_to_int,
+    )
 from custom_conf.properties.property import Property
 
 T = TypeVar("T")
 
 
-def str_to_float(value: str) -> float:
-    return float(value)
-
-
-def float_to_int(value: float) -> int:
-    if value.is_integer():
-        return int(value)
-    raise err.LossOfPrecisionError(type=int, value=value)
-
+class CoercableProperty(Property):
+    """ Property, which converts values of other types to its type.
 
-def str_to_int(value: str) -> int:
-    return float_to_int(str_to_float(value))
+    By default, the coercer shared by all properties of the type is used
+    (see coercion.register_converter).
+    """
+    __slots__ = ("coercer",)
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._hooked |= (cls.coerce_if_coercible
+                        is not CoercableProperty.coerce_if_coercible)
 
-class CoercableProperty(Property):
     def __init__(self,
                  name: str,
                  attr_type: T,
-                 converter: dict[type: Callable[[Any], T]]) -> None:
+                 converter: Mapping[type, Converter] | Coercer | None = None
+                 ) -> None:
         super().__init__(name, attr_type)
-        self.converter = converter
+        if converter is None:
+            converter = get_coercer(attr_type)
+        elif not isinstance(converter, Coercer):
+            converter = Coercer(attr_type, converter)
+        self.coercer: Coercer = converter
+
+    @property
+    def converter(self) -> Mapping[type, Converter]:
+        return self.coercer.converters
 
     def _coerce(self, value: Any) -> T:
+        value, error = self._convert(value)
+        if error is not None:
+            raise error
+        return value
+
+    def _convert(self, value: Any) -> tuple[Any, err.PropertyError | None]:
+        if isinstance(value, self.type):
+            return value, None
+        converter = self.coercer.lookup(type(value))
+        if converter is None:
+            return value, err.InvalidPropertyTypeError(prop=self,
+                                                       type=type(value))
         try:
-            return self.converter[type(value)](value)
+            return converter(value), None
         except err.PropertyError as e:
-            raise err.InvalidCoercionError(prop=self, value=value) from e
-        except (TypeError, ValueError, OverflowError):
-            pass
-        raise err.InvalidCoercionError(prop=self, value=value)
+            error = err.InvalidCoercionError(prop=self, value=value)
+            error.__cause__ = e
+        except (TypeError, ValueError, ArithmeticError):
+            error = err.InvalidCoercionError(prop=self, value=value)
+        return value, error
 
     def coerce_if_coercible(self, value: Any) -> T:
-        if isinstance(value, self.type):
-            return value
-        if isinstance(value, tuple(self.converter.keys())):
-            return self._coerce(value)
-        raise err.InvalidPropertyTypeError(prop=self, type=type(value))
+        return self._coerce(value)
 
-    def __set__(self, obj, raw_value: Any) -> None:
-        value: T = self.coerce_if_coercible(raw_value)
-        super().__set__(obj, value)
+    def _convert_with_hooks(self, value: Any) -> Any:
+        return self.coerce_if_coercible(value)
+
+    def schema_key(self) -> tuple:
+        converters = tuple(
+            (source.__qualname__, getattr(func, "__qualname__", repr(func)))
+            for source, func in self.converter.items())
+        return super().schema_key() + converters
 
 
 class IntProperty(CoercableProperty):
+    __slots__ = ()
+
     def __init__(self, name) -> None:
-        converter = {float: float_to_int, str: str_to_int}
-        super().__init__(name, int, converter)
+        super().__init__(name, int)
 
 
 class FloatProperty(CoercableProperty):
+    __slots__ = ()
+
+    def __init__(self, name) -> None:
+        super().__init__(name, float)
+
+
+class DecimalProperty(CoercableProperty):
+    __slots__ = ()
+
+    def __init__(self, name) -> None:
+        super().__init__(name, Decimal)
+
+
+class TimedeltaProperty(CoercableProperty):
+    """ Durations, e.g. '1h 30m', '250ms', '01:30:00' or seconds. """
+    __slots__ = ()
+
+    def __init__(self, name) -> None:
+        super().__init__(name, timedelta)
+
+
+class ByteSizeProperty(CoercableProperty):
+    """ Sizes in bytes, e.g. '512MiB' or '2GB'. The value is an int. """
+    __slots__ = ()
+
     def __init__(self, name) -> None:
-        converter = {int: float, str: str_to_float}
-        super().__init__(name, float, converter)
+        super().__init__(name, int, BYTE_SIZE_COERCER)
@@ -0,0 +1,218 @@
+""" Conversion of values to the type of a coercible property.
+
+Each target type has one Coercer, which is shared by all properties of that
+type. A Coercer looks up the converter of a value by the type of the value,
+its base classes (e.g. bool uses the converter for int) and abstract
+classes (e.g. numbers.Real), and caches the result per type.
+
+New conversions can be added with register_converter, for example:
+
+    register_converter(Path, str, Path)
+"""
+
+from __future__ import annotations
+
+import abc
+import numbers
+import operator
+import re
+from datetime import timedelta
+from decimal import Decimal, InvalidOperation
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
+
+import custom_conf.errors as err
+
+
+Converter = Callable[[Any], Any]
+# The default limit of the digits of ints parsed from strings.
+MAX_INT_DIGITS = 4300
+
+
+class Coercer:
+    """ Converts values of other types to the target type. """
+    __slots__ = ("target", "_converters", "_cache")
+
+    def __init__(self, target: type,
+                 converters: Mapping[type, Converter] | None = None) -> None:
+        self.target = target
+        self._converters: dict[type, Converter] = dict(converters or {})
+        self._cache: dict[type, Converter | None] = {}
+
+    @property
+    def converters(self) -> Mapping[type, Converter]:
+        """ The registered converters by the type they convert from. """
+        return MappingProxyType(self._converters)
+
+    def register(self, source: type, converter: Converter) -> None:
+        """ Use the converter for values of the source type and its
+        subclasses, unless they have a converter of their own. """
+        self._converters[source] = converter
+        # Replace the cache, instead of clearing it, for concurrent lookups.
+        self._cache = {}
+
+    def lookup(self, source: type) -> Converter | None:
+        """ Return the converter for values of the given type, if any. """
+        try:
+            return self._cache[source]
+        except KeyError:
+            pass
+        converter = self._resolve(source)
+        self._cache[source] = converter
+        return converter
+
+    def _resolve(self, source: type) -> Converter | None:
+        for cls in source.__mro__:
+            if cls in self._converters:
+                return self._converters[cls]
+        for cls, converter in self._converters.items():
+            if isinstance(cls, abc.ABCMeta) and issubclass(source, cls):
+                return converter
+        return None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.target.__qualname__})"
+
+
+_coercers: dict[type, Coercer] = {}
+
+
+def get_coercer(target: type) -> Coercer:
+    """ Return the (shared) coercer for the target type. """
+    try:
+        return _coercers[target]
+    except KeyError:
+        return _coercers.setdefault(target, Coercer(target))
+
+
+def register_converter(target: type, source: type,
+                       converter: Converter) -> None:
+    """ Convert values of the source type to the target type, using the
+    converter, for all properties of the target type. """
+    get_coercer(target).register(source, converter)
+
+
+##############
+# Converters #
+##############
+
+
+def str_to_float(value: str) -> float:
+    return float(value)
+
+
+def float_to_int(value: float) -> int:
+    if value.is_integer():
+        return int(value)
+    raise err.LossOfPrecisionError(type=int, value=value)
+
+
+def str_to_int(value: str) -> int:
+    whole, _, fraction = value.partition(".")
+    if not fraction.rstrip().rstrip("0"):
+        # Ints, optionally with zero decimals, e.g. '12' or '12.0'.
+        try:
+            return int(whole)
+        except ValueError:
+            pass
+    # Decimal instead of float, to not lose precision, e.g. for '1e30'.
+    try:
+        number = Decimal(value)
+    except InvalidOperation:
+        raise ValueError(f"Invalid int '{value}'.") from None
+    if not number.is_finite() or number != number.to_integral_value():
+        raise err.LossOfPrecisionError(type=int, value=value)
+    # Like int(), refuse to create huge ints, e.g. for '1e999999999'.
+    if number.adjusted() >= MAX_INT_DIGITS:
+        raise ValueError(f"The int '{value}' has too many digits.")
+    return int(number)
+
+
+def float_to_decimal(value: float) -> Decimal:
+    # The shortest representation, e.g. Decimal("0.1") for 0.1.
+    return Decimal(repr(value))
+
+
+def str_to_decimal(value: str) -> Decimal:
+    try:
+        return Decimal(value.strip())
+    except InvalidOperation:
+        raise ValueError(f"Invalid decimal '{value}'.") from None
+
+
+_DURATION_UNITS = {"w": "weeks", "d": "days", "h": "hours", "m": "minutes",
+                   "s": "seconds", "ms": "milliseconds",
+                   "us": "microseconds"}
+_DURATION_PART = re.compile(r"\s*(\d+(?:\.\d*)?|\.\d+)\s*(ms|us|[wdhms])",
+                            re.IGNORECASE)
+
+
+def seconds_to_timedelta(value: float) -> timedelta:
+    return timedelta(seconds=value)
+
+
+def str_to_timedelta(value: str) -> timedelta:
+    """ Parse durations like '90', '1.5h', '1d 2h 30m', '250ms' or
+    '[-]HH:MM:SS[.ffffff]'. Plain numbers are seconds. """
+    text = value.strip()
+    sign = -1 if text.startswith("-") else 1
+    text = text.lstrip("+-")
+    if ":" in text:
+        hours, minutes, seconds = (text.split(":") + ["0"])[:3]
+        return sign * timedelta(hours=int(hours), minutes=int(minutes),
+                                seconds=float(seconds))
+    if text[-1:].isdigit():
+        return sign * timedelta(seconds=float(text))
+    parts, end = {}, 0
+    for match in _DURATION_PART.finditer(text):
+        if match.start() != end:
+            break
+        unit = _DURATION_UNITS[match.group(2).lower()]
+        parts[unit] = parts.get(unit, 0) + float(match.group(1))
+        end = match.end()
+    if not parts or text[end:].strip():
+        raise ValueError(f"Invalid duration '{value}'.")
+    return sign * timedelta(**parts)
+
+
+_BYTE_UNITS = {"": 1, "b": 1,
+               "k": 1000, "kb": 1000, "kib": 1024,
+               "m": 1000 ** 2, "mb": 1000 ** 2, "mib": 1024 ** 2,
+               "g": 1000 ** 3, "gb": 1000 ** 3, "gib": 1024 ** 3,
+               "t": 1000 ** 4, "tb": 1000 ** 4, "tib": 1024 ** 4,
+               "p": 1000 ** 5, "pb": 1000 ** 5, "pib": 1024 ** 5}
+_BYTE_SIZE = re.compile(r"\s*(\d+(?:\.\d*)?|\.\d+)\s*([a-z]*)\s*",
+                        re.IGNORECASE)
+
+
+def str_to_byte_size(value: str) -> int:
+    """ Parse sizes like '512', '1.5 KiB', '512MiB' or '2GB' to bytes.
+    Decimal units (KB) are powers of 1000, binary units (KiB) of 1024. """
+    match = _BYTE_SIZE.fullmatch(value)
+    unit = _BYTE_UNITS.get(match.group(2).lower()) if match else None
+    if unit is None:
+        raise ValueError(f"Invalid byte size '{value}'.")
+    size = Decimal(match.group(1)) * unit
+    if size != size.to_integral_value():
+        raise err.LossOfPrecisionError(type=int, value=value)
+    return int(size)
+
+
+register_converter(int, float, float_to_int)
+register_converter(int, str, str_to_int)
+# E.g. numpy integers, which are no subclasses of int.
+register_converter(int, numbers.Integral, operator.index)
+register_converter(float, int, float)
+register_converter(float, str, str_to_float)
+register_converter(float, numbers.Real, float)
+register_converter(Decimal, int, Decimal)
+register_converter(Decimal, float, float_to_decimal)
+register_converter(Decimal, str, str_to_decimal)
+register_converter(timedelta, int, seconds_to_timedelta)
+register_converter(timedelta, float, seconds_to_timedelta)
+register_converter(timedelta, str, str_to_timedelta)
+
+# Byte sizes are ints, so they have their own coercer, instead of the one
+# of the int properties.
+BYTE_SIZE_COERCER = Coercer(int, {float: float_to_int, str: str_to_byte_size,
+                                  numbers.Integral: operator.index})
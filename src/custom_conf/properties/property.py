@@ -8,9 +8,8 @@ from __future__ import annotations
 
 from typing import (Any, TYPE_CHECKING, TypeVar)
 
-from typeguard import check_type, TypeCheckError
-
 import custom_conf.errors as err
+from custom_conf.properties.validators import compile_type_validator
 
 if TYPE_CHECKING:
     from custom_conf.config import BaseConfig  # noqa: F401
@@ -19,13 +18,41 @@ CType = TypeVar("CType", bound="BaseConfig")
 
 
 class Property:
-    """ Base class for config properties. """
+    """ Base class for config properties.
+
+    Properties use __slots__, to keep their footprint small. Subclasses
+    should define __slots__ for their own attributes as well.
+    """
+    __slots__ = ("cls", "name", "attr", "type", "_type_validator")
+    # Whether try_parse has to use the public hooks (e.g. validate), because
+    # the subclass overrides them. Otherwise, _convert and _validation_error
+    # are used directly.
+    _hooked: bool = False
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._hooked = any(getattr(cls, name) is not getattr(Property, name)
+                          for name in ("validate", "_validate_type"))
 
     def __init__(self, name: str, attr_type: type) -> None:
         self.cls: CType | None = None
         self.name: str = name
         self.attr: str = "__" + name
         self.type: type = attr_type
+        self._type_validator = compile_type_validator(attr_type)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # The compiled type validator is a closure, which can not be
+        # pickled. It is compiled again, when the property is unpickled.
+        return {name: getattr(self, name)
+                for cls in type(self).__mro__
+                for name in getattr(cls, "__slots__", ())
+                if name != "_type_validator" and hasattr(self, name)}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._type_validator = compile_type_validator(self.type)
 
     def __get__(self, obj: CType, objtype=None) -> Any:
         try:
@@ -36,23 +63,110 @@ class Property:
             raise err.QueriedBeforeSetError(prop=self)
 
     def __set__(self, obj, value: Any):
-        self.validate(value)
-        setattr(obj, self.attr, value)
+        value, error = self.try_parse(value)
+        if error is not None:
+            raise error
+        # The stored value is no descriptor, so skip the attribute hooks.
+        object.__setattr__(obj, self.attr, value)
 
     def _raise_type_error(self, typ: type) -> None:
         raise err.InvalidPropertyTypeError(prop=self, type=typ)
 
     def _validate_type(self, value: Any) -> None:
-        try:
-            check_type(value, self.type)
-        except TypeCheckError:
+        if not self._type_validator(value):
             raise err.InvalidPropertyTypeError(prop=self, type=type(value))
 
+    def _convert(self, value: Any) -> tuple[Any, err.PropertyError | None]:
+        """ Convert the value to the value that would be stored.
+
+        Subclasses can override this to e.g. coerce values.
+        :return: The converted value and the error, if it can't be converted.
+        """
+        return value, None
+
+    def _validation_error(self, value: Any) -> err.PropertyError | None:
+        """ Return the error of an (already converted) invalid value.
+
+        Subclasses can override this to add further checks.
+        """
+        if self._hooked:
+            try:
+                self._validate_type(value)
+            except err.PropertyError as error:
+                return error
+            return None
+        if not self._type_validator(value):
+            return err.InvalidPropertyTypeError(prop=self, type=type(value))
+        return None
+
     def validate(self, value: Any) -> None:
         """ Check if there are any obvious errors with the value. """
-        self._validate_type(value)
+        if (error := self._validation_error(value)) is not None:
+            raise error
+
+    def try_parse(self, value: Any) -> tuple[Any, err.PropertyError | None]:
+        """ Like parse, but returns the error instead of raising it.
+
+        :return: The value that would be stored and the error, if the value
+            is invalid for this property.
+        """
+        if self._hooked:
+            return self._parse_with_hooks(value)
+        value, error = self._convert(value)
+        if error is None:
+            error = self._validation_error(value)
+        return value, error
+
+    def _convert_with_hooks(self, value: Any) -> Any:
+        """ Return the converted value, using the public hooks.
+
+        :raises PropertyError: If the value can not be converted.
+        """
+        value, error = self._convert(value)
+        if error is not None:
+            raise error
+        return value
+
+    def _parse_with_hooks(self, value: Any
+                          ) -> tuple[Any, err.PropertyError | None]:
+        try:
+            converted = self._convert_with_hooks(value)
+            self.validate(converted)
+        except err.PropertyError as error:
+            return value, error
+        return converted, None
+
+    def parse(self, value: Any) -> Any:
+        """ Return the value that is stored, when the property is set to the
+        given value. Does not modify the config.
+
+        :raises PropertyError: If the value is invalid for this property.
+        """
+        value, error = self.try_parse(value)
+        if error is not None:
+            raise error
+        return value
+
+    def check(self, value: Any) -> err.PropertyError | None:
+        """ Return the error that setting the property to the given value
+        would raise, or None if the value is valid. Does not raise. """
+        return self.try_parse(value)[1]
+
+    def missing_errors(self, value: Any) -> dict[str, err.PropertyError]:
+        """ Return the errors of the required values, which are missing
+        within the (valid) value, by their dotted path.
+
+        Subclasses with nested properties, e.g. sections, override this.
+        """
+        return {}
+
+    def schema_key(self) -> tuple:
+        """ Return a description of the property, which changes whenever
+        the values that are valid for the property change. """
+        cls = type(self)
+        return cls.__module__, cls.__qualname__, self.name, repr(self.type)
 
     def register(self, cls: CType) -> None:
         """ Ensure the instance using this property knows of its existence. """
         self.cls = cls
-        self.cls.properties.append(self.name)
+        self.cls.properties.add(self)
@@ -0,0 +1,247 @@
+""" Sections, which group properties in nested mappings of a config file.
+
+    database:
+      host: localhost
+      port: 5432
+
+A section is validated the first time it is used (i.e. one of its public
+attributes is accessed), instead of when the config file is loaded. A
+program, which only uses some sections of a large config, thus never
+validates the others. The result is cached, so a section is validated
+only once. Nested mappings of a file replace the whole section, i.e.
+sections of different files are not merged.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from threading import RLock
+from typing import Any, Mapping
+
+import custom_conf.errors as err
+from custom_conf.config import InstanceDescriptorMixin
+from custom_conf.properties.property import Property
+from custom_conf.registry import PropertyRegistry
+
+_MISSING = object()
+
+
+class Section(InstanceDescriptorMixin, ABC):
+    """ Group of properties, which is the value of a SectionProperty.
+
+    Like configs, subclasses define their properties in
+    _initialize_config_properties. Sections can contain other sections.
+    """
+
+    def __init__(self, values: Mapping[str, Any] | None = None,
+                 path: str = "") -> None:
+        """
+        :param values: The (unvalidated) values of the properties.
+        :param path: The dotted path of the section, e.g. 'services.db'.
+        """
+        init = object.__setattr__
+        init(self, "_raw", dict(values or {}))
+        init(self, "_path", path)
+        init(self, "_lock", RLock())
+        # Whether the section still has to be validated.
+        init(self, "_pending", True)
+        init(self, "_materializing", False)
+        init(self, "_error", None)
+        init(self, "_initialized", False)
+
+    def __getstate__(self) -> dict[str, Any]:
+        with self._lock:
+            state = dict(self.__dict__)
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        state["_lock"] = RLock()
+        self.__dict__.update(state)
+
+    def __getattribute__(self, name: str) -> Any:
+        # The properties (and their registry) are created on first use,
+        # unlike the methods and attributes defined by the class.
+        if (name[0] != "_"
+                and object.__getattribute__(self, "_pending")
+                and not hasattr(type(self), name)):
+            object.__getattribute__(self, "_materialize")()
+        return InstanceDescriptorMixin.__getattribute__(self, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name[0] != "_" and not hasattr(type(self), name):
+            self._materialize()
+        if isinstance(value, Property) and self._initialized:
+            try:
+                object.__getattribute__(self, name)
+            except AttributeError:
+                raise err.AddAfterInitError(name=name)
+        super().__setattr__(name, value)
+
+    def _materialize(self) -> None:
+        """ Create the properties and validate the values, once.
+
+        :raises InvalidPropertiesError: If any value is invalid. The names
+            of the invalid properties are dotted paths, e.g. 'db.port'.
+        """
+        if not self._pending:
+            return
+        with self._lock:
+            if not self._pending or self._materializing:
+                return
+            if self._error is not None:
+                raise self._error
+            self._materializing = True
+            try:
+                self.properties = PropertyRegistry()
+                self._initialize_config_properties()
+                self._register_properties()
+                self._initialized = True
+                self._commit(self._stage(self._raw))
+            except err.InvalidPropertiesError as error:
+                self._error = err.InvalidPropertiesError(errors={
+                    self._child_path(name): property_error
+                    for name, property_error in error.errors.items()})
+                raise self._error from None
+            finally:
+                self._materializing = False
+            self._pending = False
+
+    @property
+    def initialized(self) -> bool:
+        return self._initialized
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def _child_path(self, name: str) -> str:
+        return f"{self._path}.{name}" if self._path else name
+
+    @abstractmethod
+    def _initialize_config_properties(self) -> None:
+        pass
+
+    def _register_properties(self) -> None:
+        for var in vars(self):
+            prop = object.__getattribute__(self, var)
+            if not isinstance(prop, Property):
+                continue
+            if var != prop.name:
+                raise err.MismatchedPropertyNameError(prop=prop, name=var)
+            prop.register(self)
+
+    def update(self, values: dict[str, Any]) -> None:
+        """ Set multiple properties at once, if all values are valid.
+
+        :raises InvalidPropertiesError: If any value is invalid.
+        """
+        self._commit(self._stage(values))
+
+    def _stage(self, values: Mapping[str, Any]) -> dict[str, Any]:
+        staged = {}
+        errors = {}
+        for name, value in values.items():
+            if (prop := self.properties.get(name)) is None:
+                errors[name] = err.UnknownPropertyError(name=name, value=value)
+                continue
+            staged[name], error = prop.try_parse(value)
+            if error is not None:
+                errors[name] = error
+        if errors:
+            raise err.InvalidPropertiesError(errors=errors)
+        return staged
+
+    def _commit(self, values: dict[str, Any]) -> None:
+        self.__dict__.update({self.properties[name].attr: value
+                              for name, value in values.items()})
+
+    def _values(self) -> dict[str, Any]:
+        """ Return the stored values of all properties, that are set. """
+        return {name: value for name, prop in self.properties.items()
+                if (value := self.__dict__.get(prop.attr, _MISSING))
+                is not _MISSING}
+
+    def missing_properties(self) -> dict[str, err.PropertyError]:
+        """ Return the errors of the required properties, which are not set,
+        by their dotted path, including those of nested sections.
+
+        Does not validate the section, if it was not validated yet.
+        """
+        if self._pending:
+            properties = _template(type(self)).properties.items()
+            values = self._raw
+        else:
+            properties = self.properties.items()
+            values = self._values()
+        errors = {}
+        for name, prop in properties:
+            if (value := values.get(name, _MISSING)) is _MISSING:
+                errors[self._child_path(name)] = (
+                    err.MissingRequiredPropertyError(prop=prop))
+            elif isinstance(prop, SectionProperty):
+                errors.update(prop.missing_errors(
+                    prop.section_value(value, self._child_path(name))))
+        return errors
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        # Compare the values, without validating the sections, if possible.
+        if self._pending and other._pending:
+            return self._raw == other._raw
+        try:
+            return self._values() == other._values()
+        except err.InvalidPropertiesError:
+            return self._raw == other._raw
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        values = self._raw if self._pending else self._values()
+        return f"{self.__class__.__name__}({values!r})"
+
+
+_templates: dict[type[Section], Section] = {}
+
+
+def _template(section_cls: type[Section]) -> Section:
+    """ Return an empty, validated section of the class, which is used to
+    look up the properties of its (unvalidated) sections. """
+    try:
+        return _templates[section_cls]
+    except KeyError:
+        pass
+    template = section_cls()
+    template._materialize()
+    return _templates.setdefault(section_cls, template)
+
+
+class SectionProperty(Property):
+    """ Property, whose value is a section. Mappings, e.g. of a config
+    file, are converted to a section, which is validated on first use. """
+    __slots__ = ("section", "path")
+
+    def __init__(self, name: str, section: type[Section]) -> None:
+        super().__init__(name, section)
+        self.section = section
+        self.path = name
+
+    def register(self, cls: Any) -> None:
+        super().register(cls)
+        if isinstance(cls, Section):
+            self.path = cls._child_path(self.name)
+
+    def section_value(self, value: Any, path: str | None = None) -> Any:
+        """ Return the section for a mapping, or the value otherwise. """
+        if isinstance(value, Mapping):
+            return self.section(value, self.path if path is None else path)
+        return value
+
+    def _convert(self, value: Any) -> tuple[Any, err.PropertyError | None]:
+        return self.section_value(value), None
+
+    def missing_errors(self, value: Any) -> dict[str, err.PropertyError]:
+        if isinstance(value, Section):
+            return value.missing_properties()
+        return {}
@@ -0,0 +1,160 @@
+""" Type validators, which are compiled once per annotation.
+
+Instead of calling typeguard.check_type for every assignment, a specialised
+validator is built for common annotations (plain classes, list[...],
+dict[..., ...] and unions, e.g. Optional[...]). Any other annotation falls
+back to typeguard. The compiled validators return the same results as
+typeguard with its current collection check strategy.
+"""
+
+from __future__ import annotations
+
+from inspect import isclass
+from types import UnionType
+from typing import Any, Callable, get_args, get_origin, is_typeddict, Union
+
+import typeguard
+from typeguard import check_type, CollectionCheckStrategy, TypeCheckError
+
+TypeValidator = Callable[[Any], bool]
+
+# Types for which typeguard does more (or less) than an isinstance check.
+_SPECIAL_CLASSES = (bytes, set, type)
+
+# Compiled validators by annotation and collection check strategy.
+_validators: dict[tuple[Any, bool], TypeValidator] = {}
+
+
+def _accept_any(_value: Any) -> bool:
+    return True
+
+
+def _is_none(value: Any) -> bool:
+    return value is None
+
+
+def _is_float(value: Any) -> bool:
+    # Same as typeguard, which follows the numeric tower of PEP 484.
+    return isinstance(value, (float, int))
+
+
+def _is_complex(value: Any) -> bool:
+    return isinstance(value, (complex, float, int))
+
+
+def _compile_fallback(annotation: Any) -> TypeValidator:
+    def validator(value: Any) -> bool:
+        try:
+            check_type(value, annotation)
+        except TypeCheckError:
+            return False
+        return True
+    return validator
+
+
+def _compile_class(cls: type) -> TypeValidator | None:
+    if cls is float:
+        return _is_float
+    if cls is complex:
+        return _is_complex
+    if cls in _SPECIAL_CLASSES or is_typeddict(cls):
+        return None
+    # NamedTuples and Protocols have special checks in typeguard.
+    if issubclass(cls, tuple) and cls is not tuple:
+        return None
+    if getattr(cls, "_is_protocol", False):
+        return None
+
+    def validator(value: Any) -> bool:
+        return isinstance(value, cls)
+    return validator
+
+
+def _compile_list(args: tuple[Any, ...]) -> TypeValidator:
+    if not args or args == (Any,):
+        return lambda value: isinstance(value, list)
+    check_item = compile_type_validator(args[0])
+
+    if _check_all_items():
+        def validator(value: Any) -> bool:
+            return isinstance(value, list) and all(map(check_item, value))
+    else:
+        def validator(value: Any) -> bool:
+            if not isinstance(value, list):
+                return False
+            return not value or check_item(value[0])
+    return validator
+
+
+def _compile_dict(args: tuple[Any, ...]) -> TypeValidator:
+    if not args or (args[0] is Any and args[1] is Any):
+        return lambda value: isinstance(value, dict)
+    check_key = compile_type_validator(args[0])
+    check_value = compile_type_validator(args[1])
+
+    def check_item(item: tuple[Any, Any]) -> bool:
+        return check_key(item[0]) and check_value(item[1])
+
+    if _check_all_items():
+        def validator(value: Any) -> bool:
+            return (isinstance(value, dict)
+                    and all(map(check_item, value.items())))
+    else:
+        def validator(value: Any) -> bool:
+            if not isinstance(value, dict):
+                return False
+            return not value or check_item(next(iter(value.items())))
+    return validator
+
+
+def _compile_union(args: tuple[Any, ...]) -> TypeValidator:
+    validators = tuple(map(compile_type_validator, args))
+
+    def validator(value: Any) -> bool:
+        for check in validators:
+            if check(value):
+                return True
+        return False
+    return validator
+
+
+def _check_all_items() -> bool:
+    strategy = typeguard.config.collection_check_strategy
+    return strategy is not CollectionCheckStrategy.FIRST_ITEM
+
+
+def compile_type_validator(annotation: Any) -> TypeValidator:
+    """ Build a validator for the given type annotation.
+
+    Validators are shared by all properties with the same annotation.
+
+    :param annotation: The type (annotation) of a property.
+    :return: A callable returning True, if a value is of the given type.
+    """
+    key = annotation, _check_all_items()
+    try:
+        return _validators[key]
+    except KeyError:
+        validator = _validators[key] = _compile(annotation)
+    except TypeError:
+        # Unhashable annotations are not cached.
+        validator = _compile(annotation)
+    return validator
+
+
+def _compile(annotation: Any) -> TypeValidator:
+    validator = None
+    if annotation is Any:
+        validator = _accept_any
+    elif annotation is None or annotation is type(None):
+        validator = _is_none
+    elif (origin := get_origin(annotation)) is None:
+        if isclass(annotation):
+            validator = _compile_class(annotation)
+    elif origin is list:
+        validator = _compile_list(get_args(annotation))
+    elif origin is dict:
+        validator = _compile_dict(get_args(annotation))
+    elif origin is Union or origin is UnionType:
+        validator = _compile_union(get_args(annotation))
+    return validator or _compile_fallback(annotation)
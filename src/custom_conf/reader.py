@@ -1,23 +1,365 @@
 import logging
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from copy import deepcopy
+from functools import partial
 from pathlib import Path
-from typing import Any
+from threading import Lock
+from time import perf_counter
+from typing import Any, IO, Iterator, NamedTuple
 
-from yaml import safe_load, YAMLError
+import yaml
+from yaml import SafeLoader, YAMLError
+from yaml.composer import Composer
+from yaml.events import (
+    MappingEndEvent, MappingStartEvent, StreamEndEvent,
+    )
 from yaml.scanner import ScannerError
 
 import custom_conf.errors as err
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_CACHE_SIZE = 128
+AUTO_LOADER = "auto"
 
-def read_yaml(path: Path) -> tuple[dict[str, Any], bool]:
+# Loader classes that can be used by read_yaml, by name.
+_loaders: dict[str, type] = {"python": SafeLoader}
+if yaml.__with_libyaml__:
+    _loaders["c"] = yaml.CSafeLoader
+_default_loader = AUTO_LOADER
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _YamlCache:
+    """ LRU cache of parsed yaml files.
+
+    Entries are keyed by the resolved path, the modification time and the
+    size of the file, so a changed file is parsed again. The cached data is
+    never handed out; callers always receive a copy of it.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple, Any] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: tuple) -> tuple[Any, bool]:
+        with self._lock:
+            try:
+                data = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return None, False
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return deepcopy(data), True
+
+    def put(self, key: tuple, data: Any) -> None:
+        if self.maxsize <= 0:
+            return
+        data = deepcopy(data)
+        with self._lock:
+            self._entries[key] = data
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses,
+                             self.maxsize, len(self._entries))
+
+
+_cache = _YamlCache(DEFAULT_CACHE_SIZE)
+
+
+def cache_info() -> CacheInfo:
+    """ Return the hit/miss counters and the size of the yaml cache. """
+    return _cache.info()
+
+
+def clear_cache() -> None:
+    """ Remove all parsed files from the yaml cache and reset its counters. """
+    _cache.clear()
+
+
+def set_cache_size(maxsize: int) -> None:
+    """ Set the maximum number of parsed files held by the yaml cache.
+
+    A size of 0 disables the cache.
+    """
+    with _cache._lock:
+        _cache.maxsize = maxsize
+        while len(_cache._entries) > max(maxsize, 0):
+            _cache._entries.popitem(last=False)
+
+
+def register_loader(name: str, loader: type) -> None:
+    """ Make the given (safe) yaml loader class available to read_yaml. """
+    if name == AUTO_LOADER:
+        raise ValueError(f"The loader name '{AUTO_LOADER}' is reserved.")
+    _loaders[name] = loader
+
+
+def available_loaders() -> list[str]:
+    """ Return the names of all registered yaml loaders. """
+    return list(_loaders)
+
+
+def set_default_loader(name: str) -> None:
+    """ Set the loader used by read_yaml, if no loader is given explicitly.
+
+    The default 'auto' uses the libyaml based loader ('c'), if PyYAML was
+    built with libyaml, and the pure Python loader ('python') otherwise.
+    """
+    global _default_loader
+    if name != AUTO_LOADER:
+        get_loader(name)
+    _default_loader = name
+
+
+def get_loader(name: str | None = None) -> type:
+    """ Return the loader class with the given name.
+
+    :param name: The name of a registered loader, 'auto' or None, to use
+        the default loader.
+    """
+    name = name or _default_loader
+    if name == AUTO_LOADER:
+        return _loaders.get("c", SafeLoader)
+    try:
+        return _loaders[name]
+    except KeyError:
+        raise err.UnknownLoaderError(name=name, loaders=available_loaders())
+
+
+def _cache_key(path: Path, loader: type) -> tuple:
+    resolved = Path(path).resolve()
+    stat = resolved.stat()
+    return str(resolved), stat.st_mtime_ns, stat.st_size, loader
+
+
+def _reader_error(path: Path, error: YAMLError) -> err.ConfigReaderError:
+    mark = getattr(error, "problem_mark", None)
+    line = mark.line + 1 if mark is not None else None
+    return err.ConfigReaderError(path=path, line=line)
+
+
+def _load_documents(stream: IO[str], loader_cls: type) -> Any:
+    """ Load all documents of the stream, merging them in order. """
+    documents = [document
+                 for document in yaml.load_all(stream, Loader=loader_cls)
+                 if document is not None]
+    if len(documents) <= 1:
+        return documents[0] if documents else None
+    data = {}
+    for document in documents:
+        data.update(document)
+    return data
+
+
+def read_yaml(path: Path, loader: str | None = None
+              ) -> tuple[dict[str, Any], bool]:
     """ Read the yaml-formatted file at the given path.
 
+    Parsed files are cached, as long as they do not change. The documents
+    of a multi-document file are merged in order, so later documents
+    overwrite the keys of earlier ones.
+
     :param path: The path of the .yml/.yaml file that should be read.
+    :param loader: The name of the yaml loader to use. If None, the default
+        loader is used (see set_default_loader).
     :return: The data contained in the file and whether reading was a success.
     """
+    loader_cls = get_loader(loader)
+    try:
+        key = _cache_key(path, loader_cls)
+    except OSError:
+        # Let open() raise the same error as without the cache.
+        key = None
+    else:
+        data, hit = _cache.get(key)
+        if hit:
+            return data, True
+
     try:
         with open(path, encoding="utf-8") as config_file:
-            return safe_load(config_file), True
+            data = _load_documents(config_file, loader_cls)
     except (ScannerError, YAMLError) as error:
+        raise _reader_error(path, error) from error
+    except (TypeError, ValueError) as error:
+        # A document of a multi-document file is not a mapping.
         raise err.ConfigReaderError(path=path) from error
+    if key is not None:
+        _cache.put(key, data)
+    return data, True
+
+
+def _read_yaml_result(path: Path, loader: str | None = None,
+                      timed: bool = False, catch: bool = False) -> tuple:
+    start = perf_counter()
+    try:
+        result = read_yaml(path, loader)
+    except err.ConfigReaderError as error:
+        if not catch:
+            raise
+        result = error, False
+    return result + (perf_counter() - start,) if timed else result
+
+
+def read_yamls(paths: list[Path], workers: int = 1, processes: bool = False,
+               loader: str | None = None, timed: bool = False,
+               catch: bool = False) -> Iterator[tuple]:
+    """ Read the given yaml files, possibly in parallel.
+
+    The results are always yielded in the order of the given paths. Any
+    error is raised, once the result of the respective file is reached.
+
+    :param paths: The paths of the files that should be read.
+    :param workers: The number of files that are read in parallel.
+    :param processes: Whether to use processes instead of threads.
+    :param loader: The name of the yaml loader to use.
+    :param timed: Whether to add the time it took to read the file (in
+        seconds) to each result.
+    :param catch: Whether to return the ConfigReaderError of a file in
+        place of its data (with valid being False), instead of raising it.
+    :return: The results of read_yaml for each path.
+    """
+    read = partial(_read_yaml_result, loader=loader, timed=timed,
+                   catch=catch)
+    if workers <= 1 or len(paths) <= 1:
+        yield from map(read, paths)
+        return
+    executor_cls = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    with executor_cls(max_workers=min(workers, len(paths))) as executor:
+        yield from executor.map(read, paths)
+
+
+def key_lines(path: Path, loader: str | None = None) -> dict[str, int]:
+    """ Return the line of each top-level key of the yaml file at path.
+
+    The file is only composed (not constructed), so this is meant to be
+    used to locate errors. Returns an empty dict, if the file can not be
+    read or is not a mapping.
+    """
+    try:
+        with open(path, encoding="utf-8") as config_file:
+            node = yaml.compose(config_file, Loader=get_loader(loader))
+    except (OSError, YAMLError):
+        return {}
+    if not isinstance(node, yaml.MappingNode):
+        return {}
+    return {key.value: key.start_mark.line + 1 for key, _ in node.value
+            if isinstance(key, yaml.ScalarNode)}
+
+
+class StreamItem(NamedTuple):
+    """ A top-level key of a yaml document and its value. """
+    document: int
+    key: Any
+    value: Any
+    # The (1-based) line of the key.
+    line: int
+
+
+MERGE_TAG = "tag:yaml.org,2002:merge"
+_streaming_loaders: dict[type, type] = {}
+
+
+def _get_streaming_loader(loader_cls: type) -> type:
+    """ Return a variant of the loader, which can compose single nodes.
+
+    The libyaml based loaders only compose whole documents, so their
+    variant composes the nodes in Python, from the events parsed by libyaml.
+    """
+    if issubclass(loader_cls, Composer):
+        return loader_cls
+    try:
+        return _streaming_loaders[loader_cls]
+    except KeyError:
+        pass
+    streaming_cls = type(f"Streaming{loader_cls.__name__}",
+                         (loader_cls, Composer), {})
+    _streaming_loaders[loader_cls] = streaming_cls
+    return streaming_cls
+
+
+def _stream_document(loader: Any, document: int) -> Iterator[StreamItem]:
+    if not loader.check_event(MappingStartEvent):
+        node = loader.compose_node(None, None)
+        if loader.construct_document(node) is not None:
+            raise YAMLError("expected the document to be a mapping")
+        return
+    loader.get_event()
+    explicit_keys = set()
+    while not loader.check_event(MappingEndEvent):
+        key_node = loader.compose_node(None, None)
+        value_node = loader.compose_node(None, None)
+        line = key_node.start_mark.line + 1
+        if key_node.tag == MERGE_TAG:
+            # Explicit keys take precedence over merged ones, even if
+            # they precede the merge key.
+            nodes = (value_node.value if isinstance(value_node,
+                                                    yaml.SequenceNode)
+                     else [value_node])
+            merged = {}
+            for node in nodes:
+                merged.update(loader.construct_document(node))
+            for key, value in merged.items():
+                if key not in explicit_keys:
+                    yield StreamItem(document, key, value, line)
+            continue
+        key = loader.construct_document(key_node)
+        explicit_keys.add(key)
+        yield StreamItem(document, key,
+                         loader.construct_document(value_node), line)
+    loader.get_event()
+
+
+def stream_yaml(path: Path, loader: str | None = None
+                ) -> Iterator[StreamItem]:
+    """ Parse the yaml file at path and yield its top-level keys, as soon as
+    they are parsed.
+
+    In contrast to read_yaml, only a single top-level value is held in
+    memory as yaml nodes at a time, and nothing is cached. The documents of
+    a multi-document file are yielded in order. Aliases can only refer to
+    anchors of the same document.
+
+    :param path: The path of the .yml/.yaml file that should be read.
+    :param loader: The name of the yaml loader to use.
+    :raises ConfigReaderError: Once the first syntax error is reached, or if
+        a document is not a mapping.
+    """
+    loader_cls = _get_streaming_loader(get_loader(loader))
+    with open(path, encoding="utf-8") as config_file:
+        loader = loader_cls(config_file)
+        loader.anchors = {}
+        try:
+            loader.get_event()
+            document = 0
+            while not loader.check_event(StreamEndEvent):
+                loader.get_event()
+                yield from _stream_document(loader, document)
+                loader.get_event()
+                loader.anchors = {}
+                document += 1
+        except YAMLError as error:
+            raise _reader_error(path, error) from error
+        finally:
+            loader.dispose()
@@ -0,0 +1,89 @@
+""" Registry of the properties of a config. """
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any, Iterable, Iterator, overload
+
+from custom_conf.properties.property import Property
+
+
+class PropertyRegistry(Sequence):
+    """ Ordered collection of the properties of a config.
+
+    Behaves like a list of the property names, but checks whether a name
+    is registered in constant time. The Property objects themselves can be
+    accessed by name, e.g. using registry["name"] or registry.get("name").
+    """
+
+    def __init__(self, properties: Iterable[Property] = ()) -> None:
+        self._properties: dict[str, Property] = {}
+        self._names: list[str] | None = None
+        for prop in properties:
+            self.add(prop)
+
+    def add(self, prop: Property) -> None:
+        """ Register the given property, keeping the declaration order. """
+        self._properties[prop.name] = prop
+        self._names = None
+
+    def get(self, name: str, default: Any = None) -> Property | Any:
+        """ Return the property with the given name or default. """
+        return self._properties.get(name, default)
+
+    def names(self) -> list[str]:
+        """ Return the names of all properties in declaration order. """
+        if self._names is None:
+            self._names = list(self._properties)
+        return self._names
+
+    def values(self) -> Iterable[Property]:
+        """ Return all properties in declaration order. """
+        return self._properties.values()
+
+    def items(self) -> Iterable[tuple[str, Property]]:
+        """ Return (name, property) pairs in declaration order. """
+        return self._properties.items()
+
+    @overload
+    def __getitem__(self, key: int) -> str: ...
+
+    @overload
+    def __getitem__(self, key: slice) -> list[str]: ...
+
+    @overload
+    def __getitem__(self, key: str) -> Property: ...
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self._properties[key]
+        return self.names()[key]
+
+    def __contains__(self, name: Any) -> bool:
+        try:
+            return name in self._properties
+        except TypeError:
+            # Unhashable objects are never the name of a property.
+            return False
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._properties)
+
+    def __len__(self) -> int:
+        return len(self._properties)
+
+    def __add__(self, other: Iterable[str]) -> list[str]:
+        return self.names() + list(other)
+
+    def __radd__(self, other: Iterable[str]) -> list[str]:
+        return list(other) + self.names()
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, PropertyRegistry):
+            return self._properties == other._properties
+        if isinstance(other, (list, tuple)):
+            return self.names() == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.names()})"
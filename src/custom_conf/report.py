@@ -0,0 +1,86 @@
+""" Reports of the issues found while loading configuration files. """
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterator, NamedTuple
+
+import custom_conf.errors as err
+
+
+class LoadIssue(NamedTuple):
+    """ A single problem found while loading a config. """
+    # The file the issue was found in. None for missing properties.
+    path: Path | None
+    # The key in the file, if the issue concerns a single value.
+    key: str | None
+    # The (1-based) line of the key or of the syntax error, if known.
+    line: int | None
+    error: err.CustomConfError
+
+    def __str__(self) -> str:
+        location = str(self.path) if self.path is not None else "<config>"
+        if self.line is not None:
+            location += f":{self.line}"
+        if self.key is not None:
+            location += f" [{self.key}]"
+        return f"{location}: {self.error}"
+
+
+class LoadReport:
+    """ Collects every issue found while loading one or more config files.
+
+    Files with issues are not applied at all, so the config keeps the
+    values it had before loading them.
+    """
+
+    def __init__(self) -> None:
+        self.issues: list[LoadIssue] = []
+
+    @property
+    def ok(self) -> bool:
+        """ Whether no issues were found. """
+        return not self.issues
+
+    def add(self, error: err.CustomConfError, path: Path | None = None,
+            key: str | None = None, line: int | None = None) -> None:
+        self.issues.append(LoadIssue(path, key, line, error))
+
+    def add_errors(self, errors: dict[str, err.CustomConfError],
+                   path: Path | None = None,
+                   lines: dict[str, int] | None = None) -> None:
+        """ Add the errors by key, e.g. of an InvalidPropertiesError. """
+        lines = lines or {}
+        for key, error in errors.items():
+            self.add(error, path, key, lines.get(key))
+
+    def locate(self, path: Path, lines: dict[str, int], start: int = 0
+               ) -> None:
+        """ Add the lines of the keys to the issues of the file at path,
+        which do not have a line yet, beginning with the issue at start. """
+        for index in range(start, len(self.issues)):
+            issue = self.issues[index]
+            if (issue.path == path and issue.key is not None
+                    and issue.line is None):
+                self.issues[index] = issue._replace(line=lines.get(issue.key))
+
+    def by_file(self) -> dict[Path | None, list[LoadIssue]]:
+        """ Return the issues grouped by the file they were found in. """
+        files: dict[Path | None, list[LoadIssue]] = {}
+        for issue in self.issues:
+            files.setdefault(issue.path, []).append(issue)
+        return files
+
+    def __iter__(self) -> Iterator[LoadIssue]:
+        return iter(self.issues)
+
+    def __len__(self) -> int:
+        return len(self.issues)
+
+    def __str__(self) -> str:
+        if self.ok:
+            return "No issues."
+        return "\n".join(str(issue) for issue in self.issues)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self.issues)} issue(s))"
@@ -0,0 +1,78 @@
+""" Compiled schemas, i.e. the properties of a config class, which are
+created once and shared by all instances of the class.
+
+Only used by configs, whose class sets compile_schema to True. Their
+_initialize_config_properties runs once per class. It should therefore
+only create the properties and not depend on the instance, e.g. on its
+program_name. The Property objects are shared as well, so changing one
+of them (e.g. its bounds) changes it for all instances of the class.
+"""
+
+from __future__ import annotations
+
+from threading import Lock
+from typing import Any, Mapping, TYPE_CHECKING
+
+from custom_conf.properties.property import Property
+from custom_conf.registry import PropertyRegistry
+
+if TYPE_CHECKING:
+    from custom_conf.config import BaseConfig
+
+
+class CompiledSchema:
+    """ The properties of a config class and their registry. """
+    __slots__ = ("cls", "registry", "descriptors")
+
+    def __init__(self, cls: type, registry: PropertyRegistry) -> None:
+        self.cls = cls
+        self.registry = registry
+        # The instance attributes of the properties (see
+        # InstanceDescriptorMixin), which each instance gets a copy of.
+        self.descriptors: dict[str, Property] = dict(registry.items())
+
+    def apply(self, config: BaseConfig) -> None:
+        """ Add the properties to the (uninitialized) config. """
+        config.__dict__.update(self.descriptors)
+        object.__setattr__(config, "properties", self.registry)
+
+    def __repr__(self) -> str:
+        return (f"{self.__class__.__name__}({self.cls.__qualname__}, "
+                f"{len(self.registry)} properties)")
+
+
+_SCHEMAS: dict[type, CompiledSchema] = {}
+_lock = Lock()
+
+
+def get_schema(cls: type) -> CompiledSchema | None:
+    """ Return the compiled schema of the config class, if any. """
+    return _SCHEMAS.get(cls)
+
+
+def compile_schema(config: BaseConfig, attributes: Mapping[str, Any]
+                   ) -> CompiledSchema | None:
+    """ Compile (and cache) the schema of the class of the initialized
+    config, unless a schema was compiled already.
+
+    :param attributes: The attributes _initialize_config_properties added.
+    :return: The schema or None, if _initialize_config_properties added
+        attributes other than properties, which can not be shared.
+    """
+    if not all(isinstance(value, Property) for value in attributes.values()):
+        return None
+    cls = type(config)
+    with _lock:
+        if (schema := _SCHEMAS.get(cls)) is None:
+            schema = _SCHEMAS[cls] = CompiledSchema(cls, config.properties)
+            # The properties belong to the class, not to the first config.
+            for prop in schema.registry.values():
+                prop.cls = cls
+    return schema
+
+
+def clear_schemas() -> None:
+    """ Remove all compiled schemas, e.g. after changing the properties
+    created by a config class. """
+    with _lock:
+        _SCHEMAS.clear()
@@ -0,0 +1,145 @@
+""" Sharing the validated values of a config between processes.
+
+The parent process publishes the values of its config to a shared memory
+block once. Worker processes attach to the block by its name, instead of
+parsing and validating the config files themselves. Every publication
+increases the generation counter of the block, which lets workers notice
+that they need to refresh their values.
+
+Sharing makes attaching faster than loading the files, as nothing is
+parsed or validated again. It does not save memory: each worker still
+unpickles its own copy of the values, so the memory used by the values
+grows with the number of workers (see benchmarks/bench_shared.py).
+"""
+
+from __future__ import annotations
+
+import struct
+import time
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from threading import Lock
+from typing import Any
+
+import custom_conf.errors as err
+from custom_conf import snapshot
+
+# Generation and size of the payload. The generation is odd, while the
+# payload is being written.
+HEADER = struct.Struct("<QQ")
+MIN_SIZE = 64 * 1024
+# How often a read is retried, while the payload is being written, and the
+# delay before the first retry, which doubles up to READ_MAX_DELAY. The
+# retries take about 5 seconds at most, e.g. if the publisher died while
+# writing the payload.
+READ_ATTEMPTS = 110
+READ_DELAY = 1e-5
+READ_MAX_DELAY = 0.05
+
+_register = resource_tracker.register
+_untracked_lock = Lock()
+
+
+def _register_untracked(name: str, rtype: str) -> None:
+    if rtype != "shared_memory":
+        _register(name, rtype)
+
+
+def _attach(name: str) -> SharedMemory:
+    try:
+        return SharedMemory(name=name, track=False)
+    except TypeError:
+        pass
+    # Python < 3.13 registers attached blocks with the resource tracker,
+    # which would destroy the block, once this process exits. Unregistering
+    # it afterwards is no option, as workers share the tracker of their
+    # parent, so that would drop the registration of the publisher.
+    with _untracked_lock:
+        resource_tracker.register = _register_untracked
+        try:
+            return SharedMemory(name=name)
+        finally:
+            resource_tracker.register = _register
+
+
+class SharedConfigBlock:
+    """ A shared memory block, which holds the values of a config. """
+
+    def __init__(self, shm: SharedMemory, owner: bool) -> None:
+        self._shm = shm
+        self.owner = owner
+
+    @classmethod
+    def create(cls, size: int, name: str | None = None) -> SharedConfigBlock:
+        """ Create a new block, with room for a payload of the given size. """
+        size = max(size + HEADER.size, MIN_SIZE)
+        shm = SharedMemory(name=name, create=True, size=size)
+        return cls(shm, True)
+
+    @classmethod
+    def attach(cls, name: str) -> SharedConfigBlock:
+        """ Attach to the existing block with the given name. """
+        try:
+            return cls(_attach(name), False)
+        except FileNotFoundError:
+            raise err.SharedConfigError(name=name,
+                                        reason="the block does not exist")
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def capacity(self) -> int:
+        return self._shm.size - HEADER.size
+
+    @property
+    def generation(self) -> int:
+        return HEADER.unpack_from(self._shm.buf, 0)[0]
+
+    def write(self, values: dict[str, Any]) -> int:
+        """ Publish the values and return the new generation. """
+        payload = snapshot.dumps(values)
+        if len(payload) > self.capacity:
+            raise err.SharedConfigError(
+                name=self.name,
+                reason=f"the values need {len(payload)} bytes, but the "
+                       f"block can only hold {self.capacity} bytes")
+        buf = self._shm.buf
+        generation = self.generation
+        HEADER.pack_into(buf, 0, generation + 1, 0)
+        buf[HEADER.size:HEADER.size + len(payload)] = payload
+        HEADER.pack_into(buf, 0, generation + 2, len(payload))
+        return generation + 2
+
+    def read(self) -> tuple[int, dict[str, Any]]:
+        """ Return the generation and the values of the block.
+
+        :raises SharedConfigError: If nothing was published yet, or if the
+            payload is still being written after READ_ATTEMPTS retries.
+        """
+        buf = self._shm.buf
+        delay = READ_DELAY
+        for _ in range(READ_ATTEMPTS):
+            generation, size = HEADER.unpack_from(buf, 0)
+            if not generation % 2:
+                payload = bytes(buf[HEADER.size:HEADER.size + size])
+                # Retry, if the payload changed while copying it.
+                if HEADER.unpack_from(buf, 0)[0] == generation:
+                    break
+            time.sleep(delay)
+            delay = min(delay * 2, READ_MAX_DELAY)
+        else:
+            raise err.SharedConfigError(
+                name=self.name, reason="the values are still being written "
+                                       "(the publisher may have died)")
+        if generation == 0:
+            raise err.SharedConfigError(name=self.name,
+                                        reason="nothing was published yet")
+        return generation, snapshot.loads(payload)
+
+    def close(self) -> None:
+        """ Close the block. The owner also destroys it. """
+        self._shm.close()
+        if self.owner:
+            self._shm.unlink()
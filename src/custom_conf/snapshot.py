@@ -0,0 +1,142 @@
+""" Binary snapshots of validated configs.
+
+A snapshot contains the validated values of a config and the parsed config
+files they were loaded from. It is tagged with a digest of the property
+schema and the contents of the config files. If neither changed, the
+snapshot can be loaded instead of parsing and validating the files again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import logging
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Iterable, TYPE_CHECKING
+
+import custom_conf.errors as err
+
+if TYPE_CHECKING:
+    from custom_conf.config import BaseConfig
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"CUSTOMCONF-SNAPSHOT\x01"
+DIGEST_SIZE = hashlib.sha256().digest_size
+
+# Only these globals can be loaded from a snapshot. Values of other types
+# are not written to a snapshot.
+SAFE_GLOBALS: set[tuple[str, str]] = {
+    ("builtins", name) for name in [
+        "bool", "bytearray", "bytes", "complex", "dict", "float",
+        "frozenset", "int", "list", "set", "slice", "str", "tuple"]
+    } | {
+    ("datetime", name) for name in [
+        "date", "datetime", "time", "timedelta", "timezone"]
+    } | {
+    ("array", "_array_reconstructor"),
+    ("array", "array"),
+    ("collections", "OrderedDict"),
+    ("decimal", "Decimal"),
+    ("pathlib", "Path"),
+    ("pathlib", "PosixPath"),
+    ("pathlib", "PurePosixPath"),
+    ("pathlib", "PureWindowsPath"),
+    ("pathlib", "WindowsPath"),
+    }
+
+
+class _SafeUnpickler(pickle.Unpickler):
+    def find_class(self, module: str, name: str) -> Any:
+        if (module, name) not in SAFE_GLOBALS:
+            raise err.InvalidSnapshotError(
+                reason=f"'{module}.{name}' can not be loaded")
+        return super().find_class(module, name)
+
+
+def dumps(obj: Any) -> bytes:
+    """ Serialize the object, such that loads can deserialize it.
+
+    :raises InvalidSnapshotError: If the object contains unsafe types.
+    """
+    data = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+    # Make sure the data can be loaded again.
+    loads(data)
+    return data
+
+
+def loads(data: bytes | memoryview) -> Any:
+    """ Deserialize data created by dumps, allowing only safe types. """
+    try:
+        return _SafeUnpickler(io.BytesIO(data)).load()
+    except err.InvalidSnapshotError:
+        raise
+    except Exception as error:
+        raise err.InvalidSnapshotError(reason=str(error)) from error
+
+
+def schema_digest(config: BaseConfig) -> bytes:
+    """ Return a digest of the properties of the config. """
+    cls = type(config)
+    schema = [cls.__module__, cls.__qualname__]
+    schema += [prop.schema_key() for prop in config.properties.values()]
+    return hashlib.sha256(repr(schema).encode("utf-8")).digest()
+
+
+def source_digest(config: BaseConfig, paths: Iterable[Path]) -> bytes:
+    """ Return a digest of the schema of the config and the contents of the
+    given files.
+
+    :raises OSError: If any of the files can not be read.
+    """
+    digest = hashlib.sha256(schema_digest(config))
+    for path in paths:
+        digest.update(str(path).encode("utf-8") + b"\0")
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+    return digest.digest()
+
+
+def write_snapshot(path: Path, digest: bytes, payload: Any) -> bool:
+    """ Atomically write the payload to a snapshot file at path.
+
+    :return: True, if the snapshot was written.
+    """
+    try:
+        data = dumps(payload)
+    except err.InvalidSnapshotError as error:
+        logger.info(f"Not writing the snapshot '{path}': {error}")
+        return False
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "wb") as file:
+            file.write(MAGIC + digest)
+            file.write(data)
+        os.replace(tmp_path, path)
+    except OSError as error:
+        logger.warning(f"Could not write the snapshot '{path}': {error}")
+        tmp_path.unlink(missing_ok=True)
+        return False
+    return True
+
+
+def read_snapshot(path: Path, digest: bytes) -> Any | None:
+    """ Read the payload of the snapshot at path, if its digest matches.
+
+    :return: The payload or None, if there is no valid snapshot.
+    """
+    try:
+        with open(path, "rb") as file:
+            data = file.read()
+    except OSError:
+        return None
+    header = MAGIC + digest
+    if not data.startswith(header):
+        return None
+    try:
+        return loads(memoryview(data)[len(header):])
+    except err.InvalidSnapshotError as error:
+        logger.warning(f"Ignoring the snapshot '{path}': {error}")
+        return None
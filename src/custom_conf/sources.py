@@ -0,0 +1,49 @@
+""" The sources of config values and the environment variable index.
+
+Values are applied in layers, from lowest to highest priority:
+defaults -> files -> environment variables -> command line arguments.
+A value of a higher layer is kept, when a lower layer is loaded later on,
+e.g. when a config file is reloaded.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Iterable, NamedTuple
+
+# The kinds of sources.
+DEFAULT = "default"
+FILE = "file"
+ENV = "env"
+CLI = "cli"
+SNAPSHOT = "snapshot"
+SHARED = "shared"
+# Values set by the program, e.g. using config.name = value.
+SET = "set"
+
+# The layers, which override values of files, by increasing priority.
+OVERRIDE_LAYERS = (ENV, CLI)
+
+
+class Source(NamedTuple):
+    """ Where the current value of a property came from. """
+    kind: str
+    # The file, environment variable or argument name, if any.
+    location: str | None = None
+
+    def __str__(self) -> str:
+        if self.location is None:
+            return self.kind
+        return f"{self.kind} ({self.location})"
+
+
+def env_prefix(program_name: str) -> str:
+    """ Return the prefix of the environment variables of a program, e.g.
+    'MY_PROGRAM' for 'my-program'. """
+    return re.sub(r"\W", "_", program_name).upper()
+
+
+def build_env_index(prefix: str, names: Iterable[str]) -> dict[str, str]:
+    """ Return the property names by the name of their environment variable,
+    e.g. {'MY_PROGRAM__LOG_LEVEL': 'log_level'}. """
+    return {f"{prefix}__{name.upper()}": name for name in names}
@@ -0,0 +1,45 @@
+""" Background reloading of changed config files. """
+
+from __future__ import annotations
+
+import logging
+from threading import Event, Thread
+from typing import TYPE_CHECKING
+
+import custom_conf.errors as err
+
+if TYPE_CHECKING:
+    from custom_conf.config import BaseConfig
+
+logger = logging.getLogger(__name__)
+
+
+class ConfigWatcher(Thread):
+    """ Periodically reload the config files of a config that changed. """
+
+    def __init__(self, config: BaseConfig, interval: float = 1.0) -> None:
+        super().__init__(name=f"{config.program_name}-config-watcher",
+                         daemon=True)
+        self.config = config
+        self.interval = interval
+        self._stopped = Event()
+
+    def run(self) -> None:
+        last_error = None
+        while not self._stopped.wait(self.interval):
+            try:
+                self.config.reload()
+            except (err.CustomConfError, OSError) as error:
+                # Only log once, until the error changes.
+                if str(error) != last_error:
+                    logger.error(
+                        f"Could not reload the configuration: {error}")
+                last_error = str(error)
+            else:
+                last_error = None
+
+    def stop(self, timeout: float | None = None) -> None:
+        """ Stop watching and wait for the thread to finish. """
+        self._stopped.set()
+        if self.is_alive():
+            self.join(timeout)
@@ -0,0 +1,91 @@
+import asyncio
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import IsolatedAsyncioTestCase
+
+import custom_conf.errors as err
+from custom_conf.config import list_configs
+from custom_conf.properties.coercible_property import IntProperty
+from custom_conf.properties.property import Property
+
+from test.test_reload import write
+from test.utils import TestConfig
+
+
+class AsyncConfig(TestConfig):
+    directory: Path
+
+    @property
+    def default_config_path(self) -> Path:
+        return self.directory / "default.yaml"
+
+    def _initialize_config_properties(self) -> None:
+        self.str_prop = Property("str_prop", str)
+        self.int_prop = IntProperty("int_prop")
+        super()._initialize_config_properties()
+
+
+class TestAsyncLoading(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name) / "configs"
+        self.path.mkdir()
+        for i in range(20):
+            self.path.joinpath(f"config_{i}.yaml").write_text(
+                f"str_prop: value_{i}\n", encoding="utf-8")
+        AsyncConfig.directory = Path(self.tmp_dir.name)
+        self.default = AsyncConfig.directory / "default.yaml"
+        write(self.default, "str_prop: default\nint_prop: 1\n")
+        self.config = AsyncConfig()
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    async def test_load_configs(self) -> None:
+        await self.config.load_default_config_async()
+        await self.config.load_configs_async(self.path)
+        expected = list_configs(self.path)[-1].stem.replace("config", "value")
+        self.assertEqual((expected, 1),
+                         (self.config.str_prop, self.config.int_prop))
+
+    async def test_load_config(self) -> None:
+        self.assertTrue(await self.config.load_config_async(self.default))
+        self.assertEqual("default", self.config.str_prop)
+        missing = self.path / "missing.yaml"
+        self.assertFalse(await self.config.load_config_async(missing))
+
+    async def test_invalid_configs_raise(self) -> None:
+        write(self.default, "str_prop: default\nint_prop: one\n")
+        with self.assertRaises(err.InvalidConfigError) as context:
+            await self.config.load_default_config_async()
+        self.assertEqual(err.INVALID_CONFIG_EXIT_CODE,
+                         context.exception.exit_code)
+        with self.assertRaises(err.InvalidConfigError):
+            # int_prop is still missing.
+            await self.config.load_configs_async(self.path)
+
+    async def test_reader_error(self) -> None:
+        self.path.joinpath("config_5.yaml").write_text("str_prop: [\n")
+        with self.assertRaises(err.ConfigReaderError):
+            await self.config.load_configs_async(self.path)
+
+    async def test_reload(self) -> None:
+        await self.config.load_default_config_async()
+        write(self.default, "str_prop: changed\nint_prop: 1\n")
+        self.assertEqual(["str_prop"], await self.config.reload_async())
+        self.assertEqual("changed", self.config.str_prop)
+
+    async def test_loop_is_not_blocked(self) -> None:
+        ticks = 0
+
+        async def tick() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        ticker = asyncio.create_task(tick())
+        await self.config.load_default_config_async()
+        await self.config.load_configs_async(self.path)
+        ticker.cancel()
+        self.assertGreater(ticks, 1)
@@ -0,0 +1,93 @@
+from threading import Event, Thread
+from unittest import TestCase
+
+import custom_conf.errors as err
+from custom_conf.properties.bounded_property import IntBoundedProperty
+from custom_conf.properties.coercible_property import IntProperty
+
+from test.utils import TestConfig
+
+
+ITERATIONS = 2_000
+
+
+class ThreadSafeConfig(TestConfig):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(thread_safe=True, **kwargs)
+
+    def _initialize_config_properties(self) -> None:
+        self.a = IntProperty("a")
+        self.b = IntBoundedProperty("b", 0, ITERATIONS)
+        super()._initialize_config_properties()
+
+
+class TestThreadSafeConfig(TestCase):
+    def setUp(self) -> None:
+        self.config = ThreadSafeConfig()
+        self.config.update({"a": 0, "b": 0})
+
+    def test_set(self) -> None:
+        self.assertTrue(self.config.thread_safe)
+        self.config.a = "3"
+        self.assertEqual(3, self.config.a)
+        with self.assertRaises(err.OutOfBoundsPropertyError):
+            self.config.b = -1
+        self.assertEqual(0, self.config.b)
+
+    def test_state_is_snapshot(self) -> None:
+        state = self.config.state
+        self.config.update({"a": 1, "b": 1})
+        self.assertEqual({"a": 0, "b": 0}, dict(state))
+        self.assertEqual({"a": 1, "b": 1}, dict(self.config.state))
+        with self.assertRaises(TypeError):
+            state["a"] = 2
+
+    def test_missing_property(self) -> None:
+        config = ThreadSafeConfig()
+        with self.assertRaises(err.MissingRequiredPropertyError):
+            _ = config.a
+        self.assertFalse(config._validate_no_missing_properties())
+
+    def test_freeze(self) -> None:
+        self.config.freeze()
+        self.assertEqual(0, self.config.a)
+        with self.assertRaises(err.FrozenConfigError):
+            self.config.a = 1
+        self.config.update({"a": 2, "b": 2})
+        self.assertEqual((2, 2), (self.config.a, self.config.state["b"]))
+        self.config.unfreeze()
+        self.config.a = 3
+        self.assertEqual(3, self.config.a)
+
+    def test_readers_see_whole_writes(self) -> None:
+        done = Event()
+        torn = []
+
+        def read() -> None:
+            while not done.is_set():
+                state = self.config.state
+                if state["a"] != state["b"]:
+                    torn.append(dict(state))
+
+        readers = [Thread(target=read) for _ in range(2)]
+        for reader in readers:
+            reader.start()
+        for i in range(ITERATIONS):
+            self.config.update({"a": i, "b": i})
+        done.set()
+        for reader in readers:
+            reader.join()
+        self.assertEqual([], torn)
+
+    def test_concurrent_writers(self) -> None:
+        def write(name: str) -> None:
+            for i in range(ITERATIONS + 1):
+                self.config.update({name: i})
+
+        writers = [Thread(target=write, args=(name,)) for name in "ab"]
+        for writer in writers:
+            writer.start()
+        for writer in writers:
+            writer.join()
+        self.assertEqual({"a": ITERATIONS, "b": ITERATIONS},
+                         dict(self.config.state))
@@ -1,7 +1,14 @@
+import copy
+import pickle
+from pathlib import Path
+from tempfile import TemporaryDirectory
 from unittest import TestCase
 
 import custom_conf.errors as err
+from custom_conf.config import list_configs
+from custom_conf.properties.coercible_property import IntProperty
 from custom_conf.properties.property import Property
+from custom_conf.report import LoadReport
 
 from test.utils import TestConfig
 
@@ -11,3 +18,188 @@ class TestBaseConfig(TestCase):
         c = TestConfig()
         with self.assertRaises(err.AddAfterInitError):
             c.this_fails = Property("this_fails", str)
+
+
+class FreezeConfig(TestConfig):
+    def _initialize_config_properties(self) -> None:
+        self.str_prop = Property("str_prop", str)
+        super()._initialize_config_properties()
+
+
+class TestFrozenConfig(TestCase):
+    def test_freeze(self) -> None:
+        c = FreezeConfig()
+        c.str_prop = "test"
+        c.freeze()
+        self.assertTrue(c.frozen)
+        self.assertIsInstance(c, FreezeConfig)
+        self.assertEqual("test", c.str_prop)
+        self.assertEqual("test", c.__dict__["str_prop"])
+        with self.assertRaises(err.FrozenConfigError):
+            c.str_prop = "other"
+        with self.assertRaises(err.FrozenConfigError):
+            c.new_prop = Property("new_prop", str)
+
+    def test_unfreeze(self) -> None:
+        c = FreezeConfig()
+        c.str_prop = "test"
+        c.freeze()
+        c.unfreeze()
+        self.assertFalse(c.frozen)
+        self.assertIs(type(c), FreezeConfig)
+        c.str_prop = "other"
+        self.assertEqual("other", c.str_prop)
+        with self.assertRaises(err.InvalidPropertyTypeError):
+            c.str_prop = 1
+
+    def test_freeze_missing_property(self) -> None:
+        c = FreezeConfig(frozen=True)
+        self.assertTrue(c.frozen)
+        with self.assertRaises(err.MissingRequiredPropertyError):
+            _ = c.str_prop
+        with self.assertRaises(AttributeError):
+            _ = c.other
+        c.update({"str_prop": "loaded"})
+        self.assertEqual("loaded", c.str_prop)
+        c.unfreeze()
+        c.str_prop = "other"
+        self.assertEqual("other", c.str_prop)
+
+
+class TestPickleConfig(TestCase):
+    def test_pickle_variants(self) -> None:
+        for thread_safe in (False, True):
+            for frozen in (False, True):
+                c = FreezeConfig(thread_safe=thread_safe)
+                c.str_prop = "test"
+                if frozen:
+                    c.freeze()
+                for copy_config in (lambda: pickle.loads(pickle.dumps(c)),
+                                    lambda: copy.deepcopy(c)):
+                    with self.subTest(thread_safe=thread_safe, frozen=frozen):
+                        other = copy_config()
+                        self.assertIs(type(c), type(other))
+                        self.assertEqual((thread_safe, frozen),
+                                         (other.thread_safe, other.frozen))
+                        self.assertEqual("test", other.str_prop)
+                        other.unfreeze()
+                        other.str_prop = "other"
+                        self.assertEqual("test", c.str_prop)
+                        with self.assertRaises(err.InvalidPropertyTypeError):
+                            other.str_prop = 1
+
+
+class TestLoadConfigs(TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name)
+        for i in range(20):
+            self.path.joinpath(f"config_{i}.yaml").write_text(
+                f"str_prop: value_{i}\n", encoding="utf-8")
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def test_last_file_wins(self) -> None:
+        expected = list_configs(self.path)[-1].stem.replace("config", "value")
+        for workers, processes in [(1, False), (4, False), (4, True)]:
+            with self.subTest(workers=workers, processes=processes):
+                c = FreezeConfig()
+                c.load_configs(self.path, workers, processes)
+                self.assertEqual(expected, c.str_prop)
+
+    def test_reader_error(self) -> None:
+        self.path.joinpath("config_5.yaml").write_text("str_prop: [\n")
+        for workers, processes in [(1, False), (4, False), (4, True)]:
+            with (self.subTest(workers=workers, processes=processes),
+                  self.assertRaises(err.ConfigReaderError)):
+                FreezeConfig().load_configs(self.path, workers, processes)
+
+    def test_skip_non_files(self) -> None:
+        self.path.joinpath("sub.yaml").mkdir()
+        self.path.joinpath("dangling.yaml").symlink_to(self.path / "missing")
+        expected = [self.path / "dangling.yaml", self.path / "sub.yaml"]
+        for workers in (1, 4):
+            with self.subTest(workers=workers):
+                c = FreezeConfig()
+                c.exit_on_error = False
+                report = c.load_configs(self.path, workers)
+                self.assertEqual(expected,
+                                 sorted(issue.path for issue in report))
+                self.assertTrue(all(isinstance(issue.error,
+                                               err.ConfigReaderError)
+                                    for issue in report))
+                self.assertTrue(c.str_prop.startswith("value_"))
+
+
+class UpdateConfig(TestConfig):
+    def _initialize_config_properties(self) -> None:
+        self.str_prop = Property("str_prop", str)
+        self.int_prop = IntProperty("int_prop")
+        super()._initialize_config_properties()
+
+
+class TestUpdate(TestCase):
+    def test_update(self) -> None:
+        c = UpdateConfig()
+        c.update({"str_prop": "a", "int_prop": "1"})
+        self.assertEqual(("a", 1), (c.str_prop, c.int_prop))
+
+    def test_no_partial_update(self) -> None:
+        c = UpdateConfig()
+        c.update({"str_prop": "a", "int_prop": 1})
+        with self.assertRaises(err.InvalidPropertiesError) as context:
+            c.update({"str_prop": "b", "int_prop": "x", "unknown": 1})
+        errors = context.exception.errors
+        self.assertIsInstance(errors["int_prop"], err.InvalidCoercionError)
+        self.assertIsInstance(errors["unknown"], err.UnknownPropertyError)
+        self.assertNotIn("str_prop", errors)
+        self.assertEqual(("a", 1), (c.str_prop, c.int_prop))
+
+    def test_update_frozen(self) -> None:
+        c = UpdateConfig()
+        c.update({"str_prop": "a", "int_prop": 1})
+        c.freeze()
+        c.update({"int_prop": 2})
+        self.assertEqual(2, c.int_prop)
+
+
+class TestStreamConfig(TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name) / "config.yaml"
+        self.path.write_text("str_prop: a\nint_prop: x\nunknown: 1\n"
+                             "---\nstr_prop: b\n", encoding="utf-8")
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def test_stream_config(self) -> None:
+        c = UpdateConfig()
+        report = LoadReport()
+        self.assertFalse(c.stream_config(self.path, report=report))
+        self.assertEqual([("int_prop", 2), ("unknown", 3)],
+                         [(issue.key, issue.line) for issue in report])
+        # Valid values are applied, even though others are invalid.
+        self.assertEqual("b", c.str_prop)
+        self.path.write_text("int_prop: 1\n", encoding="utf-8")
+        self.assertTrue(c.stream_config(self.path))
+        self.assertEqual(("b", 1), (c.str_prop, c.int_prop))
+
+    def test_fail_fast(self) -> None:
+        c = UpdateConfig()
+        report = LoadReport()
+        self.assertFalse(c.stream_config(self.path, True, report))
+        self.assertEqual(["int_prop"], [issue.key for issue in report])
+        self.assertEqual("a", c.str_prop)
+
+    def test_reader_error(self) -> None:
+        self.path.write_text("str_prop: a\nint_prop: [\n", encoding="utf-8")
+        c = UpdateConfig()
+        with self.assertRaises(err.ConfigReaderError):
+            c.stream_config(self.path)
+        self.assertEqual("a", c.str_prop)
+        c.exit_on_error = False
+        report = LoadReport()
+        self.assertFalse(c.stream_config(self.path, report=report))
+        self.assertIsInstance(report.issues[0].error, err.ConfigReaderError)
@@ -0,0 +1,94 @@
+from array import array
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import skipIf, TestCase
+
+from custom_conf.diff import (
+    ADDED, CHANGED, Change, ConfigDiff, REMOVED, diff_states, values_equal,
+    )
+from custom_conf.properties.array_property import np
+from custom_conf.properties.coercible_property import IntProperty
+from custom_conf.properties.property import Property
+from custom_conf.sources import Source
+
+from test.test_reload import write
+from test.utils import TestConfig
+
+
+class DiffConfig(TestConfig):
+    directory: Path
+
+    @property
+    def default_config_path(self) -> Path:
+        return self.directory / "default.yaml"
+
+    def _initialize_config_properties(self) -> None:
+        self.a = IntProperty("a")
+        self.b = Property("b", str)
+        self.hosts = Property("hosts", list)
+        super()._initialize_config_properties()
+
+
+class TestDiff(TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = TemporaryDirectory()
+        DiffConfig.directory = Path(self.tmp_dir.name)
+        self.default = DiffConfig.directory / "default.yaml"
+        self.custom = DiffConfig.directory / "custom.yaml"
+        write(self.default, "a: 1\nhosts: [a, b]\n")
+        write(self.custom, "b: custom\n")
+        self.config = DiffConfig(load_default=True)
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def test_no_changes(self) -> None:
+        diff = self.config.diff(DiffConfig(load_default=True))
+        self.assertEqual(ConfigDiff(), diff)
+        self.assertFalse(diff)
+
+    def test_changes_since(self) -> None:
+        state = self.config.capture_state()
+        self.config.load_config(self.custom)
+        self.config.a = 2
+        diff = self.config.changes_since(state)
+        self.assertEqual(["a", "b"], diff.names())
+        self.assertEqual(Change("a", CHANGED, 1, 2,
+                                Source("default", str(self.default)),
+                                Source("set")), diff["a"])
+        self.assertEqual([Change("b", ADDED, new="custom",
+                                 new_source=Source("file",
+                                                   str(self.custom)))],
+                         diff.added)
+        self.assertEqual([], diff.removed)
+        self.assertEqual("~ a: 1 (default ({})) -> 2 (set)".format(
+            self.default), str(diff[0]))
+
+    def test_diff_configs(self) -> None:
+        canary = DiffConfig(load_default=True)
+        canary.update({"hosts": ["a", "c"], "b": "canary"})
+        self.config.load_config(self.custom)
+        diff = canary.diff(self.config)
+        self.assertEqual([("b", CHANGED), ("hosts", CHANGED)],
+                         [(change.name, change.kind) for change in diff])
+        self.assertEqual((["a", "c"], ["a", "b"]),
+                         (diff["hosts"].old, diff["hosts"].new))
+
+    def test_diff_mappings(self) -> None:
+        diff = diff_states({"a": 1, "b": "x"}, {"a": 1.0, "c": 2})
+        self.assertEqual([("a", CHANGED), ("b", REMOVED), ("c", ADDED)],
+                         [(change.name, change.kind) for change in diff])
+        self.assertIsNone(diff["c"].new_source)
+        self.assertIn("c", diff)
+        self.assertNotIn("a.b", diff)
+
+    def test_values_equal(self) -> None:
+        self.assertTrue(values_equal(array("d", [1, 2]), array("d", [1, 2])))
+        self.assertFalse(values_equal(array("d", [1]), array("d", [2])))
+        self.assertFalse(values_equal(1, True))
+
+    @skipIf(np is None, "numpy is not installed")
+    def test_numpy_values(self) -> None:
+        self.assertTrue(values_equal(np.arange(3), np.arange(3)))
+        self.assertFalse(values_equal(np.arange(3), np.arange(1, 4)))
+        self.assertFalse(values_equal(np.arange(3), np.arange(4)))
@@ -0,0 +1,48 @@
+import json
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from custom_conf.instrumentation import Instrumentation
+from custom_conf.properties.coercible_property import IntProperty
+
+from test.utils import TestConfig
+
+
+class InstrumentedConfig(TestConfig):
+    def _initialize_config_properties(self) -> None:
+        self.a = IntProperty("a")
+        super()._initialize_config_properties()
+
+
+class TestInstrumentation(TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name) / "config.yaml"
+        self.path.write_text("a: '1'\n", encoding="utf-8")
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def test_stats(self) -> None:
+        records = []
+        instrumentation = Instrumentation(
+            lambda kind, record: records.append(kind))
+        c = InstrumentedConfig(instrumentation=instrumentation)
+        c.load_configs(Path(self.tmp_dir.name))
+        stats = c.stats()
+        span_names = [span["name"] for span in stats["spans"]]
+        self.assertEqual(["create_config_dir", "initialize_config_properties",
+                          "register_properties", "load_configs"], span_names)
+        self.assertEqual([str(self.path)],
+                         [file["path"] for file in stats["files"]])
+        self.assertEqual(self.path.stat().st_size, stats["files"][0]["bytes"])
+        self.assertEqual(1, stats["properties"]["a"]["count"])
+        self.assertEqual({"span", "file", "property"}, set(records))
+        self.assertEqual(stats, json.loads(instrumentation.to_json()))
+
+    def test_not_instrumented(self) -> None:
+        c = InstrumentedConfig()
+        c.load_configs(Path(self.tmp_dir.name))
+        self.assertIsNone(c.instrumentation)
+        self.assertEqual({}, c.stats())
@@ -0,0 +1,112 @@
+from array import array
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import skipIf, TestCase
+
+import custom_conf.errors as err
+from custom_conf.properties.array_property import (
+    FloatArrayProperty, IntArrayProperty, np,
+    )
+
+from test.test_reload import write
+from test.utils import TestConfig
+
+
+class ArrayConfig(TestConfig):
+    backend: str
+
+    def _initialize_config_properties(self) -> None:
+        self.weights = FloatArrayProperty("weights", 0., 1., self.backend)
+        self.table = IntArrayProperty("table", upper=10, backend=self.backend)
+        super()._initialize_config_properties()
+
+
+class TestArrayBackend(TestCase):
+    backend = "array"
+
+    def setUp(self) -> None:
+        ArrayConfig.backend = self.backend
+        self.config = ArrayConfig()
+
+    def assertStored(self, expected: list, value) -> None:
+        if self.backend == "array":
+            self.assertIsInstance(value, array)
+        else:
+            self.assertIsInstance(value, np.ndarray)
+        self.assertEqual(expected, value.tolist())
+
+    def test_set(self) -> None:
+        self.config.weights = [0., .5, 1]
+        self.assertStored([0., .5, 1.], self.config.weights)
+        self.config.table = (-5, "3", 10.)
+        self.assertStored([-5, 3, 10], self.config.table)
+        self.config.table = []
+        self.assertStored([], self.config.table)
+
+    def test_out_of_bounds(self) -> None:
+        with self.assertRaises(err.OutOfBoundsElementsError) as context:
+            self.config.weights = [.5, 1.5, float("nan"), -1., .5]
+        self.assertEqual([1, 3], context.exception.indices)
+        self.assertIn("1.5 (index 1), -1.0 (index 3)",
+                      str(context.exception))
+        # Leading nans do not hide values out of bounds.
+        with self.assertRaises(err.OutOfBoundsPropertyError):
+            self.config.weights = [float("nan"), -1.]
+
+    def test_invalid_elements(self) -> None:
+        with self.assertRaises(err.InvalidElementsError) as context:
+            self.config.table = [1, 2.5, "x", 2 ** 70, None, 3]
+        self.assertEqual([1, 2, 3, 4], list(context.exception.errors))
+        with self.assertRaises(err.InvalidPropertyTypeError):
+            self.config.table = 3
+        self.assertEqual(err.InvalidPropertyTypeError,
+                         type(self.config.properties["table"].check("123")))
+
+    def test_bounds(self) -> None:
+        prop = self.config.properties["weights"]
+        prop.upper = 2
+        self.assertEqual((0., 2.), (prop.lower, prop.upper))
+        self.config.weights = [1.5]
+        with self.assertRaises(err.InvalidBoundOrderError):
+            prop.lower = 3
+
+    def test_array_input(self) -> None:
+        self.config.weights = array("d", [.5])
+        self.assertStored([.5], self.config.weights)
+        self.config.table = array("b", [1, 2])
+        self.assertStored([1, 2], self.config.table)
+
+    def test_reload(self) -> None:
+        with TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "arrays.yaml"
+            write(path, "weights: [0.5, 1]\ntable: [1, 2]\n")
+            self.config.load_config(path)
+            # Same length, one changed element.
+            write(path, "weights: [0.5, 0]\ntable: [1, 2.0]\n")
+            self.assertEqual(["weights"], self.config.reload())
+            self.assertStored([.5, 0.], self.config.weights)
+            # Different length.
+            write(path, "weights: [0.5, 0]\ntable: [1, 2, 3]\n")
+            self.assertEqual(["table"], self.config.reload())
+            self.assertStored([1, 2, 3], self.config.table)
+
+
+@skipIf(np is None, "numpy is not installed")
+class TestNumpyBackend(TestArrayBackend):
+    backend = "numpy"
+
+    def test_ndarray_input(self) -> None:
+        self.config.weights = np.array([0, 1], np.int8)
+        self.assertStored([0., 1.], self.config.weights)
+        self.config.table = np.array([1., 2.])
+        self.assertStored([1, 2], self.config.table)
+        with self.assertRaises(err.InvalidElementsError):
+            self.config.table = np.array([1.5])
+        with self.assertRaises(err.OutOfBoundsElementsError):
+            self.config.table = np.array([11])
+
+
+class TestUnknownBackend(TestCase):
+    def test_unknown_backend(self) -> None:
+        with self.assertRaises(err.UnknownArrayBackendError):
+            IntArrayProperty("table", backend="unknown")
@@ -3,6 +3,7 @@ from unittest import TestCase
 import custom_conf.errors as err
 from custom_conf.properties.bounded_property import (
     FloatBoundedProperty, IntBoundedProperty)
+from custom_conf.properties.property import Property
 
 from test.utils import TestConfig
 
@@ -56,3 +57,68 @@ class TestIntFloatBoundedProperty(TestCase):
         # Bounds use an open interval.
         c.ibp = 30
         self.assertEqual(30, c.ibp)
+
+
+class TestBounds(TestCase):
+    def test_bounds_are_coerced_once(self) -> None:
+        prop = IntBoundedProperty("prop", "1", 5.)
+        self.assertEqual((1, 5), (prop.lower, prop.upper))
+        self.assertIs(int, type(prop.upper))
+
+    def test_invalid_bounds(self) -> None:
+        with self.assertRaises(err.InvalidLowerBoundsError):
+            IntBoundedProperty("prop", 1.5)
+        with self.assertRaises(err.InvalidUpperBoundsError):
+            FloatBoundedProperty("prop", upper="a")
+        with self.assertRaises(err.InvalidBoundOrderError):
+            FloatBoundedProperty("prop", 2., 1.)
+        prop = FloatBoundedProperty("prop", 1., 2.)
+        with self.assertRaises(err.InvalidBoundOrderError):
+            prop.lower = 3.
+        self.assertEqual(1., prop.lower)
+
+    def test_no_instance_dict(self) -> None:
+        prop = FloatBoundedProperty("prop", 1., 2.)
+        self.assertFalse(hasattr(prop, "__dict__"))
+
+
+class EvenIntBoundedProperty(IntBoundedProperty):
+    def _validation_error(self, value):
+        error = super()._validation_error(value)
+        if error is None and value % 2:
+            error = err.OutOfBoundsPropertyError(prop=self, value=value)
+        return error
+
+
+class ExclusiveIntBoundedProperty(IntBoundedProperty):
+    def _bounds_error(self, value):
+        if value in (self.lower, self.upper):
+            return err.OutOfBoundsPropertyError(prop=self, value=value)
+        return super()._bounds_error(value)
+
+
+class TestFusedParse(TestCase):
+    VALUES = [0, 1, 5, 10, 11, -1, True, 2.0, 2.5, float("nan"),
+              float("inf"), 10 ** 400, "3", "3.5", "x", None, [1]]
+
+    def test_same_results_as_generic_path(self) -> None:
+        for prop in [IntBoundedProperty("int", 0, 10),
+                     FloatBoundedProperty("float", lower=0.),
+                     IntBoundedProperty("unbounded")]:
+            for value in self.VALUES:
+                with self.subTest(prop=prop.name, value=value):
+                    fused = prop.try_parse(value)
+                    generic = Property.try_parse(prop, value)
+                    self.assertEqual(repr(generic[0]), repr(fused[0]))
+                    self.assertIs(type(generic[1]), type(fused[1]))
+
+    def test_overridden_validation_is_used(self) -> None:
+        prop = EvenIntBoundedProperty("even", 0, 10)
+        self.assertIsNone(prop.check(4))
+        self.assertIsInstance(prop.check(3), err.OutOfBoundsPropertyError)
+
+    def test_overridden_bounds_check_is_used(self) -> None:
+        prop = ExclusiveIntBoundedProperty("exclusive", 0, 10)
+        self.assertIsNone(prop.check(5))
+        self.assertIsInstance(prop.check(10), err.OutOfBoundsPropertyError)
+        self.assertIsInstance(prop.check("0"), err.OutOfBoundsPropertyError)
@@ -0,0 +1,65 @@
+from unittest import TestCase
+
+import custom_conf.errors as err
+from custom_conf.properties.choices_property import ChoicesProperty
+
+from test.utils import TestConfig
+
+
+REGIONS = [f"{area}-{i}" for area in ["eu-west", "us-east", "ap-south"]
+           for i in range(1000)]
+
+
+class ChoicesConfig(TestConfig):
+    def _initialize_config_properties(self) -> None:
+        self.region = ChoicesProperty("region", str, REGIONS,
+                                      normalize=str.casefold)
+        self.level = ChoicesProperty("level", int, [1, 2, 3])
+        self.shape = ChoicesProperty("shape", list, [[1, 2], [3]])
+        super()._initialize_config_properties()
+
+
+class TestChoicesProperty(TestCase):
+    def setUp(self) -> None:
+        self.config = ChoicesConfig()
+
+    def test_valid_choice(self) -> None:
+        self.config.level = 2
+        self.assertEqual(2, self.config.level)
+        self.config.region = "us-east-999"
+        self.assertEqual("us-east-999", self.config.region)
+
+    def test_invalid_choice(self) -> None:
+        with self.assertRaises(err.InvalidChoiceError) as context:
+            self.config.level = 4
+        error = context.exception
+        self.assertEqual(("level", 4, [1, 2, 3]),
+                         (error.name, error.value, error.choices))
+        self.assertIn("[1, 2, 3]", str(error))
+        with self.assertRaises(err.InvalidPropertyTypeError):
+            self.config.level = "1"
+
+    def test_normalized_choice(self) -> None:
+        self.config.region = "EU-West-12"
+        # The matching choice is stored, instead of the value.
+        self.assertEqual("eu-west-12", self.config.region)
+
+    def test_unhashable_choices(self) -> None:
+        self.config.shape = [3]
+        self.assertEqual([3], self.config.shape)
+        with self.assertRaises(err.InvalidChoiceError):
+            self.config.shape = [1]
+
+    def test_suggestions(self) -> None:
+        with self.assertRaises(err.InvalidChoiceError) as context:
+            self.config.region = "eu_wset-12"
+        error = context.exception
+        self.assertEqual("eu-west-12", error.suggestions[0])
+        self.assertIn("Did you mean 'eu-west-12'", str(error))
+        # There are too many choices to include them in the message.
+        self.assertNotIn("ap-south-0", str(error))
+        self.assertEqual([], self.config.properties["level"].suggest(4))
+
+    def test_invalid_choices_type(self) -> None:
+        with self.assertRaises(err.InvalidChoicesTypeError):
+            ChoicesProperty("level", int, [1, "2"])
@@ -1,8 +1,13 @@
+from datetime import timedelta
+from decimal import Decimal
+from fractions import Fraction
 from unittest import TestCase
 
 from custom_conf.properties.coercible_property import (
-    IntProperty, FloatProperty,
+    ByteSizeProperty, CoercableProperty, DecimalProperty, IntProperty,
+    FloatProperty, TimedeltaProperty,
     )
+from custom_conf.properties.coercion import register_converter
 
 import custom_conf.errors as err
 
@@ -13,9 +18,26 @@ class CoercibleConfig(TestConfig):
     def _initialize_config_properties(self) -> None:
         self.int_prop = IntProperty("int_prop")
         self.float_prop = FloatProperty("float_prop")
+        self.decimal_prop = DecimalProperty("decimal_prop")
+        self.timedelta_prop = TimedeltaProperty("timedelta_prop")
+        self.size_prop = ByteSizeProperty("size_prop")
+
+
+class StrictIntProperty(IntProperty):
+    def coerce_if_coercible(self, value):
+        # Only accept actual numbers, not strings.
+        if isinstance(value, str):
+            raise err.InvalidPropertyTypeError(prop=self, type=str)
+        return super().coerce_if_coercible(value)
 
 
 class TestIntProperty(TestCase):
+    def test_coerce_if_coercible_override(self) -> None:
+        prop = StrictIntProperty("strict")
+        self.assertEqual((1, None), prop.try_parse(1.0))
+        self.assertIsInstance(prop.check("1"), err.InvalidPropertyTypeError)
+        self.assertIsInstance(prop.check(1.5), err.InvalidCoercionError)
+
     def test_subclass_coercion(self) -> None:
         c = CoercibleConfig()
         c.int_prop = 1
@@ -72,8 +94,11 @@ class TestIntProperty(TestCase):
 
 class TestFloatProperty(TestCase):
     def test_subclass_coercion(self) -> None:
-        # There are no implicit float types like False/True are for int.
-        pass
+        # Subclasses of int use its converter.
+        c = CoercibleConfig()
+        c.float_prop = True
+        self.assertEqual(1., c.float_prop)
+        self.assertIs(float, type(c.float_prop))
 
     def test_int_coercion(self) -> None:
         c = CoercibleConfig()
@@ -112,3 +137,42 @@ class TestFloatProperty(TestCase):
             with (self.subTest(value),
                   self.assertRaises(err.InvalidPropertyTypeError)):
                 c.float_prop = value
+
+
+class TestOtherProperties(TestCase):
+    def test_decimal_property(self) -> None:
+        c = CoercibleConfig()
+        c.decimal_prop = "1.10"
+        self.assertEqual(Decimal("1.10"), c.decimal_prop)
+        c.decimal_prop = 0.1
+        self.assertEqual(Decimal("0.1"), c.decimal_prop)
+        with self.assertRaises(err.InvalidCoercionError):
+            c.decimal_prop = "one"
+
+    def test_timedelta_property(self) -> None:
+        c = CoercibleConfig()
+        c.timedelta_prop = "1h 30m"
+        self.assertEqual(timedelta(minutes=90), c.timedelta_prop)
+        c.timedelta_prop = 1.5
+        self.assertEqual(timedelta(seconds=1.5), c.timedelta_prop)
+        with self.assertRaises(err.InvalidCoercionError):
+            c.timedelta_prop = "soon"
+
+    def test_byte_size_property(self) -> None:
+        c = CoercibleConfig()
+        c.size_prop = "512MiB"
+        self.assertEqual(512 * 1024 ** 2, c.size_prop)
+        c.size_prop = 1024
+        self.assertEqual(1024, c.size_prop)
+        # Other int properties do not parse byte sizes.
+        with self.assertRaises(err.InvalidCoercionError):
+            c.int_prop = "512MiB"
+
+    def test_register_converter(self) -> None:
+        prop = CoercableProperty("fraction_prop", Fraction)
+        with self.assertRaises(err.InvalidPropertyTypeError):
+            prop.parse("1/3")
+        register_converter(Fraction, str, Fraction)
+        self.assertEqual(Fraction(1, 3), prop.parse("1/3"))
+        self.assertEqual(Fraction(1, 3),
+                         CoercableProperty("other", Fraction).parse("1/3"))
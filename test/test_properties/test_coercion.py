@@ -0,0 +1,78 @@
+from datetime import timedelta
+from decimal import Decimal
+from unittest import TestCase
+
+import custom_conf.errors as err
+from custom_conf.properties.coercion import (
+    Coercer, float_to_decimal, str_to_byte_size, str_to_int,
+    str_to_timedelta,
+    )
+
+
+class Base:
+    pass
+
+
+class Child(Base):
+    pass
+
+
+class TestCoercer(TestCase):
+    def test_lookup_uses_mro(self) -> None:
+        coercer = Coercer(str, {Base: repr})
+        self.assertIs(repr, coercer.lookup(Child))
+        self.assertIsNone(coercer.lookup(int))
+        self.assertEqual({Child: repr, int: None}, coercer._cache)
+
+    def test_register_clears_cache(self) -> None:
+        coercer = Coercer(str, {Base: repr})
+        coercer.lookup(Child)
+        coercer.register(Child, str)
+        self.assertIs(str, coercer.lookup(Child))
+        self.assertIs(repr, coercer.lookup(Base))
+
+
+class TestConverters(TestCase):
+    def test_str_to_int(self) -> None:
+        big = "123456789012345678901234567890"
+        self.assertEqual(int(big), str_to_int(big))
+        self.assertEqual(10 ** 30, str_to_int("1e30"))
+        self.assertEqual(-3, str_to_int(" -3.0 "))
+        self.assertEqual(1000, str_to_int("1_000"))
+        for value in ["1.5", "nan", "inf"]:
+            with (self.subTest(value),
+                  self.assertRaises(err.LossOfPrecisionError)):
+                str_to_int(value)
+        for value in ["", "one", "1e999999999"]:
+            with self.subTest(value), self.assertRaises(ValueError):
+                str_to_int(value)
+
+    def test_str_to_timedelta(self) -> None:
+        values = {"90": timedelta(seconds=90),
+                  "1.5h": timedelta(minutes=90),
+                  "1d 2h30m": timedelta(days=1, hours=2, minutes=30),
+                  "250ms": timedelta(milliseconds=250),
+                  "-1w": timedelta(weeks=-1),
+                  "01:30:15.5": timedelta(hours=1, minutes=30, seconds=15.5),
+                  "1:30": timedelta(hours=1, minutes=30)}
+        for value, expected in values.items():
+            with self.subTest(value):
+                self.assertEqual(expected, str_to_timedelta(value))
+        for value in ["", "h", "1x", "1h 2", "1 hour"]:
+            with self.subTest(value), self.assertRaises(ValueError):
+                str_to_timedelta(value)
+
+    def test_str_to_byte_size(self) -> None:
+        values = {"512": 512, "512MiB": 512 * 1024 ** 2, "2 GB": 2 * 10 ** 9,
+                  "1.5KiB": 1536, "1k": 1000}
+        for value, expected in values.items():
+            with self.subTest(value):
+                self.assertEqual(expected, str_to_byte_size(value))
+        with self.assertRaises(err.LossOfPrecisionError):
+            str_to_byte_size("1.5B")
+        for value in ["", "MiB", "1 XB", "-1KB"]:
+            with self.subTest(value), self.assertRaises(ValueError):
+                str_to_byte_size(value)
+
+    def test_decimal_is_exact(self) -> None:
+        self.assertEqual(Decimal("0.1"), float_to_decimal(0.1))
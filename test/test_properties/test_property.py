@@ -1,5 +1,8 @@
+import pickle
 from unittest import TestCase
 
+from custom_conf.properties.bounded_property import IntBoundedProperty
+from custom_conf.properties.coercible_property import IntProperty
 from custom_conf.properties.property import Property
 import custom_conf.errors as err
 
@@ -41,3 +44,89 @@ class TestProperty(TestCase):
             with (self.subTest(i=i),
                   self.assertRaises(err.InvalidPropertyTypeError)):
                 c.int_prop = invalid_value
+
+
+class PortProperty(IntBoundedProperty):
+    def validate(self, value) -> None:
+        super().validate(value)
+        if value >= 65536:
+            raise err.OutOfBoundsPropertyError(prop=self, value=value)
+
+
+class NameProperty(Property):
+    def _validate_type(self, value) -> None:
+        # Accept names as bytes as well.
+        if not isinstance(value, (str, bytes)):
+            raise err.InvalidPropertyTypeError(prop=self, type=type(value))
+
+
+class HookConfig(TestConfig):
+    def _initialize_config_properties(self) -> None:
+        self.port = PortProperty("port", lower=0)
+        self.name = NameProperty("name", str)
+        super()._initialize_config_properties()
+
+
+class TestHooks(TestCase):
+    def test_validate_override(self) -> None:
+        c = HookConfig()
+        c.port = "8080"
+        self.assertEqual(8080, c.port)
+        with self.assertRaises(err.OutOfBoundsPropertyError):
+            c.port = 70000
+        with self.assertRaises(err.OutOfBoundsPropertyError):
+            c.port = -1
+        self.assertIsInstance(c.properties["port"].check("70000"),
+                              err.OutOfBoundsPropertyError)
+        self.assertEqual(8080, c.port)
+
+    def test_validate_type_override(self) -> None:
+        c = HookConfig()
+        c.update({"name": b"bytes"})
+        self.assertEqual(b"bytes", c.name)
+        with self.assertRaises(err.InvalidPropertyTypeError):
+            c.name = 1
+
+
+class TestCheck(TestCase):
+    def test_check(self) -> None:
+        prop = Property("int_prop", int)
+        self.assertIsNone(prop.check(1))
+        error = prop.check("1")
+        self.assertIsInstance(error, err.InvalidPropertyTypeError)
+        self.assertIn("int_prop", str(error))
+
+    def test_try_parse(self) -> None:
+        prop = IntProperty("int_prop")
+        self.assertEqual((1, None), prop.try_parse("1"))
+        value, error = prop.try_parse("1.5")
+        self.assertIsInstance(error, err.InvalidCoercionError)
+        self.assertIsInstance(error.__cause__, err.LossOfPrecisionError)
+
+    def test_lazy_message(self) -> None:
+        error = err.InvalidPropertyTypeError(
+            prop=Property("int_prop", int), type=str)
+        self.assertIsNone(error._message)
+        message = str(error)
+        self.assertIn("int_prop", message)
+        self.assertIs(message, str(error))
+
+    def test_pickle_error(self) -> None:
+        error = err.UnknownPropertyError(name="prop", value=1)
+        copy = pickle.loads(pickle.dumps(error))
+        self.assertEqual(("prop", 1), (copy.name, copy.value))
+        self.assertEqual(str(error), str(copy))
+        self.assertEqual((str(error),), copy.args)
+        self.assertEqual(f"UnknownPropertyError({str(error)!r})", repr(copy))
+
+    def test_pickle_property(self) -> None:
+        for prop in [Property("list_prop", list[int | None]),
+                     Property("dict_prop", dict[str, list[int]]),
+                     IntProperty("int_prop")]:
+            with self.subTest(prop=prop.name):
+                copy = pickle.loads(pickle.dumps(prop))
+                self.assertEqual(prop.schema_key(), copy.schema_key())
+                self.assertEqual(prop.check([1, None]) is None,
+                                 copy.check([1, None]) is None)
+                self.assertEqual(prop.try_parse("1")[0],
+                                 copy.try_parse("1")[0])
@@ -0,0 +1,132 @@
+import pickle
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+import custom_conf.errors as err
+from custom_conf.properties.coercible_property import IntProperty
+from custom_conf.properties.property import Property
+from custom_conf.properties.section_property import Section, SectionProperty
+
+from test.test_reload import write
+from test.utils import TestConfig
+
+
+class PoolSection(Section):
+    def _initialize_config_properties(self) -> None:
+        self.size = IntProperty("size")
+
+
+class DatabaseSection(Section):
+    def _initialize_config_properties(self) -> None:
+        self.host = Property("host", str)
+        self.port = IntProperty("port")
+        self.pool = SectionProperty("pool", PoolSection)
+
+
+class SectionConfig(TestConfig):
+    directory: Path
+
+    @property
+    def default_config_path(self) -> Path:
+        return self.directory / "default.yaml"
+
+    def _initialize_config_properties(self) -> None:
+        self.name = Property("name", str)
+        self.database = SectionProperty("database", DatabaseSection)
+        super()._initialize_config_properties()
+
+
+DEFAULT = """name: app
+database:
+  host: localhost
+  port: "5432"
+  pool:
+    size: 4
+"""
+
+
+class TestSectionProperty(TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = TemporaryDirectory()
+        SectionConfig.directory = Path(self.tmp_dir.name)
+        self.default = SectionConfig.directory / "default.yaml"
+        write(self.default, DEFAULT)
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def load(self, text: str) -> SectionConfig:
+        write(self.default, text)
+        return SectionConfig(load_default=True)
+
+    def test_nested_values(self) -> None:
+        config = SectionConfig(load_default=True)
+        self.assertIsInstance(config.database, DatabaseSection)
+        self.assertEqual(("localhost", 5432, 4),
+                         (config.database.host, config.database.port,
+                          config.database.pool.size))
+        self.assertEqual("database.pool", config.database.pool.path)
+
+    def test_validated_on_first_access(self) -> None:
+        config = self.load(DEFAULT.replace("size: 4", "size: four"))
+        database = config.database
+        self.assertTrue(database._pending)
+        self.assertEqual(5432, database.port)
+        self.assertFalse(database._pending)
+        # The nested section is only validated, once it is used.
+        for _ in range(2):
+            with self.assertRaises(err.InvalidPropertiesError) as context:
+                _ = database.pool.size
+            self.assertEqual(["database.pool.size"],
+                             list(context.exception.errors))
+
+    def test_unknown_property(self) -> None:
+        config = self.load(DEFAULT + "  user: admin\n")
+        with self.assertRaises(err.InvalidPropertiesError) as context:
+            _ = config.database.host
+        self.assertIsInstance(context.exception.errors["database.user"],
+                              err.UnknownPropertyError)
+
+    def test_missing_nested_properties(self) -> None:
+        custom = SectionConfig.directory / "custom.yaml"
+        write(custom, "name: app\ndatabase:\n  host: localhost\n"
+                      "  pool: {}\n")
+        config = SectionConfig()
+        config.exit_on_error = False
+        report = config.load_configs(custom)
+        self.assertEqual(["database.port", "database.pool.size"],
+                         [issue.key for issue in report])
+        self.assertTrue(config.database._pending)
+        config.database.port = 1
+        self.assertEqual(["database.pool.size"],
+                         list(config.database.missing_properties()))
+
+    def test_set_values(self) -> None:
+        config = SectionConfig(load_default=True)
+        config.database.port = "1"
+        self.assertEqual(1, config.database.port)
+        with self.assertRaises(err.InvalidPropertyTypeError):
+            config.database.host = 1
+        with self.assertRaises(err.AddAfterInitError):
+            config.database.user = Property("user", str)
+        config.database = {"host": "db", "port": 2, "pool": {"size": 1}}
+        self.assertEqual("db", config.database.host)
+
+    def test_equality(self) -> None:
+        first = DatabaseSection({"host": "db", "port": 1})
+        second = DatabaseSection({"host": "db", "port": "1"})
+        self.assertNotEqual(first, second)
+        self.assertEqual(1, second.port)
+        self.assertEqual(first, second)
+        self.assertEqual("DatabaseSection({'host': 'db', 'port': 1})",
+                         repr(second))
+
+    def test_pickle(self) -> None:
+        config = SectionConfig(load_default=True)
+        _ = config.database.pool.size
+        copy = pickle.loads(pickle.dumps(config))
+        self.assertEqual(config.database, copy.database)
+        self.assertEqual(4, copy.database.pool.size)
+        copy.database.port = 1
+        self.assertEqual(5432, config.database.port)
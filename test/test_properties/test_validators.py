@@ -0,0 +1,49 @@
+from typing import Any, Dict, List, NamedTuple, Optional, Union
+from unittest import TestCase
+
+from typeguard import check_type, TypeCheckError
+
+from custom_conf.properties.validators import compile_type_validator
+
+
+class Point(NamedTuple):
+    x: int
+    y: int
+
+
+ANNOTATIONS = [
+    Any, int, float, complex, bool, str, bytes, list, dict, set, tuple,
+    type(None), Point, list[int], List[str], list[list[int]], list[Any],
+    dict[str, int], Dict[str, list[int]], dict[str, Any], Optional[int],
+    int | None, Union[int, str], list[int | None], tuple[int, ...],
+    ]
+
+VALUES = [
+    None, True, 0, 1, 1.5, 1j, "", "a", b"a", bytearray(b"a"), [], [1],
+    [1, "a"], ["a", 1], [[1]], [None], {}, {"a": 1}, {"a": "b"}, {1: 1},
+    {"a": [1]}, {1, 2}, frozenset(), (), (1, 2), ("a",), Point(1, 2), int,
+    ]
+
+
+def typeguard_result(value: Any, annotation: Any) -> bool:
+    try:
+        check_type(value, annotation)
+    except TypeCheckError:
+        return False
+    return True
+
+
+class TestCompiledValidators(TestCase):
+    def test_same_results_as_typeguard(self) -> None:
+        for annotation in ANNOTATIONS:
+            validator = compile_type_validator(annotation)
+            for value in VALUES:
+                with self.subTest(annotation=annotation, value=value):
+                    self.assertEqual(typeguard_result(value, annotation),
+                                     validator(value))
+
+    def test_validators_are_shared(self) -> None:
+        self.assertIs(compile_type_validator(list[int]),
+                      compile_type_validator(list[int]))
+        self.assertIsNot(compile_type_validator(list[int]),
+                         compile_type_validator(list[str]))
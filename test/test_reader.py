@@ -0,0 +1,156 @@
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+import custom_conf.errors as err
+from custom_conf import reader
+
+
+class TestReadYaml(TestCase):
+    def setUp(self) -> None:
+        reader.clear_cache()
+        self.tmp_dir = TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name) / "config.yaml"
+        self.path.write_text("a: 1\nb: [1, 2]\n", encoding="utf-8")
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+        reader.set_cache_size(reader.DEFAULT_CACHE_SIZE)
+        reader.clear_cache()
+
+    def test_read_yaml(self) -> None:
+        data, valid = reader.read_yaml(self.path)
+        self.assertTrue(valid)
+        self.assertEqual({"a": 1, "b": [1, 2]}, data)
+
+    def test_invalid_yaml(self) -> None:
+        self.path.write_text("a: [1, 2\n", encoding="utf-8")
+        with self.assertRaises(err.ConfigReaderError):
+            reader.read_yaml(self.path)
+
+    def test_cache_hit(self) -> None:
+        reader.read_yaml(self.path)
+        reader.read_yaml(self.path)
+        info = reader.cache_info()
+        self.assertEqual((1, 1, 1), (info.hits, info.misses, info.currsize))
+
+    def test_cache_returns_copies(self) -> None:
+        data, _ = reader.read_yaml(self.path)
+        data["b"].append(3)
+        data, _ = reader.read_yaml(self.path)
+        self.assertEqual([1, 2], data["b"])
+        data["b"].append(3)
+        data, _ = reader.read_yaml(self.path)
+        self.assertEqual([1, 2], data["b"])
+
+    def test_changed_file_is_read_again(self) -> None:
+        reader.read_yaml(self.path)
+        self.path.write_text("a: 2\n", encoding="utf-8")
+        stat = self.path.stat()
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        data, _ = reader.read_yaml(self.path)
+        self.assertEqual({"a": 2}, data)
+        self.assertEqual(2, reader.cache_info().misses)
+
+    def test_lru_eviction(self) -> None:
+        reader.set_cache_size(1)
+        other_path = self.path.with_name("other.yaml")
+        other_path.write_text("c: 3\n", encoding="utf-8")
+        reader.read_yaml(self.path)
+        reader.read_yaml(other_path)
+        reader.read_yaml(self.path)
+        info = reader.cache_info()
+        self.assertEqual((0, 3, 1), (info.hits, info.misses, info.currsize))
+
+
+class TestLoaders(TestCase):
+    def setUp(self) -> None:
+        reader.set_cache_size(0)
+        self.tmp_dir = TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name) / "config.yaml"
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+        reader.set_cache_size(reader.DEFAULT_CACHE_SIZE)
+        reader.set_default_loader(reader.AUTO_LOADER)
+
+    def test_auto_loader(self) -> None:
+        expected = "c" if "c" in reader.available_loaders() else "python"
+        self.assertIs(reader.get_loader(expected), reader.get_loader())
+
+    def test_unknown_loader(self) -> None:
+        with self.assertRaises(err.UnknownLoaderError):
+            reader.get_loader("unknown")
+        with self.assertRaises(err.UnknownLoaderError):
+            reader.set_default_loader("unknown")
+
+    def test_loaders_read_the_same_data(self) -> None:
+        self.path.write_text(
+            "a: 1\nb: [1.5, null, true]\nc: {d: e}\nf: 2023-09-05\n",
+            encoding="utf-8")
+        results = [reader.read_yaml(self.path, loader)
+                   for loader in reader.available_loaders()]
+        for result in results:
+            self.assertEqual(results[0], result)
+
+    def test_loaders_raise_the_same_error(self) -> None:
+        for content in ["a: [1, 2\n", "a: b: c\n", "\tx: 1\n", "a: *b\n"]:
+            self.path.write_text(content, encoding="utf-8")
+            for loader in reader.available_loaders():
+                with (self.subTest(content=content, loader=loader),
+                      self.assertRaises(err.ConfigReaderError)):
+                    reader.read_yaml(self.path, loader)
+
+    def test_set_default_loader(self) -> None:
+        reader.set_default_loader("python")
+        self.assertIs(reader.get_loader("python"), reader.get_loader())
+
+
+class TestStreamYaml(TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name) / "config.yaml"
+        self.path.write_text(
+            "base: &base {x: 1, y: 2}\n"
+            "a: 1\n"
+            "m:\n"
+            "  <<: *base\n"
+            "  y: 3\n"
+            "<<: {a: 5, c: 7}\n"
+            "---\n"
+            "a: 2\n"
+            "---\n", encoding="utf-8")
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+        reader.clear_cache()
+
+    def test_stream_yaml(self) -> None:
+        expected = [(0, "base", {"x": 1, "y": 2}, 1), (0, "a", 1, 2),
+                    (0, "m", {"x": 1, "y": 3}, 3), (0, "c", 7, 6),
+                    (1, "a", 2, 8)]
+        for loader in reader.available_loaders():
+            with self.subTest(loader=loader):
+                self.assertEqual(
+                    expected, list(reader.stream_yaml(self.path, loader)))
+
+    def test_read_yaml_merges_documents(self) -> None:
+        data, _ = reader.read_yaml(self.path)
+        self.assertEqual({"base": {"x": 1, "y": 2}, "a": 2,
+                          "m": {"x": 1, "y": 3}, "c": 7}, data)
+
+    def test_error_is_raised_when_reached(self) -> None:
+        self.path.write_text("a: 1\nb: [1, 2\n", encoding="utf-8")
+        items = reader.stream_yaml(self.path)
+        self.assertEqual("a", next(items).key)
+        with self.assertRaises(err.ConfigReaderError) as context:
+            next(items)
+        self.assertEqual(3, context.exception.line)
+
+    def test_document_is_not_a_mapping(self) -> None:
+        self.path.write_text("a: 1\n---\n[1, 2]\n", encoding="utf-8")
+        with self.assertRaises(err.ConfigReaderError):
+            list(reader.stream_yaml(self.path))
+        with self.assertRaises(err.ConfigReaderError):
+            reader.read_yaml(self.path)
@@ -0,0 +1,49 @@
+from unittest import TestCase
+
+from custom_conf.properties.property import Property
+from custom_conf.registry import PropertyRegistry
+
+from test.utils import TestConfig
+
+
+class RegistryConfig(TestConfig):
+    def _initialize_config_properties(self) -> None:
+        self.b = Property("b", str)
+        self.a = Property("a", int)
+        super()._initialize_config_properties()
+
+
+class TestPropertyRegistry(TestCase):
+    def test_declaration_order(self) -> None:
+        c = RegistryConfig()
+        self.assertEqual(["b", "a"], c.properties.names())
+        self.assertEqual(["b", "a"], list(c.properties))
+        self.assertEqual("a", c.properties[1])
+        self.assertEqual(["a"], c.properties[1:])
+
+    def test_lookup(self) -> None:
+        c = RegistryConfig()
+        prop = object.__getattribute__(c, "a")
+        self.assertIs(prop, c.properties["a"])
+        self.assertIs(prop, c.properties.get("a"))
+        self.assertIsNone(c.properties.get("c"))
+        self.assertIn("a", c.properties)
+        self.assertNotIn("c", c.properties)
+        self.assertNotIn(["a"], c.properties)
+        with self.assertRaises(KeyError):
+            _ = c.properties["c"]
+
+    def test_list_compatibility(self) -> None:
+        c = RegistryConfig()
+        self.assertEqual(["b", "a"], c.properties)
+        self.assertEqual(2, len(c.properties))
+        self.assertEqual(["b", "a", "c"], c.properties + ["c"])
+        self.assertEqual(["c", "b", "a"], ["c"] + c.properties)
+        self.assertEqual(0, c.properties.index("b"))
+
+    def test_add(self) -> None:
+        registry = PropertyRegistry()
+        registry.add(Property("x", int))
+        self.assertEqual(["x"], registry.names())
+        registry.add(Property("y", int))
+        self.assertEqual(["x", "y"], registry.names())
@@ -0,0 +1,137 @@
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from threading import Event
+from unittest import TestCase
+from unittest.mock import patch
+
+import custom_conf.errors as err
+from custom_conf.properties.coercible_property import IntProperty
+from custom_conf.properties.property import Property
+from custom_conf.report import LoadReport
+
+from test.utils import TestConfig
+
+
+class ReloadConfig(TestConfig):
+    def _initialize_config_properties(self) -> None:
+        self.a = IntProperty("a")
+        self.b = Property("b", str)
+        super()._initialize_config_properties()
+
+
+def write(path: Path, content: str) -> None:
+    """ Write the file and make sure its modification time changes. """
+    mtime = path.stat().st_mtime_ns if path.exists() else 0
+    path.write_text(content, encoding="utf-8")
+    os.utime(path, ns=(mtime + 1_000_000, mtime + 1_000_000))
+
+
+class TestReload(TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = TemporaryDirectory()
+        self.first = Path(self.tmp_dir.name) / "first.yaml"
+        self.second = Path(self.tmp_dir.name) / "second.yaml"
+        write(self.first, "a: 1\nb: first\n")
+        write(self.second, "b: second\n")
+        self.config = ReloadConfig()
+        self.config.load_config(self.first)
+        self.config.load_config(self.second)
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def test_unchanged(self) -> None:
+        self.assertEqual([], self.config.reload())
+
+    def test_reload_changed_file(self) -> None:
+        changes = []
+        self.config.add_reload_listener(
+            lambda config, changed: changes.append(changed))
+        write(self.first, "a: '2'\nb: first\n")
+        self.assertEqual(["a"], self.config.reload())
+        self.assertEqual(2, self.config.a)
+        self.assertEqual([["a"]], changes)
+
+    def test_later_file_wins(self) -> None:
+        write(self.first, "a: 1\nb: changed\n")
+        self.assertEqual([], self.config.reload())
+        self.assertEqual("second", self.config.b)
+        write(self.second, "a: 3\n")
+        self.assertEqual(["a", "b"], sorted(self.config.reload()))
+        self.assertEqual((3, "changed"), (self.config.a, self.config.b))
+
+    def test_invalid_change(self) -> None:
+        write(self.first, "a: x\nb: first\n")
+        write(self.second, "b: changed\n")
+        with self.assertRaises(err.InvalidPropertiesError) as context:
+            self.config.reload()
+        self.assertEqual(["a"], list(context.exception.errors))
+        # Nothing is applied.
+        self.assertEqual((1, "second"), (self.config.a, self.config.b))
+        write(self.first, "a: 5\nb: first\n")
+        self.assertEqual(["a", "b"], sorted(self.config.reload()))
+        self.assertEqual((5, "changed"), (self.config.a, self.config.b))
+
+    def test_unreadable_file(self) -> None:
+        write(self.first, "a: 2\nb: first\n")
+        # E.g. the file is removed between checking and reading it.
+        with (patch("custom_conf.config.read_yaml",
+                    side_effect=PermissionError("denied")),
+              self.assertLogs("custom_conf.config", "WARNING")):
+            self.assertEqual([], self.config.reload())
+        self.assertEqual(["a"], self.config.reload())
+        self.assertEqual(2, self.config.a)
+
+    def test_syntax_error(self) -> None:
+        write(self.first, "a: [\n")
+        write(self.second, "b: changed\n")
+        report = LoadReport()
+        with self.assertLogs("custom_conf.config", "ERROR"):
+            self.assertEqual(["b"], self.config.reload(report))
+        [issue] = report
+        self.assertEqual((self.first, 2), (issue.path, issue.line))
+        self.assertIsInstance(issue.error, err.ConfigReaderError)
+        # The broken file keeps its values and is not read again.
+        self.assertEqual((1, "changed"), (self.config.a, self.config.b))
+        self.assertEqual([], self.config.reload())
+        write(self.first, "a: 3\nb: first\n")
+        self.assertEqual(["a"], self.config.reload())
+        self.assertEqual(3, self.config.a)
+
+    def test_reload_frozen(self) -> None:
+        self.config.freeze()
+        write(self.first, "a: 4\n")
+        self.assertEqual(["a"], self.config.reload())
+        self.assertEqual(4, self.config.a)
+        self.config.unfreeze()
+        self.assertEqual(4, self.config.a)
+
+    def test_watch(self) -> None:
+        reloaded = Event()
+        self.config.add_reload_listener(lambda *_: reloaded.set())
+        watcher = self.config.watch(interval=0.01)
+        try:
+            write(self.first, "a: 7\n")
+            self.assertTrue(reloaded.wait(5))
+        finally:
+            watcher.stop()
+        self.assertEqual(7, self.config.a)
+
+    def test_watch_survives_errors(self) -> None:
+        reloaded = Event()
+        errors = [OSError("gone")]
+
+        def reload(*_) -> list[str]:
+            if errors:
+                raise errors.pop()
+            reloaded.set()
+            return []
+
+        with (patch.object(self.config, "reload", reload),
+              self.assertLogs("custom_conf.watcher", "ERROR")):
+            watcher = self.config.watch(interval=0.01)
+            try:
+                self.assertTrue(reloaded.wait(5))
+            finally:
+                watcher.stop()
@@ -0,0 +1,146 @@
+import threading
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import patch
+
+import custom_conf.errors as err
+from custom_conf.properties.bounded_property import IntBoundedProperty
+from custom_conf.properties.property import Property
+from custom_conf.reader import key_lines
+from custom_conf.report import LoadReport
+
+from test.test_reload import write
+from test.utils import TestConfig
+
+
+class ReportConfig(TestConfig):
+    exit_on_error = False
+    directory: Path
+
+    @property
+    def config_dir(self) -> Path:
+        return self.directory
+
+    @property
+    def default_config_path(self) -> Path:
+        return self.directory / "default.yaml"
+
+    def _initialize_config_properties(self) -> None:
+        self.a = IntBoundedProperty("a", 0, 10)
+        self.b = Property("b", str)
+        super()._initialize_config_properties()
+
+
+class ReportTestCase(TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name)
+        ReportConfig.directory = self.path
+        self.default = self.path / "default.yaml"
+        self.default.write_text("a: 1\nb: default\n")
+        self.bad_values = self.path / "config_1.yaml"
+        self.bad_values.write_text("b: first\n\na: 11\nc: 3\n")
+        self.broken = self.path / "config_2.yaml"
+        self.broken.write_text("b: second\na: [\n")
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+
+class TestLoadReport(ReportTestCase):
+    def test_init_report(self) -> None:
+        config = ReportConfig(load_default=True, load_all=True)
+        self.assertFalse(config.load_report.ok)
+        self.assertEqual(3, len(config.load_report))
+        self.assertEqual({self.bad_values, self.broken},
+                         set(config.load_report.by_file()))
+        # The invalid files are not applied at all.
+        self.assertEqual((1, "default"), (config.a, config.b))
+
+    def test_issues(self) -> None:
+        config = ReportConfig(load_default=True)
+        self.assertTrue(config.load_report.ok)
+        report = config.load_configs(self.path)
+        issues = report.by_file()
+        self.assertEqual(
+            [("a", 3, err.OutOfBoundsPropertyError),
+             ("c", 4, err.UnknownPropertyError)],
+            [(issue.key, issue.line, type(issue.error))
+             for issue in issues[self.bad_values]])
+        [broken] = issues[self.broken]
+        self.assertIsInstance(broken.error, err.ConfigReaderError)
+        self.assertEqual((None, 3), (broken.key, broken.line))
+        self.assertIn(f"{self.bad_values}:3 [a]: ", str(report))
+
+    def test_missing_properties(self) -> None:
+        self.default.write_text("a: 1\n")
+        self.bad_values.write_text("a: 2\n")
+        self.broken.unlink()
+        config = ReportConfig()
+        report = LoadReport()
+        config.load_default_config(report)
+        config.load_configs(self.path, report=report)
+        [issue] = report
+        self.assertEqual((None, "b"), (issue.path, issue.key))
+        self.assertIsInstance(issue.error, err.MissingRequiredPropertyError)
+
+    def test_fixed_file_is_reloaded(self) -> None:
+        self.bad_values.unlink()
+        config = ReportConfig(load_default=True, load_all=True)
+        self.broken.write_text("b: second\na: 2\n")
+        self.assertEqual(["a", "b"], sorted(config.reload()))
+        self.assertEqual((2, "second"), (config.a, config.b))
+
+    def test_fixed_values_are_reloaded(self) -> None:
+        self.broken.unlink()
+        self.bad_values.write_text("a: 2\nb: [bad]\n")
+        config = ReportConfig(load_default=True, load_all=True)
+        self.assertEqual((1, "default"), (config.a, config.b))
+        # Only b changes, but a was never applied either.
+        write(self.bad_values, "a: 2\nb: fixed\n")
+        self.assertEqual(["a", "b"], sorted(config.reload()))
+        self.assertEqual((2, "fixed"), (config.a, config.b))
+
+    def test_exit_on_error(self) -> None:
+        config = ReportConfig(load_default=True)
+        config.exit_on_error = True
+        with self.assertRaises(err.ConfigReaderError):
+            config.load_configs(self.path)
+        self.broken.unlink()
+        with self.assertRaises(SystemExit):
+            config.load_configs(self.path)
+
+
+class TestAsyncLoadReport(ReportTestCase, IsolatedAsyncioTestCase):
+    async def test_load_configs(self) -> None:
+        config = ReportConfig()
+        await config.load_default_config_async()
+        report = await config.load_configs_async(self.path)
+        self.assertEqual(3, len(report))
+        self.assertEqual((1, "default"), (config.a, config.b))
+
+    async def test_locate_keys_in_thread(self) -> None:
+        threads = []
+
+        def locate(path: Path) -> dict[str, int]:
+            threads.append(threading.current_thread())
+            return key_lines(path)
+
+        config = ReportConfig()
+        with patch("custom_conf.config.key_lines", locate):
+            report = await config.load_configs_async(self.path)
+        self.assertEqual([("a", 3), ("c", 4)],
+                         [(issue.key, issue.line)
+                          for issue in report.by_file()[self.bad_values]])
+        self.assertEqual(1, len(threads))
+        self.assertIsNot(threading.main_thread(), threads[0])
+
+    async def test_raise_with_report(self) -> None:
+        config = ReportConfig()
+        config.exit_on_error = True
+        self.broken.unlink()
+        with self.assertRaises(err.InvalidConfigError) as context:
+            await config.load_configs_async(self.path)
+        # Both properties are also missing, as the default was not loaded.
+        self.assertEqual(4, len(context.exception.report))
@@ -0,0 +1,74 @@
+from unittest import TestCase
+
+import custom_conf.errors as err
+from custom_conf import schema as schemas
+from custom_conf.properties.bounded_property import IntBoundedProperty
+from custom_conf.properties.property import Property
+
+from test.utils import TestConfig
+
+
+class SchemaConfig(TestConfig):
+    compile_schema = True
+    initialized_properties = 0
+
+    def _initialize_config_properties(self) -> None:
+        type(self).initialized_properties += 1
+        self.name = Property("name", str)
+        self.port = IntBoundedProperty("port", 1, 65535)
+        super()._initialize_config_properties()
+
+
+class StatefulConfig(SchemaConfig):
+    def _initialize_config_properties(self) -> None:
+        # Lists can not be shared by the instances.
+        self.hosts = []
+        super()._initialize_config_properties()
+
+
+class TestCompiledSchema(TestCase):
+    def setUp(self) -> None:
+        schemas.clear_schemas()
+        SchemaConfig.initialized_properties = 0
+
+    def test_shared_properties(self) -> None:
+        first, second = SchemaConfig(), SchemaConfig()
+        self.assertEqual(1, SchemaConfig.initialized_properties)
+        self.assertIs(first.properties, second.properties)
+        self.assertIs(first.properties["port"], second.properties["port"])
+        self.assertIs(SchemaConfig, first.properties["port"].cls)
+        self.assertIsNotNone(schemas.get_schema(SchemaConfig))
+
+    def test_separate_values(self) -> None:
+        first, second = SchemaConfig(), SchemaConfig()
+        first.port = 80
+        second.update({"name": "second", "port": "8080"})
+        self.assertEqual(80, first.port)
+        self.assertEqual((8080, "second"), (second.port, second.name))
+        with self.assertRaises(err.MissingRequiredPropertyError):
+            _ = first.name
+        with self.assertRaises(err.AddAfterInitError):
+            second.user = Property("user", str)
+        self.assertEqual(["name", "port"], list(second.properties))
+
+    def test_variants(self) -> None:
+        SchemaConfig()
+        config = SchemaConfig(thread_safe=True)
+        config.port = 1
+        frozen = SchemaConfig()
+        frozen.update({"name": "frozen", "port": 2})
+        frozen.freeze()
+        frozen.unfreeze()
+        self.assertEqual((1, 2), (config.port, frozen.port))
+        self.assertIs(SchemaConfig().properties, frozen.properties)
+
+    def test_not_compiled(self) -> None:
+        StatefulConfig().hosts.append("localhost")
+        self.assertEqual([], StatefulConfig().hosts)
+        self.assertIsNone(schemas.get_schema(StatefulConfig))
+
+    def test_clear_schemas(self) -> None:
+        SchemaConfig()
+        schemas.clear_schemas()
+        SchemaConfig()
+        self.assertEqual(2, SchemaConfig.initialized_properties)
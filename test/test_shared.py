@@ -0,0 +1,98 @@
+import multiprocessing
+from unittest import TestCase
+from unittest.mock import patch
+
+import custom_conf.errors as err
+from custom_conf.properties.coercible_property import IntProperty
+from custom_conf.properties.property import Property
+from custom_conf import shared
+
+from test.utils import TestConfig
+
+
+class SharedConfig(TestConfig):
+    def _initialize_config_properties(self) -> None:
+        self.a = IntProperty("a")
+        self.b = Property("b", list[str])
+        super()._initialize_config_properties()
+
+
+def _read_in_child(name: str, queue: multiprocessing.Queue) -> None:
+    config = SharedConfig()
+    config.attach_shared(name)
+    queue.put((config.a, config.b, config.frozen))
+    config.close_shared()
+
+
+class TestSharedConfig(TestCase):
+    def setUp(self) -> None:
+        self.parent = SharedConfig()
+        self.parent.update({"a": 1, "b": ["x", "y"]})
+        self.name = self.parent.publish_shared()
+        self.child = SharedConfig()
+
+    def tearDown(self) -> None:
+        self.child.close_shared()
+        self.parent.close_shared()
+
+    def test_attach(self) -> None:
+        self.child.attach_shared(self.name)
+        self.assertTrue(self.child.frozen)
+        self.assertEqual((1, ["x", "y"]), (self.child.a, self.child.b))
+        with self.assertRaises(err.FrozenConfigError):
+            self.child.a = 2
+
+    def test_refresh_after_republish(self) -> None:
+        self.child.attach_shared(self.name)
+        self.assertFalse(self.child.refresh_shared())
+        self.parent.a = 5
+        self.assertEqual(self.name, self.parent.publish_shared())
+        self.assertTrue(self.child.refresh_shared())
+        self.assertEqual(5, self.child.a)
+        self.assertFalse(self.child.refresh_shared())
+
+    def test_publisher_died_while_writing(self) -> None:
+        self.child.attach_shared(self.name)
+        block = self.parent._shared
+        # Mark the payload as being written, without finishing it.
+        shared.HEADER.pack_into(block._shm.buf, 0, block.generation + 1, 0)
+        with (patch.object(shared, "READ_ATTEMPTS", 3),
+              self.assertRaises(err.SharedConfigError)):
+            self.child.refresh_shared()
+        self.assertEqual(1, self.child.a)
+
+    def test_attach_in_other_process(self) -> None:
+        context = multiprocessing.get_context("spawn")
+        queue = context.Queue()
+        process = context.Process(target=_read_in_child,
+                                  args=(self.name, queue))
+        process.start()
+        result = queue.get(timeout=30)
+        process.join(timeout=30)
+        self.assertEqual((1, ["x", "y"], True), result)
+
+    def test_publish_holds_write_lock(self) -> None:
+        block = self.parent._shared
+        owned = []
+
+        def write(values: dict) -> int:
+            owned.append(self.parent._write_lock._is_owned())
+            return shared.SharedConfigBlock.write(block, values)
+
+        with patch.object(block, "write", write):
+            self.parent.publish_shared()
+        self.assertEqual([True], owned)
+
+    def test_attach_missing_block(self) -> None:
+        with self.assertRaises(err.SharedConfigError):
+            self.child.attach_shared(self.name + "_missing")
+
+    def test_values_exceed_capacity(self) -> None:
+        self.parent.b = [f"{i:1024}" for i in range(128)]
+        with self.assertRaises(err.SharedConfigError):
+            self.parent.publish_shared()
+
+    def test_only_owner_republishes(self) -> None:
+        self.child.attach_shared(self.name)
+        with self.assertRaises(err.SharedConfigError):
+            self.child.publish_shared()
@@ -0,0 +1,99 @@
+import os
+from datetime import date
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+import custom_conf.errors as err
+from custom_conf import snapshot
+from custom_conf.instrumentation import Instrumentation
+from custom_conf.properties.bounded_property import IntBoundedProperty
+from custom_conf.properties.property import Property
+
+from test.utils import TestConfig
+
+
+class SnapshotConfig(TestConfig):
+    directory: Path
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(load_default=True, load_all=True, snapshot=True,
+                         instrumentation=Instrumentation(), **kwargs)
+
+    @property
+    def config_dir(self) -> Path:
+        return self.directory
+
+    @property
+    def default_config_path(self) -> Path:
+        return self.config_dir / "default.yaml"
+
+    def _initialize_config_properties(self) -> None:
+        self.a = IntBoundedProperty("a", 0, 10)
+        self.b = Property("b", date)
+        super()._initialize_config_properties()
+
+    def span_names(self) -> list[str]:
+        return [span["name"] for span in self.stats()["spans"]]
+
+
+class TestSnapshot(TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = TemporaryDirectory()
+        SnapshotConfig.directory = Path(self.tmp_dir.name)
+        self.default = SnapshotConfig.directory / "default.yaml"
+        self.default.write_text("a: 1\nb: 2023-09-05\n", encoding="utf-8")
+        self.custom = SnapshotConfig.directory / "custom.yaml"
+        self.custom.write_text("a: '2'\n", encoding="utf-8")
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def test_snapshot_is_used(self) -> None:
+        first = SnapshotConfig()
+        self.assertIn("load_configs", first.span_names())
+        self.assertTrue(first.snapshot_path.exists())
+        second = SnapshotConfig()
+        self.assertNotIn("load_configs", second.span_names())
+        self.assertEqual((2, date(2023, 9, 5)), (second.a, second.b))
+        # The sources of the values are restored as well.
+        self.assertEqual(first.value_sources(), second.value_sources())
+        self.assertEqual("file", second.source_of("a").kind)
+        # The loaded files are still known, e.g. for reloading.
+        self.custom.write_text("a: 3\n", encoding="utf-8")
+        stat = self.custom.stat()
+        os.utime(self.custom, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        self.assertEqual(["a"], second.reload())
+
+    def test_invalid_config_is_not_saved(self) -> None:
+        self.custom.write_text("a: 11\n", encoding="utf-8")
+        SnapshotConfig.exit_on_error = False
+        try:
+            first = SnapshotConfig()
+            self.assertFalse(first.load_report.ok)
+            self.assertFalse(first.snapshot_path.exists())
+            # The issues are reported again, instead of loading a snapshot.
+            self.assertFalse(SnapshotConfig().load_report.ok)
+        finally:
+            del SnapshotConfig.exit_on_error
+
+    def test_changed_file_invalidates_snapshot(self) -> None:
+        SnapshotConfig()
+        self.custom.write_text("a: 4\n", encoding="utf-8")
+        c = SnapshotConfig()
+        self.assertIn("load_configs", c.span_names())
+        self.assertEqual(4, c.a)
+        self.assertNotIn("load_configs", SnapshotConfig().span_names())
+
+    def test_changed_schema_invalidates_snapshot(self) -> None:
+        c = SnapshotConfig()
+        digest = snapshot.source_digest(c, [self.default])
+        object.__getattribute__(c, "a").upper = 20
+        self.assertNotEqual(digest, snapshot.source_digest(c, [self.default]))
+
+    def test_unsafe_payload(self) -> None:
+        with self.assertRaises(err.InvalidSnapshotError):
+            snapshot.dumps({"a": TestCase})
+        path = SnapshotConfig.directory / "snapshot"
+        self.assertFalse(snapshot.write_snapshot(path, b"", TestCase))
+        self.assertFalse(path.exists())
@@ -0,0 +1,115 @@
+import os
+from argparse import Namespace
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+import custom_conf.errors as err
+from custom_conf.properties.coercible_property import IntProperty
+from custom_conf.properties.property import Property
+from custom_conf.sources import Source
+
+from test.test_reload import write
+from test.utils import TestConfig
+
+
+class SourcesConfig(TestConfig):
+    directory: Path
+
+    @property
+    def default_config_path(self) -> Path:
+        return self.directory / "default.yaml"
+
+    def _initialize_config_properties(self) -> None:
+        self.a = IntProperty("a")
+        self.b = Property("b", str)
+        self.log_level = Property("log_level", str)
+        super()._initialize_config_properties()
+
+
+class PrefixConfig(SourcesConfig):
+    env_prefix = "OTHER"
+
+
+class TestSources(TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = TemporaryDirectory()
+        SourcesConfig.directory = Path(self.tmp_dir.name)
+        self.default = SourcesConfig.directory / "default.yaml"
+        self.custom = SourcesConfig.directory / "custom.yaml"
+        write(self.default, "a: 1\nb: default\nlog_level: info\n")
+        write(self.custom, "b: custom\n")
+        self.config = SourcesConfig(load_default=True)
+        self.config.load_config(self.custom)
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def test_env_index(self) -> None:
+        self.assertEqual({"CUSTOM_CONF__A": "a", "CUSTOM_CONF__B": "b",
+                          "CUSTOM_CONF__LOG_LEVEL": "log_level"},
+                         dict(self.config.env_index))
+
+    def test_file_sources(self) -> None:
+        self.assertEqual(Source("default", str(self.default)),
+                         self.config.source_of("a"))
+        self.assertEqual(Source("file", str(self.custom)),
+                         self.config.source_of("b"))
+        self.config.a = 2
+        self.assertEqual(Source("set"), self.config.source_of("a"))
+        self.assertIsNone(SourcesConfig().source_of("a"))
+
+    def test_env_overrides_files(self) -> None:
+        self.config.load_env({"CUSTOM_CONF__A": "3", "CUSTOM_CONF__B": "env",
+                              "CUSTOM_CONF__UNKNOWN": "1", "OTHER": "1"})
+        self.assertEqual((3, "env"), (self.config.a, self.config.b))
+        self.assertEqual(Source("env", "CUSTOM_CONF__A"),
+                         self.config.source_of("a"))
+        # Files loaded or reloaded later keep the value of the environment.
+        write(self.custom, "a: 4\nb: changed\n")
+        self.assertEqual([], self.config.reload())
+        self.config.load_config(self.custom)
+        self.assertEqual((3, "env"), (self.config.a, self.config.b))
+
+    def test_reload_source(self) -> None:
+        write(self.custom, "a: 4\nb: custom\n")
+        self.assertEqual(["a"], self.config.reload())
+        self.assertEqual(Source("file", str(self.custom)),
+                         self.config.source_of("a"))
+
+    def test_invalid_env(self) -> None:
+        self.config.exit_on_error = False
+        report = self.config.load_env({"CUSTOM_CONF__A": "one",
+                                       "CUSTOM_CONF__B": "env"})
+        [issue] = report
+        self.assertEqual("CUSTOM_CONF__A", issue.key)
+        self.assertIsInstance(issue.error, err.InvalidCoercionError)
+        # None of the values is applied.
+        self.assertEqual((1, "custom"), (self.config.a, self.config.b))
+
+    def test_cli_overrides_env(self) -> None:
+        self.config.load_args(Namespace(config=None, a=5, b=None, c=1))
+        self.config.load_env({"CUSTOM_CONF__A": "3",
+                              "CUSTOM_CONF__LOG_LEVEL": "debug"})
+        self.assertEqual((5, "custom", "debug"),
+                         (self.config.a, self.config.b, self.config.log_level))
+        self.assertEqual({"a": Source("cli", "a"),
+                          "b": Source("file", str(self.custom)),
+                          "log_level": Source("env",
+                                              "CUSTOM_CONF__LOG_LEVEL")},
+                         self.config.value_sources())
+
+    def test_private_args_are_ignored(self) -> None:
+        # E.g. set by subparsers or custom actions.
+        args = Namespace(config=None, a=5, _command="run", __action=True)
+        with self.assertNoLogs("custom_conf.config", "ERROR"):
+            self.config.load_args(args)
+        self.assertEqual(5, self.config.a)
+
+    def test_load_env_in_init(self) -> None:
+        with patch.dict(os.environ, {"CUSTOM_CONF__A": "6", "OTHER__A": "7"}):
+            self.assertEqual(6, SourcesConfig(load_default=True,
+                                              load_env=True).a)
+            self.assertEqual(7, PrefixConfig(load_default=True,
+                                             load_env=True).a)